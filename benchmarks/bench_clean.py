@@ -0,0 +1,101 @@
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from notice_crawler.html_clean import html_to_text, etree
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus', 'bodies')
+
+# ===== 비교용: 예전 BeautifulSoup 기반 구현 =====
+def legacy_clean_html_keep_table(raw_html):
+    soup = BeautifulSoup(raw_html, 'html.parser')
+    output_text = ''
+    tables = soup.find_all('table')
+    for table in tables:
+        table_text = legacy_extract_table_text(table)
+        if table_text.strip():
+            output_text += table_text + '\n'
+        table.decompose()
+    for elem in soup.find_all(['p', 'div']):
+        text = elem.get_text(strip=True)
+        if text:
+            output_text += text + '\n'
+    return output_text.strip()
+
+def legacy_extract_table_text(table):
+    rows = table.find_all('tr')
+    table_text = ''
+    for row in rows:
+        cols = row.find_all(['td', 'th'])
+        valid_cols = [col.get_text(strip=True) for col in cols if col.get_text(strip=True)]
+        if valid_cols:
+            row_text = ' | '.join(valid_cols)
+            table_text += row_text + '\n'
+    return table_text
+
+# ===== 측정 =====
+def load_corpus(corpus_dir):
+    docs = []
+    for path in sorted(glob.glob(os.path.join(corpus_dir, '*.html'))):
+        with open(path, encoding='utf-8') as f:
+            docs.append(f.read())
+    return docs
+
+def bench(name, fn, docs, repeat):
+    fn(docs[0])  # 워밍업
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for doc in docs:
+            fn(doc)
+    elapsed = time.perf_counter() - start
+
+    # 메모리는 따로 한 바퀴 돌려서 측정 (tracemalloc 이 시간 측정을 느리게 하므로)
+    tracemalloc.start()
+    for doc in docs:
+        fn(doc)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    n_docs = len(docs) * repeat
+    return {
+        'engine': name,
+        'docs': n_docs,
+        'seconds': round(elapsed, 4),
+        'docs_per_sec': round(n_docs / elapsed, 1),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="clean_html_keep_table 마이크로 벤치마크")
+    parser.add_argument('corpus', nargs='?', default=DEFAULT_CORPUS, help="본문 HTML(*.html) 폴더")
+    parser.add_argument('--repeat', type=int, default=20, help="코퍼스 반복 횟수")
+    args = parser.parse_args()
+
+    docs = load_corpus(args.corpus)
+    if not docs:
+        sys.exit(f"코퍼스가 비어 있습니다: {args.corpus}")
+
+    engines = [
+        ('legacy-bs4', legacy_clean_html_keep_table),
+        ('html.parser', lambda doc: html_to_text(doc, parser='html.parser')),
+    ]
+    if etree is not None:
+        engines.append(('lxml', lambda doc: html_to_text(doc, parser='lxml')))
+
+    print(f"📚 코퍼스: {len(docs)}개 문서 x {args.repeat}회")
+    print(f"{'engine':<12} {'docs/sec':>10} {'seconds':>9} {'peak KiB':>10}")
+    for name, fn in engines:
+        result = bench(name, fn, docs, args.repeat)
+        print(f"{result['engine']:<12} {result['docs_per_sec']:>10} {result['seconds']:>9} {result['peak_kib']:>10}")
+
+if __name__ == "__main__":
+    main()
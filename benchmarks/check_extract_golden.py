@@ -0,0 +1,48 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from notice_crawler.notice_extract import extract_info
+
+DEFAULT_GOLDEN = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus', 'extract_golden.jsonl')
+
+# ===== extract_info 골든 코퍼스 비교 =====
+# extract_golden.jsonl 의 expected 는 예전(줄을 필드마다 다시 훑던) 구현의 출력이다.
+# 연도 없는 날짜는 reference_year 기준으로 만들어 두었다.
+# legacy_error 가 있는 항목은 예전 구현이 예외로 죽던 입력이라 비교하지 않는다.
+def load_golden(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="extract_info 결과를 골든 코퍼스와 비교")
+    parser.add_argument('golden', nargs='?', default=DEFAULT_GOLDEN)
+    args = parser.parse_args()
+
+    records = load_golden(args.golden)
+    mismatches = 0
+    skipped = 0
+    start = time.perf_counter()
+    for i, record in enumerate(records):
+        if record.get('legacy_error'):
+            skipped += 1
+            continue
+        actual = extract_info(record['title'], record['content'], ref_year=record['reference_year'])
+        if actual != record['expected']:
+            mismatches += 1
+            print(f"❌ [{i}] {record['title']}")
+            print(f"   expected: {record['expected']}")
+            print(f"   actual:   {actual}")
+    elapsed = time.perf_counter() - start
+
+    checked = len(records) - skipped
+    print(f"\n{checked}개 비교, {skipped}개 건너뜀, 불일치 {mismatches}개 ({elapsed:.3f}s)")
+    sys.exit(1 if mismatches else 0)
+
+if __name__ == "__main__":
+    main()
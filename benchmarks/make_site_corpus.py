@@ -0,0 +1,102 @@
+import argparse
+import glob
+import os
+import random
+from datetime import date, timedelta
+from html import escape
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUT = os.path.join(HERE, 'corpus', 'site')
+BODIES = os.path.join(HERE, 'corpus', 'bodies')
+
+# ===== 벤치마크용 사이트 코퍼스 만들기 =====
+# padm.kangwon.ac.kr 학과공지 목록/상세 페이지와 같은 마크업으로 페이지를 만들어 둔다.
+# 본문은 corpus/bodies 의 실제 공지 본문을 돌려 쓴다. 같은 seed 면 항상 같은 파일이 나온다.
+#   list_{offset}.html   목록 (고정 공지 1개 + 일반 공지 10개, 행마다 작성일)
+#   list_empty.html      마지막 페이지 뒤 (행 없음)
+#   detail_{articleNo}.html
+FIRST_ARTICLE_NO = 800000
+TITLES = [
+    "2025학년도 1학기 비교과 프로그램 특강 참가자 모집",
+    "[학생처] 해외 연수 프로그램 안내",
+    "창업 아이디어 경진대회 공모전 개최",
+    "도서관 이용 시간 변경 안내",
+    "문해력 향상 워크숍 운영 안내",
+    "2025 여름방학 국내 봉사활동 참가자 모집",
+    "교내 장학금 신청 안내",
+    "하계 현장실습 참여 기업 모집",
+]
+PAGE_HEAD = '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>학과공지 | 강원대학교</title></head><body>\n'
+
+def posted_date(i):
+    return date(2025, 4, 28) - timedelta(days=i // 2)
+
+def list_row(i, offset, total, rng):
+    no = FIRST_ARTICLE_NO - i
+    title = escape(TITLES[i % len(TITLES)])
+    day = posted_date(i).strftime('%y.%m.%d')
+    return f'''<tr><td class="b-num-box">{total - i}</td>
+<td class="b-td-left b-td-title"><div class="b-title-box"><a href="?mode=view&amp;articleNo={no}&amp;article.offset={offset}&amp;articleLimit=10" title="{title} 자세히 보기">{title} <span class="b-new">새글</span></a></div>
+<div class="b-m-con"><span class="b-writer">학생과</span><span class="b-date">{day}</span><span class="hit">조회수 {rng.randint(1, 900)}</span></div></td>
+<td class="b-no-right">학생과</td><td>{day}</td><td>{rng.randint(1, 900)}</td></tr>'''
+
+def list_page(offset, total, rng, per_page=10):
+    rows = [f'''<tr class="b-top-box"><td class="b-num-box">공지</td>
+<td class="b-td-left b-td-title"><div class="b-title-box b-notice"><a href="?mode=view&amp;articleNo=900001&amp;article.offset={offset}&amp;articleLimit=10" title="고정 공지">[공지] 학사일정 안내</a></div>
+<div class="b-m-con"><span class="b-writer">학생처</span><span class="b-date">25.03.01</span></div></td>
+<td class="b-no-right">학생처</td><td>25.03.01</td><td>1021</td></tr>''']
+    rows += [list_row(i, offset, total, rng) for i in range(offset, min(offset + per_page, total))]
+    pager = ''.join(
+        f'<li><a href="?mode=list&amp;&amp;articleLimit=10&amp;article.offset={o}" class="pager">{o // per_page + 1}</a></li>'
+        for o in range(0, total, per_page)
+    )
+    return (PAGE_HEAD +
+            '<div class="bn-list-common01 type01 bn-common"><table class="board-table"><caption>게시판 목록</caption>\n'
+            '<thead><tr><th>번호</th><th>제목</th><th>작성자</th><th>작성일</th><th>조회수</th></tr></thead>\n'
+            f'<tbody>{"".join(rows)}</tbody></table>\n'
+            f'<div class="b-paging01 type03"><div class="b-paging-wrap"><ul>{pager}</ul></div></div></div></body></html>')
+
+def detail_page(i, body):
+    no = FIRST_ARTICLE_NO - i
+    files = ''
+    if i % 3 == 0:
+        files = f'''<div class="b-file-box"><ul>
+<li><a class="file-down-btn hwp" href="?mode=download&amp;articleNo={no}&amp;attachNo=1">신청서 양식.hwp</a></li>
+<li><a class="file-down-btn pdf" href="?mode=download&amp;articleNo={no}&amp;attachNo=2">안내문.PDF</a></li>
+<li><a class="file-down-btn jpg" href="?mode=download&amp;articleNo={no}&amp;attachNo=3">포스터.jpg</a></li>
+</ul></div>'''
+    return (PAGE_HEAD +
+            '<div class="bn-view-common01 type01"><div class="b-main-box"><div class="b-top-box">'
+            f'<p class="b-title-box"><span class="b-cate">[학생과]</span><span>{escape(TITLES[i % len(TITLES)])}</span></p>\n'
+            '<div class="b-etc-box"><ul><li class="b-writer-box"><span class="title">작성자</span><span>학생과</span></li>\n'
+            f'<li class="b-date-box"><span class="title">작성일</span><span>{posted_date(i).strftime("%Y.%m.%d")}</span></li>\n'
+            '<li class="b-hit-box"><span class="title">조회수</span><span>123</span></li></ul></div></div>\n'
+            f'{files}\n<div class="b-content-box"><div class="fr-view">{body}</div></div>\n'
+            '</div></div></body></html>')
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 목록/상세 HTML 코퍼스 생성")
+    parser.add_argument('-o', '--out', default=DEFAULT_OUT)
+    parser.add_argument('-n', '--articles', type=int, default=60)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    bodies = []
+    for path in sorted(glob.glob(os.path.join(BODIES, '*.html'))):
+        with open(path, encoding='utf-8') as f:
+            bodies.append(f.read())
+
+    os.makedirs(args.out, exist_ok=True)
+    for offset in range(0, args.articles, 10):
+        with open(os.path.join(args.out, f'list_{offset}.html'), 'w', encoding='utf-8') as f:
+            f.write(list_page(offset, args.articles, rng))
+    with open(os.path.join(args.out, 'list_empty.html'), 'w', encoding='utf-8') as f:
+        f.write(list_page(args.articles, args.articles, rng))
+    for i in range(args.articles):
+        with open(os.path.join(args.out, f'detail_{FIRST_ARTICLE_NO - i}.html'), 'w', encoding='utf-8') as f:
+            f.write(detail_page(i, bodies[i % len(bodies)]))
+    print(f"✅ 목록 {-(-args.articles // 10)}개 + 상세 {args.articles}개 생성: {args.out}")
+
+if __name__ == "__main__":
+    main()
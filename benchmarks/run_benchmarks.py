@@ -0,0 +1,198 @@
+import argparse
+import asyncio
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, ROOT)
+
+from bench_clean import load_corpus
+from check_extract_golden import DEFAULT_GOLDEN, load_golden
+from stub_server import DEFAULT_SITE, start_stub_server
+from notice_crawler.html_clean import DEFAULT_PARSER
+from notice_crawler.notice_parser import clean_html_keep_table, extract_table_text, parse_notice_list, parse_notice_detail
+from notice_crawler.notice_extract import extract_event_dates, extract_locations, extract_info
+from notice_crawler.notice_http import create_session
+from notice_crawler.notice_pipeline import crawl_pipeline, NO_LIMIT
+
+DEFAULT_BODIES = os.path.join(HERE, 'corpus', 'bodies')
+DEFAULT_RESULTS = os.path.join(HERE, 'results')
+
+# ===== 단계별 벤치마크 =====
+# 기록된 코퍼스로 핫패스(목록/상세 파싱, 본문 정리, 표 정리, 필드 추출)의 처리량과 메모리를 재고,
+# 로컬 스텁 서버를 상대로 파이프라인 전체 pages/sec 를 잰다.
+# 결과는 results/bench_YYYYmmdd_HHMMSS.json 으로 저장 -> --baseline 으로 이전 결과와 비교.
+def measure(fn, items, repeat):
+    fn(items[0])  # 워밍업
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            fn(item)
+    elapsed = time.perf_counter() - start
+
+    # 메모리는 따로 한 바퀴 (tracemalloc 이 시간 측정을 느리게 하므로)
+    tracemalloc.start()
+    for item in items:
+        fn(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    n_items = len(items) * repeat
+    return {
+        'items': n_items,
+        'seconds': round(elapsed, 4),
+        'items_per_sec': round(n_items / elapsed, 1),
+        'us_per_item': round(elapsed / n_items * 1e6, 1),
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+def load_site(site_dir):
+    pages = {}
+    for kind in ('list', 'detail'):
+        docs = []
+        for path in sorted(glob.glob(os.path.join(site_dir, f'{kind}_*.html'))):
+            with open(path, encoding='utf-8') as f:
+                docs.append(f.read())
+        pages[kind] = docs
+    return pages
+
+def stage_benchmarks(site_dir, bodies_dir, golden_path, repeat):
+    site = load_site(site_dir)
+    bodies = load_corpus(bodies_dir)
+    golden = [record for record in load_golden(golden_path) if not record.get('legacy_error')]
+    contents = [record['content'] for record in golden]
+    # extract_table_text 는 BeautifulSoup 표 태그를 받으므로 파싱은 미리 해 둔다.
+    tables = [table for body in bodies for table in BeautifulSoup(body, DEFAULT_PARSER).find_all('table')]
+
+    stages = [
+        ('parse_list', parse_notice_list, site['list']),
+        ('parse_detail', parse_notice_detail, site['detail']),
+        ('clean_html_keep_table', clean_html_keep_table, bodies),
+        ('extract_table_text', extract_table_text, tables),
+        ('extract_event_dates', lambda text: extract_event_dates(text, ref_year=2025), contents),
+        ('extract_locations', extract_locations, contents),
+        ('extract_info', lambda record: extract_info(record['title'], record['content'], ref_year=2025), golden),
+    ]
+    results = {}
+    for name, fn, items in stages:
+        if not items:
+            print(f"[!] {name}: 입력이 없어 건너뜀")
+            continue
+        results[name] = measure(fn, items, repeat)
+    return results
+
+# ===== 파이프라인 전체 (스텁 서버) =====
+def end_to_end(site_dir, latency, detail_workers, rounds):
+    server, list_url = start_stub_server(latency=latency, site_dir=site_dir)
+    n_lists = len(glob.glob(os.path.join(site_dir, 'list_*.html'))) - 1   # list_empty 제외
+    offsets = range(0, n_lists * 10, 10)
+    session = create_session(pool_size=detail_workers)
+    details = 0
+
+    def on_notice(offset, idx, notice, result):
+        nonlocal details
+        details += 1
+
+    start = time.perf_counter()
+    try:
+        for _ in range(rounds):
+            asyncio.run(crawl_pipeline(
+                offsets, session, on_notice, url=list_url,
+                detail_workers=detail_workers,
+                limiter=NO_LIMIT,   # 속도 제한 없이 파이프라인 자체만 잰다
+            ))
+    finally:
+        server.shutdown()
+        session.close()
+    elapsed = time.perf_counter() - start
+    pages = details + len(offsets) * rounds
+    return {
+        'rounds': rounds,
+        'latency': latency,
+        'detail_workers': detail_workers,
+        'detail_pages': details,
+        'list_pages': len(offsets) * rounds,
+        'seconds': round(elapsed, 4),
+        'pages_per_sec': round(pages / elapsed, 1),
+    }
+
+# ===== 저장 / 비교 =====
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(current, baseline):
+    print(f"\n📈 기준 결과와 비교 ({baseline.get('timestamp')}, {baseline.get('commit')})")
+    for name, result in current['stages'].items():
+        before = baseline.get('stages', {}).get(name)
+        if not before:
+            continue
+        change = (result['items_per_sec'] / before['items_per_sec'] - 1) * 100
+        print(f"  {name:<22} {before['items_per_sec']:>10} -> {result['items_per_sec']:>10} items/s ({change:+.1f}%)")
+    before = baseline.get('end_to_end')
+    after = current.get('end_to_end')
+    if before and after:
+        change = (after['pages_per_sec'] / before['pages_per_sec'] - 1) * 100
+        print(f"  {'end_to_end':<22} {before['pages_per_sec']:>10} -> {after['pages_per_sec']:>10} pages/s ({change:+.1f}%)")
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링/정리/추출 핫패스 벤치마크")
+    parser.add_argument('--repeat', type=int, default=10, help="코퍼스 반복 횟수")
+    parser.add_argument('--site', default=DEFAULT_SITE, help="기록된 목록/상세 페이지 폴더")
+    parser.add_argument('--bodies', default=DEFAULT_BODIES, help="본문 HTML 폴더")
+    parser.add_argument('--golden', default=DEFAULT_GOLDEN, help="추출 코퍼스 (jsonl)")
+    parser.add_argument('--latency', type=float, default=0.0, help="스텁 서버 응답 지연 (초)")
+    parser.add_argument('--workers', type=int, default=8, help="파이프라인 본문 작업자 수")
+    parser.add_argument('--rounds', type=int, default=3, help="파이프라인 반복 횟수")
+    parser.add_argument('--skip-e2e', action='store_true', help="스텁 서버 파이프라인 측정 생략")
+    parser.add_argument('-o', '--output', default=None, help="결과 JSON 경로 (기본: results/bench_<시각>.json)")
+    parser.add_argument('--baseline', default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    now = datetime.now()
+    result = {
+        'timestamp': now.isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'html_parser': DEFAULT_PARSER,
+        'repeat': args.repeat,
+        'stages': stage_benchmarks(args.site, args.bodies, args.golden, args.repeat),
+    }
+
+    print(f"{'stage':<22} {'items/s':>10} {'µs/item':>9} {'peak KiB':>9}")
+    for name, stage in result['stages'].items():
+        print(f"{name:<22} {stage['items_per_sec']:>10} {stage['us_per_item']:>9} {stage['peak_kib']:>9}")
+
+    if not args.skip_e2e:
+        result['end_to_end'] = end_to_end(args.site, args.latency, args.workers, args.rounds)
+        e2e = result['end_to_end']
+        print(f"\n🌐 스텁 서버 파이프라인: {e2e['pages_per_sec']} pages/s "
+              f"(본문 {e2e['detail_pages']} + 목록 {e2e['list_pages']}, {e2e['seconds']}s, 지연 {e2e['latency']}s)")
+
+    output = args.output or os.path.join(DEFAULT_RESULTS, f"bench_{now.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            compare(result, json.load(f))
+
+if __name__ == "__main__":
+    main()
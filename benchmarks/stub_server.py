@@ -0,0 +1,77 @@
+import argparse
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SITE = os.path.join(HERE, 'corpus', 'site')
+LIST_PATH = '/padm/life/notice-department.do'
+
+# ===== padm.kangwon.ac.kr 흉내 내는 로컬 서버 =====
+# corpus/site 의 기록된 페이지를 사이트와 같은 주소로 돌려준다.
+#   /padm/life/notice-department.do?article.offset=N        -> list_N.html (없으면 빈 목록)
+#   /padm/life/notice-department.do?mode=view&articleNo=N   -> detail_N.html
+#   /padm/life/notice-department.do?mode=download&...       -> 작은 바이너리
+# latency 를 주면 응답마다 그만큼 기다린다 (실제 서버 응답 시간 흉내).
+class StubHandler(BaseHTTPRequestHandler):
+    site_dir = DEFAULT_SITE
+    latency = 0.0
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        if parts.path != LIST_PATH:
+            return self._send(404, b'')
+        query = parse_qs(parts.query)
+        mode = query.get('mode', ['list'])[0]
+        if self.latency:
+            time.sleep(self.latency)
+
+        if mode == 'download':
+            body = b'ATTACH' + query.get('attachNo', ['0'])[0].encode()
+            return self._send(200, body, 'application/octet-stream')
+        if mode == 'view':
+            name = f"detail_{query.get('articleNo', [''])[0]}.html"
+        else:
+            name = f"list_{query.get('article.offset', ['0'])[0]}.html"
+            if not os.path.exists(os.path.join(self.site_dir, name)):
+                name = 'list_empty.html'
+
+        path = os.path.join(self.site_dir, name)
+        if not os.path.exists(path):
+            return self._send(404, b'')
+        with open(path, 'rb') as f:
+            self._send(200, f.read(), 'text/html;charset=UTF-8')
+
+    def _send(self, status, body, content_type='text/plain'):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+# 백그라운드 스레드로 띄우고 (server, 목록 URL) 을 돌려준다. port=0 이면 빈 포트
+def start_stub_server(port=0, latency=0.0, site_dir=DEFAULT_SITE):
+    handler = type('Handler', (StubHandler,), {'site_dir': site_dir, 'latency': latency})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}{LIST_PATH}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기록된 페이지로 학과공지 사이트를 흉내 내는 로컬 서버")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="응답마다 지연 (초)")
+    parser.add_argument('--site', default=DEFAULT_SITE)
+    args = parser.parse_args()
+
+    server, url = start_stub_server(args.port, args.latency, args.site)
+    print(f"🧪 스텁 서버: {url}  (Ctrl+C 로 종료)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
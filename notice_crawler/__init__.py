@@ -0,0 +1,28 @@
+# ===== 강원대 학과공지 크롤러 =====
+# import notice_crawler 만으로는 requests/selenium 등을 불러오지 않는다. 처음 쓸 때 불러온다.
+#   from notice_crawler import Crawler
+#   with Crawler(detail_workers=8) as crawler: ...
+_exports = {
+    'Crawler': 'core',
+    'CrawlerConfig': 'core',
+    'crawl_full': 'crawl_full',
+    'crawl_date_range': 'crawl_date',
+    'crawl_boards': 'crawl_boards',
+    'retry_dead_letters': 'crawl_retry',
+    'BoardScheduler': 'scheduler',
+    'Board': 'boards',
+    'register_board': 'boards',
+    'extract_info': 'notice_extract',
+    'read_columnar': 'columnar',
+    'write_columnar': 'columnar',
+}
+
+__all__ = list(_exports)
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f'.{_exports[name]}', __name__), name)
+    globals()[name] = value
+    return value
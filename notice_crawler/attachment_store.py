@@ -0,0 +1,199 @@
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from urllib.parse import unquote
+
+from .notice_http import create_session
+from .notice_sink import read_records
+
+# ===== 첨부파일 저장소 (내용 해시 기준) =====
+# 같은 신청서 양식이 수백 개 공지에 붙어 있어서 파일은 내용의 sha256 으로 한 번만 저장한다.
+# - objects/ab/abcdef....hwp 형태로 저장, URL -> 해시 매핑은 SQLite 에 기록
+# - 이미 받은 URL 은 다시 요청하지 않는다
+# - 파일 전체를 메모리에 올리지 않고 chunk_size 씩 받아서 임시 파일에 쓰면서 해시를 계산
+DOWNLOAD_TIMEOUT = 30
+CHUNK_SIZE = 64 * 1024
+
+FILENAME_STAR_RE = re.compile(r"filename\*\s*=\s*[^']*'[^']*'([^;]+)", re.IGNORECASE)
+FILENAME_RE = re.compile(r'filename\s*=\s*"?([^";]+)"?', re.IGNORECASE)
+
+def filename_from_disposition(header):
+    if not header:
+        return ''
+    match = FILENAME_STAR_RE.search(header)
+    if match:
+        return unquote(match.group(1).strip())
+    match = FILENAME_RE.search(header)
+    if match:
+        name = match.group(1).strip()
+        # 서버가 UTF-8 파일명을 latin-1 로 내려주는 경우가 있다.
+        try:
+            return name.encode('latin-1').decode('utf-8')
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            return name
+    return ''
+
+class AttachmentStore:
+    def __init__(self, directory='attachments', session=None, workers=4,
+                 chunk_size=CHUNK_SIZE, timeout=DOWNLOAD_TIMEOUT, pacer=None):
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        # pacing.HostPacer 를 넘기면 크롤링과 같은 속도 조절을 따른다.
+        self.pacer = pacer
+        # 작업자 수만큼 커넥션을 재사용하도록 풀 크기를 맞춘다.
+        if session is None:
+            session = create_session(pool_size=workers)
+            if pacer is not None:
+                session.hooks['response'].append(pacer.observe)
+        self.session = session
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        os.makedirs(os.path.join(directory, 'objects'), exist_ok=True)
+
+        # 이미 끝난 future 는 add_done_callback 이 바로 불리므로 재진입 가능한 락을 쓴다.
+        self._lock = threading.RLock()
+        self._in_flight = {}
+        self.conn = sqlite3.connect(os.path.join(directory, 'index.sqlite3'), check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS attachments (
+                url        TEXT PRIMARY KEY,
+                sha256     TEXT,
+                file_name  TEXT,
+                size       INTEGER,
+                fetched_at TEXT
+            )
+        ''')
+        self.conn.commit()
+        self.downloaded = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def object_path(self, sha256, file_name=''):
+        ext = os.path.splitext(file_name)[1].lower()
+        return os.path.join(self.directory, 'objects', sha256[:2], sha256 + ext)
+
+    def lookup(self, url):
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT sha256, file_name FROM attachments WHERE url = ?', (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        path = self.object_path(*row)
+        return path if os.path.exists(path) else None
+
+    # URL 하나를 받아서 저장 경로를 돌려준다. 실패하면 None.
+    def download(self, url):
+        path = self.lookup(url)
+        if path is not None:
+            self._count('skipped')
+            return path
+
+        tmp_path = os.path.join(self.directory, f".{threading.get_ident()}.part")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with self._paced(url), self.session.get(url, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                file_name = filename_from_disposition(response.headers.get('Content-Disposition'))
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(self.chunk_size):
+                        digest.update(chunk)
+                        size += len(chunk)
+                        f.write(chunk)
+        except Exception as e:
+            print(f"[!] 첨부파일 다운로드 실패: {url} ({e})")
+            self._count('failed')
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+
+        sha256 = digest.hexdigest()
+        path = self.object_path(sha256, file_name)
+        if os.path.exists(path):
+            os.remove(tmp_path)
+            self._count('duplicates')
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+            self._count('downloaded')
+
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO attachments (url, sha256, file_name, size, fetched_at) VALUES (?, ?, ?, ?, ?)',
+                (url, sha256, file_name, size, time.strftime('%Y-%m-%d %H:%M:%S'))
+            )
+            self.conn.commit()
+        return path
+
+    # 크롤링 중에 호출: 작업자 풀에 넘기고 바로 돌아온다. 같은 URL 을 동시에 두 번 받지 않는다.
+    def submit(self, urls):
+        futures = []
+        with self._lock:
+            for url in urls:
+                future = self._in_flight.get(url)
+                if future is None:
+                    future = self.executor.submit(self.download, url)
+                    self._in_flight[url] = future
+                    future.add_done_callback(lambda _, url=url: self._done(url))
+                futures.append(future)
+        return futures
+
+    def _paced(self, url):
+        return self.pacer.request(url) if self.pacer is not None else nullcontext()
+
+    def _count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _done(self, url):
+        with self._lock:
+            self._in_flight.pop(url, None)
+
+    def download_all(self, urls):
+        urls = list(dict.fromkeys(urls))
+        return dict(zip(urls, (future.result() for future in self.submit(urls))))
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# CSV/JSONL 에는 링크가 ', ' 로 이어져 저장되어 있다.
+def links_from_record(record, fields=('문서파일 링크', '이미지파일 링크')):
+    urls = []
+    for field in fields:
+        value = record.get(field) or ''
+        if isinstance(value, list):
+            urls.extend(value)
+        else:
+            urls.extend(link for link in value.split(', ') if link)
+    return urls
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="저장된 크롤링 결과(CSV/JSONL)의 첨부파일을 내려받기")
+    parser.add_argument('input', help="crawling.py 출력 파일 (.csv / .jsonl, .gz 가능)")
+    parser.add_argument('-d', '--directory', default='attachments', help="첨부파일 저장 폴더")
+    parser.add_argument('-w', '--workers', type=int, default=4, help="동시에 받을 파일 수")
+    args = parser.parse_args()
+
+    urls = [url for record in read_records(args.input) for url in links_from_record(record)]
+    start = time.perf_counter()
+    with AttachmentStore(args.directory, workers=args.workers) as store:
+        store.download_all(urls)
+    elapsed = time.perf_counter() - start
+    print(f"✅ 첨부파일 {len(set(urls))}개 처리 ({elapsed:.2f}s): 새로 저장 {store.downloaded}, "
+          f"내용 중복 {store.duplicates}, 이미 받음 {store.skipped}, 실패 {store.failed}")
@@ -0,0 +1,331 @@
+import hashlib
+import os
+import re
+import signal
+import sqlite3
+import struct
+import sys
+import time
+import zipfile
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import resource
+except ImportError:  # Windows 에는 없다 -> 메모리/CPU 제한 없이 돈다
+    resource = None
+
+from . import metrics
+
+# ===== 첨부파일 본문 추출 (HWP / HWPX / PDF) =====
+# 행사 일시, 장소, 신청방법을 첨부한 한글/PDF 파일에만 적어 둔 공지가 많다.
+# 첨부파일 글자를 뽑아서 extract_info(..., attachment_text=...) 에 본문과 같이 넘긴다.
+# - 파일은 내용 sha256 기준으로 한 번만 추출하고 결과(실패 포함)를 SQLite 에 캐시 (같은 신청서 양식이 수백 번 붙는다)
+# - 추출은 프로세스 풀에서: 깨진 파일/압축 폭탄이 크롤러를 멈추거나 메모리를 다 먹지 않도록
+#   작업자마다 메모리 상한(RLIMIT_AS), 파일마다 시간 상한(SIGALRM + CPU 시간 RLIMIT_CPU)을 건다.
+#   작업자가 죽으면 (메모리 초과, CPU 제한 등) 풀을 새로 만들고 그 파일만 실패로 남긴다.
+# HWP 는 olefile, PDF 는 pypdf 가 있어야 한다. 없으면 그 형식만 건너뛴다. (HWPX 는 표준 라이브러리만 씀)
+EXTRACT_TIMEOUT = 20                    # 파일 하나 (초)
+MEMORY_LIMIT = 1024 * 1024 * 1024       # 작업자 하나 (바이트)
+MAX_TEXT_LENGTH = 100_000               # 파일 하나에서 남길 글자 수
+CHUNK_SIZE = 64 * 1024
+
+OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+class ExtractionTimeout(Exception):
+    pass
+
+# ----- HWP 5.0 (OLE 복합 문서) -----
+# BodyText/SectionN 스트림 = (압축된) 레코드 나열. 문단 글자는 HWPTAG_PARA_TEXT 레코드에 UTF-16 으로 들어 있다.
+# 글자 사이의 제어 문자 중 0, 10, 13, 24~31 은 한 칸, 나머지(표/그림/각주 등)는 8칸을 차지한다.
+HWPTAG_PARA_TEXT = 16 + 51
+HWP_CHAR_CONTROLS = {0, 10, 13} | set(range(24, 32))
+
+def _hwp_para_text(raw):
+    units = array('H', raw[:len(raw) // 2 * 2])
+    if sys.byteorder == 'big':
+        units.byteswap()
+    parts = []
+    start = i = 0
+    while i < len(units):
+        code = units[i]
+        if code >= 32:
+            i += 1
+            continue
+        parts.append(raw[start * 2:i * 2].decode('utf-16le', 'ignore'))
+        if code in (10, 13):
+            parts.append('\n')
+        elif code == 9:
+            parts.append('\t')
+        i += 1 if code in HWP_CHAR_CONTROLS else 8
+        start = i
+    parts.append(raw[start * 2:len(units) * 2].decode('utf-16le', 'ignore'))
+    return ''.join(parts)
+
+def hwp_section_text(data):
+    parts = []
+    pos = 0
+    while pos + 4 <= len(data):
+        header, = struct.unpack_from('<I', data, pos)
+        pos += 4
+        tag = header & 0x3FF
+        size = header >> 20
+        if size == 0xFFF:
+            size, = struct.unpack_from('<I', data, pos)
+            pos += 4
+        if tag == HWPTAG_PARA_TEXT:
+            parts.append(_hwp_para_text(data[pos:pos + size]))
+        pos += size
+    return ''.join(parts)
+
+def extract_hwp(path):
+    import olefile
+    with olefile.OleFileIO(path) as ole:
+        flags = ole.openstream('FileHeader').read()[36]
+        if flags & 2:
+            raise ValueError("암호가 걸린 HWP")
+        compressed = flags & 1
+        sections = sorted((entry for entry in ole.listdir() if entry[0] == 'BodyText'),
+                          key=lambda entry: int(re.sub(r'\D', '', entry[-1]) or 0))
+        parts = []
+        for entry in sections:
+            data = ole.openstream(entry).read()
+            if compressed:
+                data = zlib.decompress(data, -15)
+            parts.append(hwp_section_text(data))
+    return '\n'.join(parts)
+
+# ----- HWPX (zip + XML) -----
+HWPX_SECTION_RE = re.compile(r'Contents/section(\d+)\.xml$')
+HWPX_TEXT_RE = re.compile(r'<(?:\w+:)?t(?:\s[^>]*)?>([^<]*)</(?:\w+:)?t>|</(?:\w+:)?p>')
+
+def extract_hwpx(path):
+    from html import unescape
+    with zipfile.ZipFile(path) as archive:
+        names = sorted((name for name in archive.namelist() if HWPX_SECTION_RE.search(name)),
+                       key=lambda name: int(HWPX_SECTION_RE.search(name).group(1)))
+        parts = []
+        for name in names:
+            xml = archive.read(name).decode('utf-8', 'ignore')
+            # <hp:t> 는 글자, </hp:p> 는 문단 끝
+            parts.extend(unescape(match.group(1)) if match.group(1) is not None else '\n'
+                         for match in HWPX_TEXT_RE.finditer(xml))
+    return ''.join(parts)
+
+# ----- PDF -----
+def extract_pdf(path):
+    from pypdf import PdfReader
+    reader = PdfReader(path)
+    if reader.is_encrypted:
+        reader.decrypt('')
+    parts = []
+    length = 0
+    for page in reader.pages:
+        text = page.extract_text() or ''
+        parts.append(text)
+        length += len(text)
+        if length >= MAX_TEXT_LENGTH:
+            break
+    return '\n'.join(parts)
+
+# 저장소 파일은 확장자가 없을 수도 있어서 (Content-Disposition 이 없을 때) 앞부분 바이트로 형식을 고른다.
+def detect_format(path):
+    with open(path, 'rb') as f:
+        head = f.read(8)
+    if head.startswith(b'%PDF'):
+        return 'pdf'
+    if head == OLE_MAGIC:
+        return 'hwp'
+    if head.startswith(b'PK'):
+        with zipfile.ZipFile(path) as archive:
+            if any(HWPX_SECTION_RE.search(name) for name in archive.namelist()):
+                return 'hwpx'
+    return None
+
+EXTRACTORS = {'hwp': extract_hwp, 'hwpx': extract_hwpx, 'pdf': extract_pdf}
+
+def extract_text(path):
+    fmt = detect_format(path)
+    if fmt is None:
+        return None
+    text = EXTRACTORS[fmt](path)
+    return '\n'.join(line.strip() for line in text.splitlines() if line.strip())[:MAX_TEXT_LENGTH]
+
+# ===== 작업자 프로세스 =====
+def _init_worker(memory_limit):
+    if resource is not None and memory_limit:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard))
+
+def _on_alarm(signum, frame):
+    raise ExtractionTimeout()
+
+# -> (글자 또는 None, 오류 또는 None). 없는 라이브러리는 오류 대신 'missing:이름' 으로 알린다 (캐시하지 않음)
+def _extract_job(path, timeout):
+    use_alarm = hasattr(signal, 'setitimer')
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    if resource is not None:
+        # 파이썬 코드로 돌아오지 않는 C 루프는 알람이 못 끊는다 -> CPU 시간을 넘기면 프로세스가 죽는다
+        used = resource.getrusage(resource.RUSAGE_SELF)
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = int(used.ru_utime + used.ru_stime + timeout * 2) + 1
+        if hard == resource.RLIM_INFINITY or soft <= hard:
+            resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    try:
+        return extract_text(path), None
+    except ImportError as e:
+        return None, f"missing:{e.name}"
+    except ExtractionTimeout:
+        return None, f"시간 초과 ({timeout}s)"
+    except MemoryError:
+        return None, "메모리 초과"
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# ===== 추출기 + 캐시 =====
+#   with AttachmentTextExtractor('attachments/text.sqlite3') as extractor:
+#       text = extractor.text_for(paths)      # 파일 여러 개의 글자를 이어서
+class AttachmentTextExtractor:
+    def __init__(self, cache_path='attachment_text.sqlite3', workers=None, timeout=EXTRACT_TIMEOUT,
+                 memory_limit=MEMORY_LIMIT):
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self._executor = None
+        self._missing = set()
+        self.conn = sqlite3.connect(cache_path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS attachment_text (
+                sha256       TEXT PRIMARY KEY,
+                text         BLOB,
+                error        TEXT,
+                extracted_at TEXT
+            )
+        ''')
+        self.conn.commit()
+        self.hits = 0
+        self.extracted = 0
+        self.failed = 0
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(self.memory_limit,))
+        return self._executor
+
+    def _restart(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    def _cached(self, sha256):
+        row = self.conn.execute('SELECT text, error FROM attachment_text WHERE sha256 = ?', (sha256,)).fetchone()
+        if row is None:
+            return None
+        text, error = row
+        return (zlib.decompress(text).decode('utf-8') if text is not None else None), error
+
+    def _store(self, sha256, text, error):
+        self.conn.execute(
+            'INSERT OR REPLACE INTO attachment_text (sha256, text, error, extracted_at) VALUES (?, ?, ?, ?)',
+            (sha256, zlib.compress(text.encode('utf-8')) if text is not None else None, error,
+             time.strftime('%Y-%m-%d %H:%M:%S'))
+        )
+
+    # {경로: 글자}. 읽을 수 없는 파일(이미지, 깨진 파일 등)은 빠진다.
+    def texts(self, paths):
+        by_hash = {}
+        for path in dict.fromkeys(paths):
+            if path and os.path.exists(path):
+                by_hash.setdefault(file_sha256(path), []).append(path)
+
+        results = {}
+        todo = {}
+        for sha256, same in by_hash.items():
+            cached = self._cached(sha256)
+            if cached is None:
+                todo[sha256] = same[0]
+                continue
+            self.hits += 1
+            if cached[0]:
+                results[sha256] = cached[0]
+
+        with metrics.timer('attachment_text'):
+            results.update(self._extract_all(todo))
+        self.conn.commit()
+        return {path: results[sha256] for sha256, same in by_hash.items() if sha256 in results for path in same}
+
+    def _extract_all(self, todo):
+        results = {}
+        retry = {}
+        futures = {sha256: self.executor.submit(_extract_job, path, self.timeout) for sha256, path in todo.items()}
+        for sha256, future in futures.items():
+            try:
+                text, error = future.result()
+            except BrokenProcessPool:
+                retry[sha256] = todo[sha256]
+                continue
+            self._record(sha256, todo[sha256], text, error, results)
+
+        # 작업자가 죽으면 같이 돌던 파일도 모두 실패로 돌아온다 -> 새 풀에서 하나씩 다시 돌려 범인만 실패 처리
+        if retry:
+            self._restart()
+            for sha256, path in retry.items():
+                try:
+                    text, error = self.executor.submit(_extract_job, path, self.timeout).result()
+                except BrokenProcessPool:
+                    self._restart()
+                    text, error = None, "작업자 프로세스가 죽음 (메모리/CPU 제한)"
+                self._record(sha256, path, text, error, results)
+        return results
+
+    def _record(self, sha256, path, text, error, results):
+        if error is not None and error.startswith('missing:'):
+            # 라이브러리를 설치하면 다시 추출하도록 캐시에 남기지 않는다
+            module = error.split(':', 1)[1]
+            if module not in self._missing:
+                self._missing.add(module)
+                print(f"[!] 첨부파일 본문 추출에 {module} 이(가) 필요합니다 (pip install {module}) -> 이 형식은 건너뜀")
+            return
+        self._store(sha256, text, error)
+        if error is not None:
+            print(f"[!] 첨부파일 본문 추출 실패: {os.path.basename(path)} ({error})")
+            metrics.inc('failures', stage='attachment_text')
+            self.failed += 1
+            return
+        if text:
+            self.extracted += 1
+            results[sha256] = text
+
+    # 공지 하나에 붙은 파일들의 글자를 이어서
+    def text_for(self, paths):
+        texts = self.texts(paths)
+        return '\n'.join(texts[path] for path in dict.fromkeys(paths) if path in texts)
+
+    def summary(self):
+        return f"캐시 적중 {self.hits}, 새로 추출 {self.extracted}, 실패 {self.failed}"
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,105 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .notice_extract import extract_info
+from .notice_sink import NoticeSink, read_records
+from .attachment_store import AttachmentStore, links_from_record
+from .attachment_text import AttachmentTextExtractor, EXTRACT_TIMEOUT
+
+# ===== 저장된 크롤링 결과로 필드 추출만 다시 돌리기 =====
+# crawling.py 가 만든 CSV / JSONL 을 읽어서 extract_info 를 프로세스 풀에서 돌리고
+# 원래 레코드 + 추출 필드를 청크 단위로 바로바로 써 준다. (다시 크롤링할 필요 없음)
+# attachment_dir 을 주면 그 저장소에 받아 둔 첨부파일(HWP/PDF)의 글자도 같이 넘긴다. (attachment_text 참고)
+EXTRACT_FIELDS = ['날짜', '장소', '신청방법', '대상', '신청마감일', '카테고리']
+
+def enrich_record(record, attachment_text=None):
+    # 연도 없는 날짜는 공지 작성일 기준 -> 언제 다시 돌려도 같은 결과
+    info = extract_info(record.get('제목', ''), record.get('본문', ''), posted_date=record.get('작성일'),
+                        attachment_text=attachment_text)
+    enriched = dict(record)
+    for field in EXTRACT_FIELDS:
+        enriched[field] = info[field]
+    return enriched
+
+def enrich_chunk(records, attachment_texts=None):
+    attachment_texts = attachment_texts or [None] * len(records)
+    return [enrich_record(record, text) for record, text in zip(records, attachment_texts)]
+
+# 레코드마다 저장소에 받아 둔 문서 첨부파일의 글자 (받지 않은 파일은 건너뛴다)
+def attachment_texts(records, store, extractor):
+    paths = [[store.lookup(url) for url in links_from_record(record, fields=('문서파일 링크',))]
+             for record in records]
+    texts = extractor.texts(path for record_paths in paths for path in record_paths)
+    return ['\n'.join(texts[path] for path in dict.fromkeys(record_paths) if path in texts) or None
+            for record_paths in paths]
+
+def iter_chunks(records, chunk_size):
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+# CSV 는 리스트(날짜 구간)를 문자열로 풀어서 저장
+def to_csv_row(record):
+    row = dict(record)
+    if isinstance(row.get('날짜'), list):
+        row['날짜'] = ' ~ '.join(row['날짜'])
+    return row
+
+def run_batch(input_path, output_path, workers=None, chunk_size=500, compress=False, attachment_dir=None,
+              attachment_timeout=EXTRACT_TIMEOUT):
+    fmt = 'jsonl' if '.jsonl' in output_path else 'csv'
+    records = read_records(input_path)
+    first = next(records, None)
+    if first is None:
+        print("[!] 입력 파일에 레코드가 없습니다:", input_path)
+        return 0
+
+    fieldnames = list(first.keys()) + [f for f in EXTRACT_FIELDS if f not in first]
+    sink = NoticeSink(output_path, fmt=fmt, compress=compress,
+                      fieldnames=fieldnames)
+
+    def all_records():
+        yield first
+        yield from records
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 2
+    store = extractor = None
+    if attachment_dir:
+        store = AttachmentStore(attachment_dir, workers=1)
+        extractor = AttachmentTextExtractor(os.path.join(attachment_dir, 'text.sqlite3'), workers=workers,
+                                            timeout=attachment_timeout)
+    start = time.perf_counter()
+    with sink, ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = []
+        # 제출해 둔 청크가 너무 많아지지 않게 창 크기만큼만 유지하고, 입력 순서대로 쓴다.
+        for chunk in iter_chunks(all_records(), chunk_size):
+            texts = attachment_texts(chunk, store, extractor) if extractor is not None else None
+            pending.append(executor.submit(enrich_chunk, chunk, texts))
+            if len(pending) >= max_in_flight:
+                _write_chunk(sink, pending.pop(0).result(), fmt)
+        for future in pending:
+            _write_chunk(sink, future.result(), fmt)
+
+    elapsed = time.perf_counter() - start
+    if extractor is not None:
+        print(f"📎 첨부파일 본문: {extractor.summary()}")
+        extractor.close()
+        store.close()
+    print(f"✅ {sink.count}개 공지 추출 완료 ({elapsed:.2f}s, {sink.count / max(elapsed, 1e-9):.0f}건/s): {sink.path}")
+    return sink.count
+
+def _write_chunk(sink, enriched, fmt):
+    for record in enriched:
+        sink.write(to_csv_row(record) if fmt == 'csv' else record)
+
+# 명령줄 옵션은 cli.py 의 extract 명령 하나에만 둔다. python -m notice_crawler extract 와 같다.
+if __name__ == "__main__":
+    import sys
+    from .cli import main
+    main(['extract'] + sys.argv[1:])
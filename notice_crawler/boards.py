@@ -0,0 +1,40 @@
+import json
+
+from .notice_parser import list_url
+
+# ===== 게시판 목록 =====
+# 강원대 학과/부서 게시판은 같은 CMS 라 목록(b-td-title) / 본문(b-content-box) 마크업이 같다.
+# 목록 주소만 등록하면 같은 파서로 크롤링된다. 전체 글 수는 각 게시판 첫 페이지에서 읽는다.
+class Board:
+    def __init__(self, name, list_url, total_articles=None):
+        self.name = name
+        self.list_url = list_url
+        self.total_articles = total_articles   # None 이면 목록 첫 페이지에서 읽는다
+
+    def __repr__(self):
+        return f"Board({self.name!r}, {self.list_url!r})"
+
+BOARDS = {}
+
+def register_board(name, url, total_articles=None):
+    BOARDS[name] = Board(name, url, total_articles)
+    return BOARDS[name]
+
+register_board('padm-department', list_url)   # 학생처 학과공지 (예전 crawling.py 대상)
+
+# 게시판 목록 파일 (JSON): {"이름": "목록 주소", ...} 또는 [{"name": ..., "url": ...}, ...]
+def load_boards(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = [{'name': name, 'url': url} for name, url in data.items()]
+    return [register_board(item['name'], item['url'], item.get('total_articles')) for item in data]
+
+# 이름으로 고른다. 이름을 주지 않으면 등록된 게시판 전부
+def get_boards(names=None):
+    if not names:
+        return list(BOARDS.values())
+    unknown = [name for name in names if name not in BOARDS]
+    if unknown:
+        raise KeyError(f"등록되지 않은 게시판: {', '.join(unknown)} (등록된 게시판: {', '.join(BOARDS)})")
+    return [BOARDS[name] for name in names]
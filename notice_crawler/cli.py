@@ -0,0 +1,265 @@
+import argparse
+import time
+from datetime import date
+
+from .core import Crawler, CrawlerConfig
+
+# ===== 명령행 =====
+#   python -m notice_crawler full [--incremental] [--format jsonl] [--compress]
+#   python -m notice_crawler date 2025-04-28 [2025-04-30]
+#   python -m notice_crawler boards [이름 ...] [--board-file boards.json]
+#   python -m notice_crawler latest [--pages 3] [--pool-size 4]     (최근 공지를 브라우저로 열어 추출 결과 출력)
+#   python -m notice_crawler extract kangwon_notices_total.csv -o extracted.jsonl [--attachments attachments]
+#   python -m notice_crawler index kangwon_notices_total.csv        (저장된 결과로 검색 인덱스 만들기)
+#   python -m notice_crawler search 장학금 --category 비교과 --deadline-from 2025-05-01
+#   python -m notice_crawler dupes kangwon_notices_total.csv --threshold 0.8   (다시 올린 공지 묶음 보기)
+#   python -m notice_crawler retry                                  (실패 목록에 남은 공지 다시 받기)
+#   python -m notice_crawler export kangwon_notices_total.csv -o kangwon_notices.parquet   (컬럼 파일로 바꾸기)
+OUTPUT_FORMATS = ['csv', 'jsonl', 'parquet', 'arrow']
+
+def parse_date(text):
+    try:
+        return date.fromisoformat(text.replace('.', '-'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식은 YYYY-MM-DD: {text}")
+
+def add_crawl_options(parser):
+    parser.add_argument('--backend', choices=['http', 'selenium'], default=CrawlerConfig.fetch_backend,
+                        help="페이지 가져오는 방식")
+    parser.add_argument('--cache', choices=['normal', 'replay', 'off'], default=CrawlerConfig.cache_mode,
+                        help="응답 캐시 (replay: 네트워크 없이 캐시만)")
+    parser.add_argument('--cache-dir', default=CrawlerConfig.cache_dir)
+    parser.add_argument('-w', '--workers', type=int, default=CrawlerConfig.detail_workers, help="본문 작업자 수")
+    parser.add_argument('--max-rps', type=float, default=CrawlerConfig.max_requests_per_second,
+                        help="모든 게시판을 합친 초당 요청 상한 (0 이면 호스트별 조절만)")
+    parser.add_argument('--attachments', action='store_true', help="첨부파일도 내려받기")
+    parser.add_argument('--attachment-dir', default=CrawlerConfig.attachment_dir)
+    parser.add_argument('--metrics-port', type=int, default=None, help="예: 9108 -> /metrics 노출")
+    parser.add_argument('--metrics-log', default=CrawlerConfig.metrics_log_path, help="이벤트 JSON 로그 경로")
+    parser.add_argument('--list-url', default=CrawlerConfig.list_url, help="학과공지 목록 주소")
+    parser.add_argument('--search-index', default=CrawlerConfig.search_index_path,
+                        help="검색 인덱스 경로 (빈 문자열이면 만들지 않음)")
+    parser.add_argument('--duplicates', choices=['link', 'skip', 'off'], default=CrawlerConfig.duplicate_policy,
+                        help="다시 올린(비슷한) 공지: link=원본 표시 / skip=저장 안 함 / off")
+    parser.add_argument('--dup-threshold', type=float, default=CrawlerConfig.duplicate_threshold,
+                        help="비슷한 공지로 볼 유사도 (0~1)")
+    parser.add_argument('--attempts', type=int, default=CrawlerConfig.fetch_attempts, help="페이지당 최대 시도 횟수")
+    parser.add_argument('--timeout', type=float, default=CrawlerConfig.fetch_timeout, help="요청 하나의 시간 상한 (초)")
+    parser.add_argument('--failed-list', default=CrawlerConfig.dead_letter_path, help="실패 목록 경로")
+
+def config_from_args(args, **overrides):
+    return CrawlerConfig(
+        fetch_backend=args.backend,
+        cache_mode=args.cache,
+        cache_dir=args.cache_dir,
+        detail_workers=args.workers,
+        max_requests_per_second=args.max_rps or None,
+        download_attachments=args.attachments,
+        attachment_dir=args.attachment_dir,
+        metrics_port=args.metrics_port,
+        metrics_log_path=args.metrics_log or None,
+        list_url=args.list_url,
+        search_index_path=args.search_index or None,
+        duplicate_policy=args.duplicates,
+        duplicate_threshold=args.dup_threshold,
+        fetch_attempts=args.attempts,
+        fetch_timeout=args.timeout,
+        dead_letter_path=args.failed_list,
+        **overrides,
+    )
+
+def run_full(args):
+    from .crawl_full import crawl_full
+    config = config_from_args(args, incremental=args.incremental,
+                              output_format=args.format, compress_output=args.compress)
+    crawl_full(Crawler(config))
+
+def run_date(args):
+    from .crawl_date import crawl_date_range
+    start_date = args.start
+    end_date = args.end or args.start
+    if end_date < start_date:
+        start_date, end_date = end_date, start_date
+    crawl_date_range(Crawler(config_from_args(args)), start_date, end_date)
+
+def run_boards(args):
+    from .boards import load_boards, get_boards
+    from .crawl_boards import crawl_boards
+    if args.board_file:
+        load_boards(args.board_file)
+    try:
+        boards = get_boards(args.names)
+    except KeyError as e:
+        raise SystemExit(f"[!] {e.args[0]}")
+    config = config_from_args(args, incremental=args.incremental,
+                              output_format=args.format, compress_output=args.compress)
+    crawl_boards(Crawler(config), boards)
+
+# 브라우저 렌더링 시간까지 응답 시간에 들어가므로 느린 응답 기준을 넉넉히 둔다.
+def run_latest(args):
+    from .crawl_latest import crawl_latest
+    config = config_from_args(args, fetch_backend='selenium', selenium_pool_size=args.pool_size,
+                              selenium_max_pages=args.driver_max_pages, target_latency=3.0)
+    crawl_latest(Crawler(config), max_pages=args.pages)
+
+def run_retry(args):
+    from .crawl_retry import retry_dead_letters
+    config = config_from_args(args, output_format=args.format, compress_output=args.compress)
+    retry_dead_letters(Crawler(config), max_attempts=args.max_attempts)
+
+def run_extract(args):
+    from .batch_extract import run_batch
+    run_batch(args.input, args.output, workers=args.workers, chunk_size=args.chunk_size, compress=args.compress,
+              attachment_dir=args.attachments, attachment_timeout=args.attachment_timeout)
+
+def run_export(args):
+    from .columnar import write_columnar, notice_months
+    from .notice_sink import read_records
+    start = time.perf_counter()
+    records = (record for path in args.inputs for record in read_records(path))
+    count = write_columnar(records, args.output, compress=args.compress)
+    months = notice_months(args.output)
+    print(f"✅ {count}개 공지 -> {args.output} ({len(months)}개월, {time.perf_counter() - start:.2f}s)")
+
+def run_index(args):
+    from .notice_sink import read_records
+    from .search_index import SearchIndex
+    with SearchIndex(args.index) as index:
+        for path in args.inputs:
+            for record in read_records(path):
+                index.add_record(record)
+        if args.optimize:
+            index.optimize()
+        print(f"✅ 검색 인덱스: {index.added}개 추가, 전체 {len(index)}개 ({args.index})")
+
+def run_search(args):
+    from .search_index import SearchIndex
+    with SearchIndex(args.index) as index:
+        start = time.perf_counter()
+        results = index.search(' '.join(args.query), category=args.category,
+                               deadline_from=args.deadline_from, deadline_to=args.deadline_to,
+                               event_from=args.event_from, event_to=args.event_to,
+                               posted_from=args.posted_from, posted_to=args.posted_to, limit=args.limit)
+        elapsed = time.perf_counter() - start
+    for result in results:
+        event = f"{result['행사시작']} ~ {result['행사끝']}" if result['행사시작'] else '-'
+        print(f"[{result['작성일'] or '-'}] ({result['카테고리']}) {result['제목']}  "
+              f"행사 {event}, 마감 {result['신청마감일'] or '-'}")
+    print(f"🔍 {len(results)}개 ({elapsed * 1000:.1f}ms)")
+
+# 저장된 결과 전체에서 비슷한 공지 묶음을 찾는다. (LSH 라 전체 쌍을 비교하지 않는다)
+def run_dupes(args):
+    from .near_dup import NearDuplicateIndex
+    from .notice_sink import read_records
+    groups = {}
+    count = 0
+    start = time.perf_counter()
+    with NearDuplicateIndex(':memory:', threshold=args.threshold) as index:
+        for path in args.inputs:
+            for record in read_records(path):
+                count += 1
+                title = record.get('제목', '')
+                key = f"{count}: {title} ({record.get('작성일', '')})"
+                match = index.check(key, record.get('본문', ''), title)
+                if match is not None:
+                    groups.setdefault(match.key, []).append((key, match.similarity))
+    elapsed = time.perf_counter() - start
+    for original, copies in groups.items():
+        print(f"📄 {original}")
+        for key, similarity in copies:
+            print(f"   ≈ {key} ({similarity:.2f})")
+    print(f"♻️ 공지 {count}개 중 {sum(map(len, groups.values()))}개가 비슷한 공지 ({len(groups)}묶음, {elapsed:.2f}s)")
+
+def build_parser(default_date=None):
+    parser = argparse.ArgumentParser(prog='notice_crawler', description="강원대 학과공지 크롤러")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    full = commands.add_parser('full', help="전체(증분) 크롤링")
+    add_crawl_options(full)
+    full.add_argument('--incremental', action='store_true',
+                      help="새로 올라온(바뀐) 공지만 받아 날짜별 파일로 저장 (기본: 처음부터 끝까지, 체크포인트로 재시작)")
+    full.add_argument('--format', choices=OUTPUT_FORMATS, default=CrawlerConfig.output_format)
+    full.add_argument('--compress', action='store_true', help="결과를 gzip 으로 저장")
+    full.set_defaults(func=run_full)
+
+    by_date = commands.add_parser('date', help="작성일 구간 크롤링 (양 끝 포함)")
+    add_crawl_options(by_date)
+    # default_date 를 주면 시작 날짜를 생략할 수 있다 (datd_crawling.py)
+    by_date.add_argument('start', type=parse_date, nargs='?' if default_date else None, default=default_date,
+                         help="시작 날짜 (YYYY-MM-DD)")
+    by_date.add_argument('end', type=parse_date, nargs='?', default=None, help="끝 날짜 (생략하면 하루만)")
+    by_date.set_defaults(func=run_date)
+
+    boards = commands.add_parser('boards', help="여러 게시판을 한 번에 크롤링 (세션/요청 속도 공유)")
+    add_crawl_options(boards)
+    boards.add_argument('names', nargs='*', help="게시판 이름 (생략하면 등록된 게시판 전부)")
+    boards.add_argument('--board-file', default=None, help='게시판 목록 JSON ({"이름": "목록 주소", ...})')
+    boards.add_argument('--incremental', action='store_true', help="이미 본 공지는 건너뛰기 (게시판마다 따로 멈춤)")
+    boards.add_argument('--format', choices=OUTPUT_FORMATS, default=CrawlerConfig.output_format)
+    boards.add_argument('--compress', action='store_true', help="결과를 gzip 으로 저장")
+    boards.set_defaults(func=run_boards)
+
+    latest = commands.add_parser('latest', help="최근 공지를 Selenium 으로 열어 필드 추출 결과 출력")
+    add_crawl_options(latest)
+    latest.add_argument('--pages', type=int, default=3, help="앞에서부터 볼 목록 페이지 수")
+    latest.add_argument('--pool-size', type=int, default=4, help="동시에 띄울 헤드리스 크롬 수")
+    latest.add_argument('--driver-max-pages', type=int, default=100,
+                        help="이만큼 페이지를 처리한 드라이버는 재시작 (메모리 누수 방지)")
+    latest.set_defaults(func=run_latest)
+
+    retry = commands.add_parser('retry', help="크롤링 중 끝내 실패한 공지(실패 목록)만 다시 받기")
+    add_crawl_options(retry)
+    retry.add_argument('--max-attempts', type=int, default=None, help="이만큼 실패한 공지는 건너뛰기")
+    retry.add_argument('--format', choices=OUTPUT_FORMATS, default=CrawlerConfig.output_format)
+    retry.add_argument('--compress', action='store_true', help="결과를 gzip 으로 저장")
+    retry.set_defaults(func=run_retry)
+
+    extract = commands.add_parser('extract', help="저장된 크롤링 결과에 extract_info 를 일괄 적용")
+    extract.add_argument('input', help="크롤링 결과 파일 (.csv / .jsonl, .gz 가능)")
+    extract.add_argument('-o', '--output', default='kangwon_notices_extracted.jsonl', help="결과 파일 (.csv / .jsonl)")
+    extract.add_argument('-w', '--workers', type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    extract.add_argument('--chunk-size', type=int, default=500, help="프로세스 하나에 넘기는 레코드 수")
+    extract.add_argument('--compress', action='store_true', help="결과를 gzip 으로 저장")
+    extract.add_argument('--attachments', default=None, metavar='DIR',
+                         help="첨부파일 저장소 폴더 (주면 받아 둔 HWP/PDF 글자도 같이 추출)")
+    extract.add_argument('--attachment-timeout', type=float, default=20, help="첨부파일 하나 추출 시간 상한 (초)")
+    extract.set_defaults(func=run_extract)
+
+    export = commands.add_parser('export', help="저장된 크롤링 결과를 Parquet/Arrow 컬럼 파일로 바꾸기 (달별 row group)")
+    export.add_argument('inputs', nargs='+', help="크롤링 결과 파일 (.csv / .jsonl, .gz 가능)")
+    export.add_argument('-o', '--output', default='kangwon_notices.parquet', help="결과 파일 (.parquet / .arrow)")
+    export.add_argument('--compress', action='store_true', help=".arrow 도 zstd 로 압축 (대신 mmap 으로 바로 읽지 못함)")
+    export.set_defaults(func=run_export)
+
+    index = commands.add_parser('index', help="저장된 크롤링 결과(CSV/JSONL)로 검색 인덱스 만들기")
+    index.add_argument('inputs', nargs='+', help="크롤링 결과 파일 (.csv / .jsonl, .gz 가능)")
+    index.add_argument('--index', default=CrawlerConfig.search_index_path, help="검색 인덱스 경로")
+    index.add_argument('--optimize', action='store_true', help="바뀐 공지의 예전 기록을 지우고 파일 줄이기")
+    index.set_defaults(func=run_index)
+
+    search = commands.add_parser('search', help="검색 인덱스에서 공지 찾기")
+    search.add_argument('query', nargs='*', help="검색어 (모두 들어간 공지, 생략하면 필드 조건만)")
+    search.add_argument('--index', default=CrawlerConfig.search_index_path, help="검색 인덱스 경로")
+    search.add_argument('--category', default=None, help="공모전 / 대외활동 / 비교과 / 기타")
+    search.add_argument('--deadline-from', type=parse_date, default=None, help="신청 마감일 이후")
+    search.add_argument('--deadline-to', type=parse_date, default=None, help="신청 마감일 이전")
+    search.add_argument('--event-from', type=parse_date, default=None, help="행사 기간이 이 날짜 이후와 겹침")
+    search.add_argument('--event-to', type=parse_date, default=None, help="행사 기간이 이 날짜 이전과 겹침")
+    search.add_argument('--posted-from', type=parse_date, default=None, help="작성일 이후")
+    search.add_argument('--posted-to', type=parse_date, default=None, help="작성일 이전")
+    search.add_argument('-n', '--limit', type=int, default=20)
+    search.set_defaults(func=run_search)
+
+    dupes = commands.add_parser('dupes', help="저장된 크롤링 결과에서 다시 올린(비슷한) 공지 찾기")
+    dupes.add_argument('inputs', nargs='+', help="크롤링 결과 파일 (.csv / .jsonl, .gz 가능)")
+    dupes.add_argument('--threshold', type=float, default=CrawlerConfig.duplicate_threshold,
+                       help="비슷한 공지로 볼 유사도 (0~1)")
+    dupes.set_defaults(func=run_dupes)
+    return parser
+
+def main(argv=None, default_date=None):
+    args = build_parser(default_date).parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+import json
+import os
+from collections import defaultdict
+from datetime import date
+
+from .notice_parser import parse_posted_date
+from .notice_extract import classify_category
+
+# ===== 컬럼 저장 (Parquet / Arrow IPC) =====
+# CSV 는 본문이 따옴표 칸 안에 통째로 들어 있어서 한 달치나 칸 하나만 보려 해도 파일 전체를 파싱해야 한다.
+# - 작성일/행사일/마감일은 date32, 첨부 링크는 list<string>, 카테고리/게시판은 dictionary 인코딩
+# - 작성월(YYYY-MM) 순으로 정렬해서 달마다 row group (Arrow 는 record batch) 하나로 쓴다.
+#   달 목록은 스키마 메타데이터(notice_months)에 넣어 두고, 읽을 때 필요한 달의 row group 만 memory map 으로 읽는다.
+# - .parquet: 항상 zstd 압축 / .arrow: Arrow IPC 파일 (compress=False 면 읽을 때 복사 없이 mmap)
+# pyarrow 가 있어야 한다. 없으면 CSV/JSONL 만 쓸 수 있다.
+COLUMNAR_FORMATS = ('parquet', 'arrow')
+MONTHS_KEY = b'notice_months'
+UNKNOWN_MONTH = 'unknown'   # 작성일을 못 읽은 공지 (맨 뒤)
+
+def require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Parquet/Arrow 로 저장하려면 pyarrow 를 설치해야 합니다. (pip install pyarrow)")
+    return pyarrow, pyarrow.parquet
+
+def columnar_format(path):
+    for fmt in COLUMNAR_FORMATS:
+        if path.endswith('.' + fmt):
+            return fmt
+    return None
+
+def _split_links(value):
+    if isinstance(value, list):
+        return value
+    return [link for link in (value or '').split(', ') if link]
+
+def _iso_date(value):
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return parse_posted_date(value)
+
+def _event_range(value):
+    if isinstance(value, str):
+        value = [part.strip() for part in value.split('~')]
+    value = [part for part in value or [] if part]
+    return (_iso_date(value[0]), _iso_date(value[-1])) if value else (None, None)
+
+# ===== 레코드 <-> 컬럼 =====
+# (레코드 칸, 컬럼 이름, 종류). 레코드에 없는 칸은 컬럼도 만들지 않는다. (날짜/신청마감일 등은 extract 결과에만 있다)
+FIELD_COLUMNS = [
+    ('게시판', 'board', 'category'),
+    ('제목', 'title', 'string'),
+    ('작성일', 'posted_date', 'date'),
+    ('카테고리', 'category', 'category'),
+    ('본문', 'body', 'string'),
+    ('문서파일 링크', 'doc_links', 'links'),
+    ('이미지파일 링크', 'img_links', 'links'),
+    ('중복 원본', 'duplicate_of', 'string'),
+    ('날짜', 'event_start', 'date'),       # 날짜 -> event_start, event_end 두 칸
+    ('장소', 'location', 'string'),
+    ('신청방법', 'apply_method', 'string'),
+    ('대상', 'target', 'string'),
+    ('신청마감일', 'deadline', 'date'),
+]
+ALWAYS_COLUMNS = {'title', 'posted_date', 'category', 'body', 'doc_links', 'img_links'}
+
+def _arrow_type(pa, kind):
+    return {
+        'string': pa.string(),
+        'date': pa.date32(),
+        'links': pa.list_(pa.string()),
+        'category': pa.dictionary(pa.int16(), pa.string()),
+    }[kind]
+
+# 레코드들을 (스키마 필드 목록, 컬럼 값 목록, 달 목록, 달별 행 수) 로. 작성월 순으로 정렬한다.
+def _to_columns(records):
+    present = set()
+    by_month = defaultdict(list)
+    for record in records:
+        present.update(record)
+        posted = _iso_date(record.get('작성일'))
+        by_month[posted.strftime('%Y-%m') if posted else UNKNOWN_MONTH].append((posted, record))
+
+    specs = [(key, name, kind) for key, name, kind in FIELD_COLUMNS if name in ALWAYS_COLUMNS or key in present]
+    months = sorted(month for month in by_month if month != UNKNOWN_MONTH)
+    if UNKNOWN_MONTH in by_month:
+        months.append(UNKNOWN_MONTH)
+
+    columns = defaultdict(list)
+    for month in months:
+        # 같은 달 안에서는 작성일 순 (row group 통계의 min/max 가 좁아진다)
+        for posted, record in sorted(by_month[month], key=lambda item: item[0] or date.min):
+            for key, name, kind in specs:
+                value = record.get(key)
+                if name == 'posted_date':
+                    value = posted
+                elif name == 'category':
+                    value = value or classify_category(f"{record.get('제목', '')}\n{record.get('본문', '')}")
+                elif name == 'event_start':
+                    start, end = _event_range(value)
+                    columns['event_end'].append(end)
+                    value = start
+                elif kind == 'date':
+                    value = _iso_date(value)
+                elif kind == 'links':
+                    value = _split_links(value)
+                else:
+                    value = value or None
+                columns[name].append(value)
+    return specs, columns, months, [len(by_month[month]) for month in months]
+
+def _build_table(records):
+    pa, _ = require_pyarrow()
+    specs, columns, months, counts = _to_columns(records)
+    fields = []
+    arrays = []
+    for key, name, kind in specs:
+        names = [name, 'event_end'] if name == 'event_start' else [name]
+        for column in names:
+            if kind == 'category':
+                array = pa.array(columns[column], type=pa.string()).dictionary_encode()
+                array = array.cast(_arrow_type(pa, kind))
+            else:
+                array = pa.array(columns[column], type=_arrow_type(pa, kind))
+            fields.append(pa.field(column, array.type))
+            arrays.append(array)
+    schema = pa.schema(fields, metadata={MONTHS_KEY: json.dumps(dict(zip(months, counts)))})
+    return pa.Table.from_arrays(arrays, schema=schema), months, counts
+
+# 공지 레코드(NoticeSink / read_records 형식)를 달별 row group 으로 저장. -> 저장한 공지 수
+def write_columnar(records, path, fmt=None, compress=False):
+    pa, pq = require_pyarrow()
+    fmt = fmt or columnar_format(path) or 'parquet'
+    table, months, counts = _build_table(records)
+    tmp_path = path + '.tmp'
+    offset = 0
+    if fmt == 'parquet':
+        with pq.ParquetWriter(tmp_path, table.schema, compression='zstd') as writer:
+            for count in counts:
+                writer.write_table(table.slice(offset, count), row_group_size=max(count, 1))
+                offset += count
+    else:
+        options = pa.ipc.IpcWriteOptions(compression='zstd' if compress else None)
+        with pa.OSFile(tmp_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            for count in counts:
+                writer.write_batch(table.slice(offset, count).combine_chunks().to_batches()[0])
+                offset += count
+    os.replace(tmp_path, path)
+    return table.num_rows
+
+# ===== 읽기 =====
+def notice_months(path):
+    pa, pq = require_pyarrow()
+    if columnar_format(path) == 'arrow':
+        with pa.memory_map(path) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata
+    else:
+        metadata = pq.read_schema(path, memory_map=True).metadata
+    return json.loads(metadata[MONTHS_KEY])
+
+# months: 'YYYY-MM' 또는 그 목록 (None 이면 전체), columns: 읽을 컬럼 (None 이면 전체) -> pyarrow.Table
+# 고른 달의 row group 만 memory map 으로 읽는다.
+def read_columnar(path, months=None, columns=None):
+    pa, pq = require_pyarrow()
+    all_months = list(notice_months(path))
+    if isinstance(months, str):
+        months = [months]
+    groups = range(len(all_months)) if months is None else [i for i, month in enumerate(all_months) if month in months]
+    if columnar_format(path) == 'arrow':
+        reader = pa.ipc.open_file(pa.memory_map(path))
+        table = pa.Table.from_batches([reader.get_batch(i) for i in groups], schema=reader.schema)
+        return table.select(columns) if columns is not None else table
+    return pq.ParquetFile(path, memory_map=True).read_row_groups(list(groups), columns=columns)
+
+# read_records 와 같은 dict 로 되돌린다. (링크는 ', ' 로 잇고, 작성일은 사이트 형식 YYYY.MM.DD)
+def iter_columnar_records(path, months=None):
+    table = read_columnar(path, months)
+    names = set(table.column_names)
+    for batch in table.to_batches():
+        for row in batch.to_pylist():
+            record = {}
+            for key, name, kind in FIELD_COLUMNS:
+                if name not in names:
+                    continue
+                value = row[name]
+                if name == 'event_start':
+                    value = [day.isoformat() for day in (value, row['event_end']) if day] or None
+                elif name == 'posted_date':
+                    value = value.strftime('%Y.%m.%d') if value else ''
+                elif kind == 'date':
+                    value = value.isoformat() if value else None
+                elif kind == 'links':
+                    value = ', '.join(value or [])
+                record[key] = value if value is not None or kind == 'date' else ''
+            yield record
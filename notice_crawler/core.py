@@ -0,0 +1,368 @@
+import threading
+
+from .notice_parser import list_url
+from .notice_http import create_session, create_cache, fetch_html, fetch_notice_list, fetch_notice_list_page
+from .notice_parser import parse_notice_detail
+from .notice_pipeline import crawl_pipeline, NO_LIMIT
+from .pacing import HostPacer
+from .seen_index import article_no_from_url
+from .notice_sink import NOTICE_FIELDS
+from .near_dup import DUPLICATE_FIELD
+from .resilience import RetryPolicy, PermanentFetchError, is_retryable
+from . import metrics
+
+# ===== 크롤러 설정 =====
+# 예전 crawling.py / datd_crawling.py 맨 위에 있던 설정값들. CrawlerConfig(detail_workers=8) 처럼 바꿔 쓴다.
+class CrawlerConfig:
+    # 대상 게시판
+    list_url = list_url
+    total_articles = None           # None 이면 목록 첫 페이지에서 읽는다
+    fallback_total_articles = 7206  # 목록에서 글 수를 못 읽을 때만 쓴다
+    articles_per_page = 10
+
+    # 백엔드: 'http' (기본, 실패한 페이지만 Selenium) 또는 'selenium'
+    fetch_backend = 'http'
+    selenium_pool_size = 2          # 동시에 띄울 헤드리스 크롬 수
+    selenium_max_pages = 200        # 이만큼 페이지를 처리한 드라이버는 재시작 (메모리 누수 방지)
+
+    # 응답 캐시: 'normal' / 'replay' (네트워크 없이 캐시만) / 'off'
+    cache_mode = 'normal'
+    cache_dir = '.http_cache'
+    cache_ttl = 24 * 3600           # 초
+
+    # 파이프라인
+    detail_workers = 4              # 본문 작업자 수 (동시 요청 수 상한)
+    max_pages_in_flight = 2         # 동시에 처리하는 리스트 페이지 수 (백프레셔)
+
+    # 요청 속도 (적응형, pacing 참고)
+    start_interval = 0.5            # 처음 요청 간격 (초)
+    min_interval = 0.2              # 서버가 빨라도 이보다 촘촘히 보내지 않음
+    max_backoff = 60                # 오류가 이어질 때 최대 간격 (초)
+    target_latency = 1.5            # 응답이 이보다 느려지면 동시 요청을 줄인다 (초)
+    max_requests_per_second = 5.0   # 모든 게시판/호스트를 합친 초당 요청 상한 (None 이면 호스트별 조절만)
+
+    # 첨부파일
+    download_attachments = False
+    attachment_dir = 'attachments'
+    attachment_workers = 4
+
+    # 검색 인덱스 (search_index 참고). None 이면 만들지 않는다
+    search_index_path = 'kangwon_notices_search.sqlite3'
+
+    # 비슷한 공지 (near_dup 참고)
+    # 'link': 저장하되 '중복 원본' 칸에 원본 공지를 적는다 / 'skip': 저장하지 않는다 / 'off': 찾지 않는다
+    # 기본은 'off' -> 저장 칸은 예전과 같다 (NOTICE_FIELDS)
+    duplicate_policy = 'off'
+    duplicate_threshold = 0.8       # MinHash 로 추정한 자카드 유사도가 이 이상이면 중복
+    duplicate_index_path = 'kangwon_notices_minhash.sqlite3'
+
+    # 실패 처리 (resilience 참고)
+    fetch_attempts = 3              # 페이지 하나를 최대 몇 번 받아 보는지
+    fetch_deadline = 30             # 페이지 하나에 쓰는 시간 상한 (재시도 포함, 초)
+    fetch_timeout = 10              # 요청 하나의 시간 상한 (초)
+    retry_base_delay = 1.0          # 재시도 간격 시작값 (초, 두 배씩 늘어난다)
+    breaker_failures = 5            # 한 호스트에서 연속 이만큼 실패하면 요청을 멈춘다
+    breaker_reset = 30              # 멈춘 뒤 시험 요청을 보내기까지 (초)
+    breaker_max_pause = 600         # 이보다 오래 멈춰 있으면 그 공지는 실패 목록으로 (초)
+    dead_letter_path = 'kangwon_notices_failed.sqlite3'
+
+    # 계측
+    metrics_log_path = 'crawl_metrics.jsonl'    # 이벤트 JSON 로그 (None 이면 안 남김)
+    metrics_port = None                         # 예: 9108 -> http://127.0.0.1:9108/metrics
+
+    # 전체 크롤링 (full)
+    incremental = False             # True 면 이미 본 공지는 건너뛰고, 한 페이지가 모두 본 공지면 멈춘다 (날짜별 파일)
+    index_path = 'kangwon_notices_index.sqlite3'
+    output_format = 'csv'           # 'csv', 'jsonl', 'parquet', 'arrow' (parquet/arrow 는 pyarrow 필요)
+    compress_output = False         # True 면 .gz 로 압축 저장
+    checkpoint_path = 'kangwon_notices_total.checkpoint.json'
+
+    def __init__(self, **overrides):
+        for name, value in overrides.items():
+            if not hasattr(type(self), name):
+                raise TypeError(f"알 수 없는 설정: {name}")
+            setattr(self, name, value)
+
+# ===== 크롤러 =====
+# 세션/캐시/속도 조절기/드라이버 풀/첨부파일 저장소는 처음 쓸 때 만든다.
+# 그래서 import 나 Crawler() 만으로는 브라우저도, 캐시 DB 도 열리지 않는다.
+class Crawler:
+    def __init__(self, config=None, **overrides):
+        self.config = config or CrawlerConfig(**overrides)
+        self._lock = threading.RLock()
+        self._resources = {}
+        self._totals = {}
+
+    def _lazy(self, name, factory):
+        with self._lock:
+            if name not in self._resources:
+                self._resources[name] = factory()
+            return self._resources[name]
+
+    @property
+    def pacer(self):
+        c = self.config
+        return self._lazy('pacer', lambda: HostPacer(
+            max_rate=c.max_requests_per_second,
+            start_delay=c.start_interval, min_delay=c.min_interval, max_delay=c.max_backoff,
+            max_concurrency=c.detail_workers, target_latency=c.target_latency))
+
+    @property
+    def session(self):
+        def make():
+            session = create_session(pool_size=max(10, self.config.detail_workers))
+            session.hooks['response'].append(self.pacer.observe)
+            return session
+        return self._lazy('session', make)
+
+    @property
+    def cache(self):
+        c = self.config
+        return self._lazy('cache', lambda: create_cache(c.cache_mode, c.cache_dir, ttl=c.cache_ttl))
+
+    @property
+    def driver_pool(self):
+        def make():
+            from .driver_pool import DriverPool
+            return DriverPool(size=self.config.selenium_pool_size, max_pages=self.config.selenium_max_pages)
+        return self._lazy('driver_pool', make)
+
+    @property
+    def attachments(self):
+        if not self.config.download_attachments:
+            return None
+        def make():
+            from .attachment_store import AttachmentStore
+            return AttachmentStore(self.config.attachment_dir, workers=self.config.attachment_workers, pacer=self.pacer)
+        return self._lazy('attachments', make)
+
+    @property
+    def search_index(self):
+        if not self.config.search_index_path:
+            return None
+        def make():
+            from .search_index import SearchIndex
+            return SearchIndex(self.config.search_index_path)
+        return self._lazy('search_index', make)
+
+    @property
+    def near_dups(self):
+        if self.config.duplicate_policy == 'off':
+            return None
+        def make():
+            from .near_dup import NearDuplicateIndex
+            return NearDuplicateIndex(self.config.duplicate_index_path, threshold=self.config.duplicate_threshold)
+        return self._lazy('near_dups', make)
+
+    @property
+    def retry(self):
+        c = self.config
+        return self._lazy('retry', lambda: RetryPolicy(
+            attempts=c.fetch_attempts, deadline=c.fetch_deadline, timeout=c.fetch_timeout,
+            base_delay=c.retry_base_delay, failure_threshold=c.breaker_failures,
+            reset_timeout=c.breaker_reset, max_pause=c.breaker_max_pause))
+
+    @property
+    def dead_letters(self):
+        def make():
+            from .dead_letters import DeadLetterQueue
+            return DeadLetterQueue(self.config.dead_letter_path)
+        return self._lazy('dead_letters', make)
+
+    @property
+    def replay(self):
+        return self.config.cache_mode == 'replay'
+
+    # ===== 공지 리스트 =====
+    # url 을 주지 않으면 config.list_url (여러 게시판은 scheduler 참고)
+    # HTTP 로 받은 빈 목록은 게시판 끝이다 (Selenium 으로 다시 열지 않는다).
+    # HTTP 요청이 다시 해도 안 되는 오류로 실패했을 때만 Selenium 으로 간다. replay 모드는 네트워크를 쓰지 않으므로 그대로 올린다.
+    def fetch_list(self, offset=0, url=None):
+        url = url or self.config.list_url
+        if self.config.fetch_backend == 'http':
+            fetch = lambda page_url, timeout: fetch_notice_list(
+                self.session, offset=offset, url=page_url, cache=self.cache, timeout=timeout)
+            try:
+                return self.retry.call(url, fetch, stage='list', slot=self.pacer.request)
+            except Exception as e:
+                # 서버가 응답하지 않는 것이면 Selenium 으로 가도 마찬가지다.
+                if self.replay or is_retryable(e):
+                    raise
+                print("[!] HTTP 리스트 요청 실패, Selenium 으로 재시도:", e)
+            metrics.inc('selenium_fallbacks', stage='list')
+        with self.pacer.request(url):
+            return self.fetch_list_selenium(offset, url)
+
+    def fetch_list_selenium(self, offset=0, url=None):
+        from .selenium_backend import scrape_notice_list
+        with self.driver_pool.driver() as driver:
+            return scrape_notice_list(driver, offset, url=url or self.config.list_url)
+
+    # 날짜 구간 탐색용: 마지막 페이지 뒤는 빈 목록이 정상이라 Selenium 으로 다시 시도하지 않는다.
+    def search_list(self, offset, url=None):
+        url = url or self.config.list_url
+        with self.pacer.request(url):
+            if self.config.fetch_backend == 'http':
+                return fetch_notice_list(self.session, offset=offset, url=url, cache=self.cache)
+            return self.fetch_list_selenium(offset, url)
+
+    # ===== 게시판 전체 글 수 =====
+    # 첫 페이지를 받아 (공지 목록, 전체 글 수) 를 돌려준다. 글 수를 못 읽으면 None
+    def probe_board(self, url=None):
+        url = url or self.config.list_url
+        with self.pacer.request(url):
+            notices, total = fetch_notice_list_page(self.session, offset=0, url=url, cache=self.cache,
+                                                    articles_per_page=self.config.articles_per_page)
+        if total is not None:
+            self._totals[url] = total
+        return notices, total
+
+    # config.total_articles 를 주면 그대로 쓰고, 아니면 목록 첫 페이지에서 읽는다. (게시판마다 한 번)
+    def total_articles(self, url=None):
+        url = url or self.config.list_url
+        if self.config.total_articles is not None:
+            return self.config.total_articles
+        if url not in self._totals:
+            try:
+                _, total = self.probe_board(url)
+            except Exception as e:
+                print("[!] 목록 첫 페이지 요청 실패:", e)
+                total = None
+            if total is None:
+                total = self.config.fallback_total_articles
+                print(f"[!] 게시판 글 수를 읽지 못해 {total}개로 가정: {url}")
+            self._totals[url] = total
+        return self._totals[url]
+
+    # ===== 공지 본문 =====
+    # (작성일, 본문, 문서 링크, 이미지 링크)
+    # 시간 초과/연결 오류/5xx 는 retry 가 다시 시도하고, 끝내 실패하면 예외가 올라간다. (빈 값으로 저장하지 않음)
+    # pacer 슬롯은 시도 한 번마다 잡는다. (fetch_list 도 같음 -> 호출 쪽에서 슬롯을 잡지 않는다)
+    def fetch_detail(self, url):
+        return self.retry.call(url, self._fetch_detail_once, slot=self.pacer.request)
+
+    def _fetch_detail_once(self, url, timeout):
+        if self.config.fetch_backend == 'http':
+            html = fetch_html(self.session, url, timeout=timeout, cache=self.cache)
+            result = parse_notice_detail(html, page_url=url)
+            if result is not None:
+                return result
+            if self.replay:
+                raise PermanentFetchError(f"replay 모드라 Selenium 으로 재시도하지 않음: {url}")
+            print("[!] HTTP 본문 파싱 실패, Selenium 으로 재시도:", url)
+            metrics.inc('selenium_fallbacks', stage='detail')
+        return self.fetch_detail_selenium(url, timeout)
+
+    def fetch_detail_selenium(self, url, timeout=10):
+        from .selenium_backend import scrape_notice_detail
+        with self.driver_pool.driver() as driver:
+            return scrape_notice_detail(driver, url, timeout=timeout)
+
+    # ===== 비슷한 공지 =====
+    # 이미 저장한 공지 중 비슷한 것이 있으면 near_dup.Match, 없으면 None (새 공지는 색인에 넣는다)
+    def find_duplicate(self, notice, content):
+        index = self.near_dups
+        if index is None:
+            return None
+        match = index.check(article_no_from_url(notice['url']), content, notice['title'])
+        if match is not None:
+            print(f"♻️ 비슷한 공지 ({match.similarity:.2f}): {notice['title']} ≈ {match.title}")
+        return match
+
+    # 저장 칸: 'link' 면 '중복 원본' 칸을 붙인다.
+    @property
+    def output_fields(self):
+        if self.config.duplicate_policy == 'link':
+            return NOTICE_FIELDS + [DUPLICATE_FIELD]
+        return NOTICE_FIELDS
+
+    # ===== 파이프라인 실행 =====
+    # 리스트/본문을 동시에 가져오되 요청 속도는 pacer 가 조절한다 (서버 부하 방지)
+    # 슬롯은 fetch_list/fetch_detail 이 시도마다 잡으므로 파이프라인에서는 잡지 않는다.
+    # list_page_url(offset): 못 받은 리스트 페이지를 실패 목록에 남길 주소 (여러 게시판은 scheduler 참고)
+    async def run(self, offsets, on_notice, select_notices=None, on_page_done=None, fetch_list=None,
+                  limit_url=None, list_page_url=None):
+        from .dead_letters import list_page_url as default_list_page_url
+        dead_letters = self.dead_letters
+        if list_page_url is None:
+            list_page_url = lambda offset: default_list_page_url(self.config.list_url, offset)
+
+        # 예전에 실패했던 공지를 이번에 받았으면 실패 목록에서 뺀다.
+        def on_fetched(offset, idx, notice, result):
+            dead_letters.discard(notice['url'])
+            return on_notice(offset, idx, notice, result)
+
+        def on_detail_failed(offset, idx, notice, error):
+            dead_letters.add(notice, error)
+
+        def on_list_failed(offset, error):
+            dead_letters.add_list_page(list_page_url(offset), error)
+
+        await crawl_pipeline(
+            offsets, self.session, on_fetched,
+            detail_workers=self.config.detail_workers,
+            max_pages_in_flight=self.config.max_pages_in_flight,
+            url=self.config.list_url,
+            limiter=NO_LIMIT,
+            fetch_list=fetch_list or self.fetch_list,
+            fetch_detail=self.fetch_detail,
+            select_notices=select_notices,
+            on_page_done=on_page_done,
+            limit_url=limit_url,
+            on_detail_failed=on_detail_failed,
+            on_list_failed=on_list_failed,
+        )
+
+    # ===== 계측 =====
+    def start_metrics(self, command, **fields):
+        if self.config.metrics_log_path:
+            metrics.registry.open_log(self.config.metrics_log_path)
+        if self.config.metrics_port:
+            metrics.registry.serve(self.config.metrics_port)
+            print(f"📊 메트릭: http://127.0.0.1:{self.config.metrics_port}/metrics")
+        metrics.event('run_started', command=command, **fields)
+
+    # 만들어 둔 자원만 정리하고 요약을 출력한다.
+    def close(self):
+        resources = self._resources
+        if 'driver_pool' in resources:
+            resources['driver_pool'].close()  # 띄워둔 크롬은 모두 quit()
+        store = resources.get('attachments')
+        if store is not None:
+            store.close()  # 받고 있던 첨부파일은 끝까지 받는다
+            print(f"📎 첨부파일: 새로 저장 {store.downloaded}, 내용 중복 {store.duplicates}, "
+                  f"이미 받음 {store.skipped}, 실패 {store.failed}")
+        near_dups = resources.get('near_dups')
+        if near_dups is not None:
+            print(f"♻️ 비슷한 공지 색인: {len(near_dups)}개")
+            near_dups.close()
+        search_index = resources.get('search_index')
+        if search_index is not None:
+            search_index.close()
+            print(f"🔍 검색 인덱스: 이번에 {search_index.added}개 추가 ({search_index.path})")
+        cache = resources.get('cache')
+        if cache is not None:
+            print(f"🗄️ 응답 캐시: 적중 {cache.hits}, 재검증 {cache.revalidated}, 새로 받음 {cache.misses}")
+            cache.close()
+        if 'session' in resources:
+            resources['session'].close()
+        dead_letters = resources.get('dead_letters')
+        if dead_letters is not None:
+            if len(dead_letters):
+                print(f"🪦 실패 목록: {len(dead_letters)}개 (이번에 {dead_letters.added}개) -> "
+                      f"python -m notice_crawler retry ({dead_letters.path})")
+            dead_letters.close()
+        if 'retry' in resources:
+            print(f"🔌 회로 차단기: {resources['retry'].summary()}")
+        if 'pacer' in resources:
+            print(f"⏱️ 요청 속도: {resources['pacer'].summary()}")
+        metrics.event('run_finished', **metrics.registry.snapshot())
+        print(metrics.registry.summary())
+        metrics.registry.close_log()
+        resources.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,88 @@
+import asyncio
+from datetime import datetime
+
+from .scheduler import BoardScheduler
+from .seen_index import SeenIndex
+from .notice_sink import NoticeSink
+from .near_dup import DUPLICATE_FIELD
+from . import metrics
+
+# ===== 여러 게시판 크롤링 =====
+# crawl_full 과 같지만 게시판 여러 개를 한 번에 돈다. 결과는 파일 하나에 '게시판' 칸을 붙여 저장.
+# 증분 모드에서는 게시판마다 따로 멈춘다. (한 페이지가 모두 본 공지인 게시판만 그만 가져온다)
+def crawl_boards(crawler, boards):
+    config = crawler.config
+    incremental = config.incremental
+    boards = list(boards)
+    crawler.start_metrics('boards', boards=[board.name for board in boards], incremental=incremental)
+    seen_index = SeenIndex(config.index_path)
+    print(f"📚 인덱스에 저장된 공지: {len(seen_index)}개, 게시판 {len(boards)}개")
+
+    # 증분 모드 파일은 같은 날 다시 돌리면 이어쓴다 (crawl_full 과 같음)
+    suffix = f"new_{datetime.now().strftime('%Y%m%d')}" if incremental else 'total'
+    sink = NoticeSink(f"kangwon_boards_{suffix}.{config.output_format}", fmt=config.output_format,
+                      compress=config.compress_output, append=incremental,
+                      fieldnames=['게시판'] + crawler.output_fields)
+    scheduler = BoardScheduler(crawler, boards)
+
+    def select_notices(board, offset, notices):
+        if not incremental:
+            return notices
+        to_fetch = [notice for notice in notices if seen_index.needs_fetch(notice)]
+        if notices and not to_fetch:
+            print(f"⏹️ {board.name} offset {offset}: 모두 이미 수집한 공지 -> 이 게시판은 종료")
+            return None
+        return to_fetch
+
+    attachments = crawler.attachments
+    search_index = crawler.search_index
+
+    def on_notice(board, offset, idx, notice, result):
+        title = notice['title']
+        date, content, doc_links, img_links = result
+
+        status = seen_index.check(notice, date, content, doc_links, img_links)
+        metrics.inc('notices_checked', status=status, board=board.name)
+        if incremental and status == 'unchanged':
+            print(f"➖ 변경 없음: [{board.name}] {title}")
+            return
+
+        # 여러 게시판에 같이 올린 공지 -> 'skip' 이면 처음 본 게시판 것만 남긴다
+        duplicate = crawler.find_duplicate(notice, content)
+        if duplicate is not None and config.duplicate_policy == 'skip':
+            seen_index.record(notice, date, content, doc_links, img_links)
+            return
+
+        record = {
+            '게시판': board.name,
+            '제목': title,
+            '작성일': date,
+            '본문': content,
+            '문서파일 링크': ', '.join(doc_links),
+            '이미지파일 링크': ', '.join(img_links)
+        }
+        if duplicate is not None:
+            record[DUPLICATE_FIELD] = f"{duplicate.title} ({duplicate.key})"
+        sink.write(record)
+        # 파일에 쓴(flush) 뒤에야 인덱스에 남긴다
+        seen_index.record(notice, date, content, doc_links, img_links)
+        if attachments is not None:
+            attachments.submit(doc_links + img_links)
+        if search_index is not None:
+            search_index.add_notice(notice, date, content)
+
+        metrics.event('notice_saved', board=board.name, offset=offset, idx=idx, url=notice['url'], status=status)
+        print(f"✅ 크롤링 완료: [{board.name}] {title} ({offset+idx}/{scheduler.totals[board]})")
+
+    try:
+        scheduler.resolve_totals()
+        asyncio.run(scheduler.run(on_notice, select_notices=select_notices))
+    except KeyboardInterrupt:
+        print("\n⛔ 사용자 중단 - 지금까지 수집한 공지만 저장됩니다.")
+    finally:
+        crawler.close()
+        seen_index.close()
+        sink.close()
+
+    print(f"\n✅ 크롤링 종료! 게시판 {len(boards)}개에서 {sink.count}개 저장: {sink.path}")
+    return sink.count
@@ -0,0 +1,100 @@
+import asyncio
+
+from .date_range import ListPageCache, ListDateUnavailable, find_offset_range, in_range, to_date
+from .notice_sink import NoticeSink
+from .near_dup import DUPLICATE_FIELD
+from . import metrics
+
+# 작성일 2025.04.28 -> 25.04.28 (출력용)
+def short_date(full_date):
+    if len(full_date) == 10 and full_date.count('.') == 2:
+        return full_date[2:]
+    return full_date
+
+# ===== 날짜 구간 크롤링 =====
+# 목록 페이지 작성일로 이진 탐색 -> 구간이 걸친 페이지만 가져온다.
+# 목록에서 날짜를 못 읽으면 예전처럼 처음부터 본문 날짜를 보며 내려간다.
+def crawl_date_range(crawler, start_date, end_date):
+    config = crawler.config
+    crawler.start_metrics('date', start_date=start_date, end_date=end_date)
+
+    # 찾은 공지는 바로바로 CSV 에 기록
+    if start_date == end_date:
+        output_filename = f"kangwon_notices_{start_date.strftime('%y%m%d')}.csv"
+    else:
+        output_filename = f"kangwon_notices_{start_date.strftime('%y%m%d')}_{end_date.strftime('%y%m%d')}.csv"
+    sink = NoticeSink(output_filename, fieldnames=crawler.output_fields)
+
+    total_articles = crawler.total_articles()
+    pages = ListPageCache(crawler.search_list)
+    try:
+        with metrics.timer('date_range_search'):
+            offsets = find_offset_range(pages, start_date, end_date, total_articles, config.articles_per_page)
+        linear_scan = False
+        print(f"🔎 목록 {pages.requests}페이지만 보고 구간 확인: offset {offsets.start} ~ {offsets.stop} "
+              f"({len(offsets)}페이지)")
+    except ListDateUnavailable as e:
+        print("[!] 목록 작성일로 탐색할 수 없어 순차 탐색으로 진행:", e)
+        offsets = range(0, total_articles, config.articles_per_page)
+        linear_scan = True
+
+    def select_notices(offset, notices):
+        if linear_scan:
+            return notices
+        # 목록 날짜가 구간 밖인 공지는 본문을 열지 않는다. (날짜를 못 읽은 행은 본문에서 확인)
+        return [notice for notice in notices
+                if notice.get('date') is None or in_range(notice['date'], start_date, end_date)]
+
+    attachments = crawler.attachments
+    search_index = crawler.search_index
+
+    def on_notice(offset, idx, notice, result):
+        title = notice['title']
+        full_date, content, doc_links, img_links = result
+        posted = to_date(full_date)
+
+        if posted is not None and start_date <= posted <= end_date:
+            duplicate = crawler.find_duplicate(notice, content)
+            if duplicate is not None and config.duplicate_policy == 'skip':
+                metrics.inc('notices_skipped')
+                print(f"❌ [{offset+idx}] {title} ({short_date(full_date)}) - 다시 올린 공지라 건너뜀")
+                return False
+            record = {
+                '제목': title,
+                '작성일': full_date,
+                '본문': content,
+                '문서파일 링크': ', '.join(doc_links),
+                '이미지파일 링크': ', '.join(img_links)
+            }
+            if duplicate is not None:
+                record[DUPLICATE_FIELD] = f"{duplicate.title} ({duplicate.key})"
+            sink.write(record)
+            if attachments is not None:
+                attachments.submit(doc_links + img_links)
+            if search_index is not None:
+                search_index.add_notice(notice, full_date, content)
+            metrics.inc('notices_saved')
+            metrics.event('notice_saved', offset=offset, idx=idx, url=notice['url'], date=full_date)
+            print(f"✅ [{offset+idx}] {title} ({short_date(full_date)}) - 크롤링됨")
+        elif linear_scan and posted is not None and posted < start_date:
+            return True  # 더 오래된 공지 -> 새 페이지는 그만 가져온다
+        else:
+            metrics.inc('notices_skipped')
+            print(f"❌ [{offset+idx}] {title} ({short_date(full_date)}) - 건너뜀")
+        return False
+
+    try:
+        asyncio.run(crawler.run(
+            offsets, on_notice,
+            select_notices=select_notices,
+            # 탐색하며 받아 둔 목록 페이지는 다시 요청하지 않는다
+            fetch_list=lambda offset: pages.pop(offset) or crawler.fetch_list(offset),
+        ))
+    except KeyboardInterrupt:
+        print("\n⛔ 사용자 중단 - 지금까지 수집한 공지만 저장됩니다.")
+    finally:
+        crawler.close()
+        sink.close()
+
+    print(f"\n✅ {start_date} ~ {end_date} 공지 {sink.count}개 크롤링 완료! CSV 저장됨: {output_filename}")
+    return sink.count
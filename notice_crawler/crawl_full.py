@@ -0,0 +1,103 @@
+import asyncio
+from datetime import datetime
+
+from .seen_index import SeenIndex
+from .notice_sink import NoticeSink, Checkpoint
+from .near_dup import DUPLICATE_FIELD
+from . import metrics
+
+# ===== 전체 크롤링 =====
+# - 증분 모드: 인덱스에 없는(또는 바뀐) 공지만 받아서 날짜별 파일로 저장, 한 페이지가 모두 본 공지면 멈춤
+# - 전체 모드: 처음부터 끝까지 받아서 kangwon_notices_total.* 에 저장, 리스트 페이지 단위 체크포인트로 재시작
+def crawl_full(crawler):
+    config = crawler.config
+    incremental = config.incremental
+    total_articles = crawler.total_articles()
+    crawler.start_metrics('full', incremental=incremental)
+    seen_index = SeenIndex(config.index_path)
+    print(f"📚 인덱스에 저장된 공지: {len(seen_index)}개")
+
+    # 증분 모드에서는 이번에 새로 받은/바뀐 공지만 날짜별 파일로 저장
+    # 같은 날 여러 번 돌리면 앞 실행 결과 뒤에 이어쓴다. (앞에서 받은 공지는 인덱스에 있어서 다시 받지 않는다)
+    if incremental:
+        output_filename = f"kangwon_notices_new_{datetime.now().strftime('%Y%m%d')}.{config.output_format}"
+        checkpoint = None
+        start_offset = 0
+    else:
+        output_filename = f"kangwon_notices_total.{config.output_format}"
+        checkpoint = Checkpoint(config.checkpoint_path, step=config.articles_per_page)
+        start_offset = checkpoint.next_offset
+        if checkpoint.resumed:
+            print(f"↩️ 체크포인트에서 이어서 크롤링: offset {start_offset}")
+
+    sink = NoticeSink(output_filename, fmt=config.output_format, compress=config.compress_output,
+                      append=incremental or checkpoint.resumed, fieldnames=crawler.output_fields)
+
+    def select_notices(offset, notices):
+        if not incremental:
+            return notices
+        to_fetch = [notice for notice in notices if seen_index.needs_fetch(notice)]
+        if notices and not to_fetch:
+            print(f"⏹️ offset {offset}: 모두 이미 수집한 공지 -> 증분 크롤링 종료")
+            return None
+        return to_fetch
+
+    attachments = crawler.attachments
+    search_index = crawler.search_index
+
+    def on_notice(offset, idx, notice, result):
+        title = notice['title']
+        date, content, doc_links, img_links = result
+
+        status = seen_index.check(notice, date, content, doc_links, img_links)
+        metrics.inc('notices_checked', status=status)
+        if incremental and status == 'unchanged':
+            print(f"➖ 변경 없음: {title}")
+            return
+
+        # 다시 올린 공지 -> 'skip' 이면 저장/첨부파일/검색 색인 모두 건너뛴다
+        duplicate = crawler.find_duplicate(notice, content)
+        if duplicate is not None and config.duplicate_policy == 'skip':
+            seen_index.record(notice, date, content, doc_links, img_links)
+            return
+
+        record = {
+            '제목': title,
+            '작성일': date,
+            '본문': content,
+            '문서파일 링크': ', '.join(doc_links),
+            '이미지파일 링크': ', '.join(img_links)
+        }
+        if duplicate is not None:
+            record[DUPLICATE_FIELD] = f"{duplicate.title} ({duplicate.key})"
+        sink.write(record)
+        # 파일에 쓴(flush) 뒤에야 인덱스에 남긴다
+        seen_index.record(notice, date, content, doc_links, img_links)
+        if attachments is not None:
+            attachments.submit(doc_links + img_links)
+        if search_index is not None:
+            search_index.add_notice(notice, date, content)
+
+        metrics.event('notice_saved', offset=offset, idx=idx, url=notice['url'], status=status)
+        print(f"✅ 크롤링 완료: {title} ({offset+idx}/{total_articles})")
+
+    finished = False
+    try:
+        asyncio.run(crawler.run(
+            range(start_offset, total_articles, config.articles_per_page), on_notice,
+            select_notices=select_notices,
+            on_page_done=checkpoint.mark_done if checkpoint else None,
+        ))
+        finished = True
+    except KeyboardInterrupt:
+        print("\n⛔ 사용자 중단 - 다음 실행 때 체크포인트부터 이어서 크롤링합니다.")
+    finally:
+        crawler.close()
+        seen_index.close()
+        sink.close()
+
+    if finished and checkpoint is not None:
+        checkpoint.clear()
+
+    print(f"\n✅ 크롤링 종료! 이번 실행에서 {sink.count}개 저장: {sink.path}")
+    return sink.count
@@ -0,0 +1,64 @@
+import re
+
+from .selenium_backend import iter_notice_list, scrape_notice_detail
+from .notice_extract import extract_info
+from . import metrics
+
+# ===== 최근 공지 필드 추출 (Selenium) =====
+# 목록 앞쪽 max_pages 페이지의 공지를 브라우저로 열어 extract_info 결과를 바로 출력한다. (파일로 저장하지 않음)
+# 목록은 iter_notice_list 가 페이지를 넘기며 하나씩 내주고, 본문은 드라이버 풀(pool.map)로 동시에 받는다.
+# 요청 속도는 crawler.pacer 가 조절한다.
+
+# 상세 페이지 제목 칸이 '[공지]' 뿐인 고정 공지는 건너뛴다.
+PINNED_TITLE_RE = re.compile(r"\[?공지\]?")
+
+def print_info(i, info):
+    print(f"🔹 [{i}] {info['제목']}")
+    print(f"📅 날짜: {info['날짜'][0]} ~ {info['날짜'][1]}" if info['날짜'] and len(info['날짜']) == 2 else f"📅 날짜: {info['날짜'][0]}" if info['날짜'] else "📅 날짜: 없음")
+    print(f"📍 장소: {info['장소'] if info['장소'] else '없음'}")
+    print(f"👤 대상: {info['대상'] if info['대상'] else '없음'}")
+    print(f"📬 신청방법: {info['신청방법'] if info['신청방법'] else '없음'}")
+    print(f"⏳ 신청마감일: {info['신청마감일'] if info['신청마감일'] else '없음'}")
+    print(f"🏷️ 카테고리: {info['카테고리']}")
+    print("-" * 60 + "\n")
+
+def crawl_latest(crawler, max_pages=3):
+    from selenium.webdriver.common.by import By
+
+    config = crawler.config
+    pacer = crawler.pacer
+    crawler.start_metrics('latest', max_pages=max_pages)
+
+    # 풀의 드라이버 하나로 공지 하나를 처리. 건너뛸 공지는 None
+    def notice_info(driver, notice):
+        with pacer.request(notice['url'], measure=True):
+            posted_date, content, _, _ = scrape_notice_detail(driver, notice['url'], timeout=config.fetch_timeout)
+        titles = driver.find_elements(By.CSS_SELECTOR, 'p.b-title-box span')
+        title = titles[0].text.strip() if titles else notice['title']
+        if PINNED_TITLE_RE.fullmatch(title):
+            return None
+        return extract_info(title, content, posted_date=posted_date)
+
+    def safe_notice_info(driver, notice):
+        try:
+            return notice_info(driver, notice), None
+        except Exception as e:
+            return None, e
+
+    pool = crawler.driver_pool
+    notices = iter_notice_list(pool, max_pages=max_pages, url=config.list_url,
+                               articles_per_page=config.articles_per_page, pacer=pacer)
+    count = 0
+    try:
+        for info, error in pool.map(safe_notice_info, notices):
+            if error is not None:
+                metrics.inc('failures', stage='detail')
+                print(f"[!] [{count + 1}] 크롤링 실패: {error}")
+            elif info is not None:
+                count += 1
+                print_info(count, info)
+    except KeyboardInterrupt:
+        print("\n⛔ 사용자 중단")
+    finally:
+        crawler.close()
+    return count
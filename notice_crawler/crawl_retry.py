@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+
+from .seen_index import SeenIndex
+from .dead_letters import parse_list_page_url
+from .notice_sink import NoticeSink
+from .near_dup import DUPLICATE_FIELD
+from . import metrics
+
+# ===== 실패한 공지 다시 받기 =====
+# 크롤링 중 재시도까지 모두 실패해 실패 목록(dead_letters)에 남은 공지만 다시 받는다.
+# 받은 공지는 kangwon_notices_retry_YYYYMMDD.* 에 저장하고 인덱스/검색 색인에 넣은 뒤 목록에서 뺀다.
+# 또 실패하면 목록에 남고 시도 횟수만 늘어난다. max_attempts 번 넘게 실패한 공지는 건너뛴다.
+# 리스트 페이지가 남아 있으면 그 페이지부터 다시 받고, 아직 인덱스에 없는 공지의 본문을 이어서 받는다.
+def retry_dead_letters(crawler, max_attempts=None):
+    config = crawler.config
+    dead_letters = crawler.dead_letters
+    entries = dead_letters.entries(max_attempts)
+    crawler.start_metrics('retry', entries=len(entries))
+    print(f"🪦 실패 목록: {len(dead_letters)}개 중 {len(entries)}개를 다시 받습니다")
+    if not entries:
+        crawler.close()
+        return 0
+
+    seen_index = SeenIndex(config.index_path)
+    sink = NoticeSink(f"kangwon_notices_retry_{datetime.now().strftime('%Y%m%d')}.{config.output_format}",
+                      fmt=config.output_format, compress=config.compress_output, append=True,
+                      fieldnames=crawler.output_fields)
+    attachments = crawler.attachments
+    search_index = crawler.search_index
+
+    # 요청 속도는 fetch_list/fetch_detail 이 시도마다 pacer 로 조절한다
+    def fetch(notice):
+        page = parse_list_page_url(notice['url'])
+        if page is not None:
+            return crawler.fetch_list(page[1], url=page[0])
+        return crawler.fetch_detail(notice['url'])
+
+    def save(notice, result):
+        date, content, doc_links, img_links = result
+        duplicate = crawler.find_duplicate(notice, content)
+        if duplicate is not None and config.duplicate_policy == 'skip':
+            seen_index.record(notice, date, content, doc_links, img_links)
+            dead_letters.discard(notice['url'])
+            return
+        record = {
+            '제목': notice['title'],
+            '작성일': date,
+            '본문': content,
+            '문서파일 링크': ', '.join(doc_links),
+            '이미지파일 링크': ', '.join(img_links)
+        }
+        if duplicate is not None:
+            record[DUPLICATE_FIELD] = f"{duplicate.title} ({duplicate.key})"
+        sink.write(record)
+        seen_index.record(notice, date, content, doc_links, img_links)
+        dead_letters.discard(notice['url'])
+        if attachments is not None:
+            attachments.submit(doc_links + img_links)
+        if search_index is not None:
+            search_index.add_notice(notice, date, content)
+        metrics.event('notice_saved', url=notice['url'], status='retried')
+        print(f"✅ 다시 받음: {notice['title']} (실패 {notice['attempts']}번 뒤)")
+
+    failed = 0
+    # with 블록으로 두면 Ctrl-C 때 줄 서 있는 공지를 모두 받을 때까지 빠져나가지 못한다
+    pool = ThreadPoolExecutor(max_workers=config.detail_workers)
+    try:
+        futures = {pool.submit(fetch, notice): notice for notice in entries}
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                notice = futures.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"[!] 또 실패: {notice['url']} ({e})")
+                    metrics.inc('failures', stage='retry')
+                    dead_letters.add(notice, e)
+                    failed += 1
+                    continue
+                if parse_list_page_url(notice['url']) is None:
+                    save(notice, result)
+                    continue
+                # 리스트 페이지 -> 아직 받지 않은 공지 본문을 이어서 받는다
+                to_fetch = [dict(item, attempts=notice['attempts']) for item in result
+                            if seen_index.needs_fetch(item)]
+                print(f"📋 목록 다시 받음: {notice['url']} (본문 {len(to_fetch)}개)")
+                dead_letters.discard(notice['url'])
+                for item in to_fetch:
+                    futures[pool.submit(fetch, item)] = item
+    except KeyboardInterrupt:
+        print("\n⛔ 사용자 중단 - 받지 못한 공지는 실패 목록에 남습니다.")
+        pool.shutdown(cancel_futures=True)   # 줄 서 있는 공지는 취소하고 돌고 있는 요청만 기다린다
+    finally:
+        pool.shutdown()
+        crawler.close()
+        seen_index.close()
+        sink.close()
+
+    print(f"\n✅ 다시 받기 종료! {sink.count}개 저장 ({sink.path}), 여전히 실패 {failed}개")
+    return sink.count
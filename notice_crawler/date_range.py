@@ -0,0 +1,89 @@
+from datetime import date, datetime
+
+from .notice_parser import parse_posted_date
+
+# ===== 날짜 구간 크롤링 =====
+# 목록은 최신순이라 offset 이 커질수록 작성일이 작아진다 (같은 날짜는 여러 페이지에 걸칠 수 있음).
+# 목록 행의 작성일만 보고 [start, end] 구간이 걸친 페이지를 이진 탐색으로 찾은 뒤
+# 그 페이지들만, 그중에서도 구간 안 공지의 본문만 가져온다.
+def to_date(value):
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return parse_posted_date(str(value))
+
+def in_range(value, start, end):
+    day = to_date(value)
+    return day is not None and start <= day <= end
+
+# 목록 행에서 작성일을 못 읽거나 목록 요청이 실패하면 이진 탐색을 할 수 없으므로
+# 호출 쪽이 순차 탐색으로 돌아가게 한다.
+class ListDateUnavailable(Exception):
+    pass
+
+class ListPageCache:
+    def __init__(self, fetch_list):
+        self.fetch_list = fetch_list
+        self.pages = {}
+        self.requests = 0
+
+    def get(self, offset):
+        if offset not in self.pages:
+            self.requests += 1
+            try:
+                self.pages[offset] = self.fetch_list(offset) or []
+            except Exception as e:
+                raise ListDateUnavailable(f"offset {offset} 목록 요청 실패 ({e})") from e
+        return self.pages[offset]
+
+    # 파이프라인에서는 탐색 때 받아 둔 페이지를 한 번만 재사용한다. 없으면 None
+    def pop(self, offset):
+        return self.pages.pop(offset, None)
+
+    # (가장 최근 날짜, 가장 오래된 날짜). 빈 페이지(마지막 페이지 뒤)는 None
+    def bounds(self, offset):
+        notices = self.get(offset)
+        if not notices:
+            return None
+        days = [to_date(notice.get('date')) for notice in notices]
+        days = [day for day in days if day is not None]
+        if not days:
+            raise ListDateUnavailable(f"offset {offset} 목록에서 작성일을 읽지 못함")
+        return max(days), min(days)
+
+# pred 가 처음으로 True 가 되는 페이지 번호 (lo <= i < hi). 없으면 hi
+def _first_page(lo, hi, pred):
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if pred(mid):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+# [start, end] 공지가 있는 목록 페이지 offset 범위를 돌려준다. 겹치는 페이지가 없으면 빈 range
+def find_offset_range(pages, start, end, total_articles, articles_per_page=10):
+    start, end = to_date(start), to_date(end)
+    if start > end:
+        start, end = end, start
+    n_pages = -(-total_articles // articles_per_page)
+
+    def offset(i):
+        return i * articles_per_page
+
+    # 가장 오래된 글이 end 이하인 첫 페이지 (앞쪽 페이지는 모두 end 보다 최신)
+    def reaches_end(i):
+        bounds = pages.bounds(offset(i))
+        return bounds is None or bounds[1] <= end
+
+    # 가장 최근 글도 start 보다 오래된 첫 페이지 (여기부터는 볼 필요 없음)
+    def past_start(i):
+        bounds = pages.bounds(offset(i))
+        return bounds is None or bounds[0] < start
+
+    first = _first_page(0, n_pages, reaches_end)
+    stop = _first_page(first, n_pages, past_start)
+    return range(offset(first), offset(stop), articles_per_page)
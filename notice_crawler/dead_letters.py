@@ -0,0 +1,78 @@
+import sqlite3
+from datetime import datetime
+from urllib.parse import urlsplit, parse_qs
+
+# ===== 실패한 공지 목록 (dead-letter queue) =====
+# 재시도까지 모두 실패한 본문 URL 을 남겨 두고 나중에 `python -m notice_crawler retry` 로 다시 받는다.
+# 예전에는 실패한 공지가 '(작성일 없음)' / '(본문 없음)' 으로 CSV 에 그대로 들어갔다.
+# 다음 크롤링에서 받아지면 목록에서 빠진다.
+# 리스트 페이지를 끝내 못 받은 경우에는 그 페이지 주소(?article.offset=N)를 남긴다. retry 가 목록부터 다시 받는다.
+LIST_PAGE_TITLE = '(목록 페이지)'
+
+def list_page_url(url, offset):
+    return f"{url}?article.offset={offset}"
+
+# 리스트 페이지 주소면 (목록 URL, offset), 본문 주소면 None
+def parse_list_page_url(url):
+    parts = urlsplit(url)
+    query = parse_qs(parts.query)
+    if 'mode' in query or 'article.offset' not in query:
+        return None
+    return url.split('?')[0], int(query['article.offset'][0])
+
+class DeadLetterQueue:
+    def __init__(self, path='kangwon_notices_failed.sqlite3'):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS dead_letters (
+                url          TEXT PRIMARY KEY,
+                title        TEXT,
+                list_date    TEXT,
+                error        TEXT,
+                attempts     INTEGER,
+                first_failed TEXT,
+                last_failed  TEXT
+            )
+        ''')
+        self.conn.commit()
+        # 성공할 때마다 DB 를 보지 않도록 URL 은 메모리에도 들고 있는다.
+        self.urls = {url for (url,) in self.conn.execute('SELECT url FROM dead_letters')}
+        self.added = 0
+
+    def add(self, notice, error):
+        now = datetime.now().isoformat(timespec='seconds')
+        self.conn.execute('''
+            INSERT INTO dead_letters (url, title, list_date, error, attempts, first_failed, last_failed)
+            VALUES (?, ?, ?, ?, 1, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                error = excluded.error, attempts = attempts + 1, last_failed = excluded.last_failed
+        ''', (notice['url'], notice.get('title'), notice.get('date'), f"{type(error).__name__}: {error}", now, now))
+        self.conn.commit()
+        self.urls.add(notice['url'])
+        self.added += 1
+
+    def add_list_page(self, url, error):
+        self.add({'url': url, 'title': LIST_PAGE_TITLE, 'date': None}, error)
+
+    def discard(self, url):
+        if url in self.urls:
+            self.conn.execute('DELETE FROM dead_letters WHERE url = ?', (url,))
+            self.conn.commit()
+            self.urls.discard(url)
+
+    # 다시 받을 공지: 파이프라인의 notice 와 같은 {'title', 'url', 'date'} + 실패 정보
+    def entries(self, max_attempts=None):
+        sql = 'SELECT url, title, list_date, error, attempts FROM dead_letters'
+        params = []
+        if max_attempts is not None:
+            sql += ' WHERE attempts < ?'
+            params.append(max_attempts)
+        return [{'url': url, 'title': title, 'date': list_date, 'error': error, 'attempts': attempts}
+                for url, title, list_date, error, attempts in self.conn.execute(sql + ' ORDER BY first_failed', params)]
+
+    def __len__(self):
+        return len(self.urls)
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,159 @@
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# ===== 기본 크롬 옵션 =====
+def default_chrome_options():
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    return options
+
+# ===== 페이지 준비 대기 =====
+# 고정 sleep 대신 문서 로딩이 끝나고 selector 요소가 나타날 때까지만 기다린다.
+# timeout 안에 준비되지 않으면 False
+def wait_until_ready(driver, selector=None, timeout=10):
+    wait = WebDriverWait(driver, timeout)
+    try:
+        wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
+        if selector:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+        return True
+    except TimeoutException:
+        return False
+
+# ===== 헤드리스 크롬 드라이버 풀 =====
+# - size 개까지 드라이버를 필요할 때 띄워서 돌려 쓴다.
+# - 빌려주기 전에 살아있는지 확인하고, 죽었으면 새로 띄운다.
+# - max_pages 페이지를 처리한 드라이버는 메모리 누수를 막기 위해 재시작한다.
+class DriverPool:
+    def __init__(self, size=4, max_pages=200, create_driver=None):
+        self.size = size
+        self.max_pages = max_pages
+        self.create_driver = create_driver or (lambda: webdriver.Chrome(options=default_chrome_options()))
+        self._idle = queue.LifoQueue()
+        self._slots = threading.Semaphore(size)
+        self._lock = threading.Lock()
+        self._drivers = set()
+        self._page_counts = {}
+        self._closed = False
+
+    # ----- 드라이버 생성/종료 -----
+    def _start(self):
+        driver = self.create_driver()
+        with self._lock:
+            self._drivers.add(driver)
+            self._page_counts[id(driver)] = 0
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._drivers.discard(driver)
+            self._page_counts.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _is_healthy(self, driver):
+        try:
+            driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    # ----- 빌리기/돌려주기 -----
+    def acquire(self):
+        if self._closed:
+            raise RuntimeError("DriverPool 이 이미 종료되었습니다.")
+        self._slots.acquire()
+        try:
+            while True:
+                try:
+                    driver = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._start()
+                if self._is_healthy(driver):
+                    return driver
+                print("[!] 응답 없는 드라이버 재시작")
+                self._discard(driver)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, driver, broken=False):
+        try:
+            with self._lock:
+                count = self._page_counts.get(id(driver), 0) + 1
+                self._page_counts[id(driver)] = count
+            if broken or self._closed or count >= self.max_pages:
+                self._discard(driver)
+            else:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self):
+        driver = self.acquire()
+        broken = False
+        try:
+            yield driver
+        except WebDriverException:
+            # 타임아웃/요소 없음도 WebDriverException 이라 실제로 죽었는지 확인
+            broken = not self._is_healthy(driver)
+            raise
+        finally:
+            self.release(driver, broken=broken)
+
+    # ----- 병렬 실행 -----
+    # fn(driver, item) 을 풀 크기만큼의 스레드에서 실행하고 입력 순서대로 결과를 돌려준다.
+    # items 는 제너레이터여도 된다: 미리 다 꺼내지 않고 window 개(기본 size * 2)까지만 앞서 넣어 두므로
+    # 목록을 넘기는 제너레이터와 본문 작업이 겹쳐서 돈다. (executor.map 은 items 를 끝까지 먼저 꺼낸다)
+    def map(self, fn, items, window=None):
+        def run(item):
+            with self.driver() as driver:
+                return fn(driver, item)
+
+        window = window or self.size * 2
+        executor = ThreadPoolExecutor(max_workers=self.size)
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(run, item))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Ctrl-C 등으로 중단되면 아직 시작 안 한 작업은 버린다.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    # ----- 종료 -----
+    def close(self):
+        self._closed = True
+        with self._lock:
+            drivers = list(self._drivers)
+            self._drivers.clear()
+            self._page_counts.clear()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,158 @@
+from html.parser import HTMLParser
+
+try:
+    from lxml import etree
+except ImportError:  # lxml 이 없으면 표준 라이브러리 파서로 동작
+    etree = None
+
+# ===== 본문 HTML -> 텍스트 (한 번 훑기) =====
+# BeautifulSoup 트리를 만들지 않고 파서 이벤트(start/end/data)만 받아서 처리한다.
+# - 표: 행마다 칸 텍스트를 ' | ' 로 이어 붙이고, 기존처럼 표 텍스트를 먼저 출력
+# - p/div: 안쪽에 p/div 가 또 있으면 경계마다 줄을 끊어서, 바깥 div 가 안쪽 텍스트를 한 번 더 내보내지 않는다
+# - p/div 밖의 텍스트, script/style 내용은 버린다 (기존 get_text 동작과 같음)
+DEFAULT_PARSER = 'lxml' if etree is not None else 'html.parser'
+
+BLOCK_TAGS = {'p', 'div'}
+CELL_TAGS = {'td', 'th'}
+SKIP_TAGS = {'script', 'style', 'template'}
+
+class _TextCollector:
+    def __init__(self):
+        self.table_parts = []
+        self.block_lines = []
+        self.block_depth = 0
+        self.block_buf = []
+        self.table_depth = 0
+        self.table_lines = []
+        self.row_cells = None
+        self.cell_depth = 0
+        self.cell_buf = []
+        self.skip_depth = 0
+        self.pending_text = []
+
+    # ----- 파서 target 인터페이스 -----
+    def start(self, tag, attrib=None):
+        self._commit_text()
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag == 'table':
+            if self.table_depth == 0:
+                self.table_lines = []
+            self.table_depth += 1
+        elif self.table_depth:
+            if tag == 'tr' and self.cell_depth == 0:
+                self._end_row()
+                self.row_cells = []
+            elif tag in CELL_TAGS:
+                if self.cell_depth == 0:
+                    self.cell_buf = []
+                self.cell_depth += 1
+        elif tag in BLOCK_TAGS:
+            self._flush_block()
+            self.block_depth += 1
+
+    def end(self, tag):
+        self._commit_text()
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag == 'table':
+            if self.table_depth == 1:
+                self._end_row()
+                table_text = ''.join(line + '\n' for line in self.table_lines)
+                if table_text.strip():
+                    self.table_parts.append(table_text + '\n')
+            self.table_depth = max(0, self.table_depth - 1)
+        elif self.table_depth:
+            if tag in CELL_TAGS and self.cell_depth:
+                self.cell_depth -= 1
+                if self.cell_depth == 0:
+                    self._end_cell()
+            elif tag == 'tr' and self.cell_depth == 0:
+                self._end_row()
+        elif tag in BLOCK_TAGS and self.block_depth:
+            self._flush_block()
+            self.block_depth -= 1
+
+    # 파서가 한 텍스트 노드를 여러 번에 나눠 줄 수 있어서 (&nbsp; 등) 태그 경계까지 모았다가 처리
+    def data(self, text):
+        self.pending_text.append(text)
+
+    def _commit_text(self):
+        if not self.pending_text:
+            return
+        text = ''.join(self.pending_text)
+        self.pending_text = []
+        if self.skip_depth:
+            return
+        text = text.strip()
+        if not text:
+            return
+        if self.table_depth:
+            if self.cell_depth:
+                self.cell_buf.append(text)
+        elif self.block_depth:
+            self.block_buf.append(text)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        self._commit_text()
+        self._flush_block()
+        return ''.join(self.table_parts + [line + '\n' for line in self.block_lines]).strip()
+
+    # ----- 내부 처리 -----
+    def _flush_block(self):
+        if self.block_buf:
+            self.block_lines.append(''.join(self.block_buf))
+            self.block_buf = []
+
+    def _end_cell(self):
+        cell_text = ''.join(self.cell_buf)
+        self.cell_buf = []
+        if cell_text and self.row_cells is not None:
+            self.row_cells.append(cell_text)
+
+    def _end_row(self):
+        if self.row_cells:
+            self.table_lines.append(' | '.join(self.row_cells))
+        self.row_cells = None
+
+# 표준 라이브러리 HTMLParser 이벤트를 같은 target 으로 넘겨주는 어댑터
+class _StdlibParser(HTMLParser):
+    def __init__(self, target):
+        super().__init__(convert_charrefs=True)
+        self.target = target
+
+    def handle_starttag(self, tag, attrs):
+        self.target.start(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.target.start(tag)
+        self.target.end(tag)
+
+    def handle_endtag(self, tag):
+        self.target.end(tag)
+
+    def handle_data(self, data):
+        self.target.data(data)
+
+def html_to_text(raw_html, parser=None):
+    parser = parser or DEFAULT_PARSER
+    if not raw_html or not raw_html.strip():
+        return ''
+    collector = _TextCollector()
+    if parser == 'lxml':
+        if etree is None:
+            raise ImportError("lxml 파서를 쓰려면 lxml 을 설치해야 합니다.")
+        lxml_parser = etree.HTMLParser(target=collector, remove_comments=True)
+        lxml_parser.feed(raw_html)
+        return lxml_parser.close()
+    if parser == 'html.parser':
+        stdlib_parser = _StdlibParser(collector)
+        stdlib_parser.feed(raw_html)
+        stdlib_parser.close()
+        return collector.close()
+    raise ValueError(f"지원하지 않는 파서: {parser}")
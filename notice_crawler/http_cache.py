@@ -0,0 +1,187 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+
+# ===== URL 정규화 =====
+# 스킴/호스트 소문자, 기본 포트/프래그먼트 제거, 쿼리 파라미터 정렬.
+# drop_params 에 있는 파라미터는 키에서 뺀다 (같은 페이지인데 값만 바뀌는 파라미터).
+def normalize_url(url, drop_params=()):
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and not ((scheme == 'http' and parts.port == 80) or (scheme == 'https' and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in drop_params)
+    return urlunsplit((scheme, host, parts.path or '/', urlencode(query), ''))
+
+# replay 모드에서 캐시에 없는 URL 을 요청했을 때
+class CacheMiss(requests.RequestException):
+    pass
+
+# ===== 디스크 응답 캐시 =====
+# - 본문은 zlib 으로 압축해서 파일로, 메타데이터(ETag/Last-Modified/크기/시각)는 SQLite 로 관리
+# - ttl 안의 항목은 네트워크 없이 바로 돌려주고, 지난 항목은 조건부 GET 으로 재검증 (304 면 재사용)
+# - 전체 크기가 max_bytes 를 넘으면 가장 오래 안 쓴 항목부터 지운다
+# - replay_only=True 면 절대 네트워크에 나가지 않는다 (파서/추출기 개발용)
+# - ttl_func(url, ttl) 로 URL 마다 TTL 을 바꿀 수 있다. 0 이면 매번 조건부 GET 으로 재검증
+class ResponseCache:
+    def __init__(self, directory='.http_cache', ttl=24 * 3600, max_bytes=500 * 1024 * 1024,
+                 replay_only=False, key_func=normalize_url, ttl_func=None):
+        self.directory = directory
+        self.ttl = ttl
+        self.ttl_func = ttl_func
+        self.max_bytes = max_bytes
+        self.replay_only = replay_only
+        self.key_func = key_func
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(directory, 'index.sqlite3'), check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key           TEXT PRIMARY KEY,
+                url           TEXT,
+                encoding      TEXT,
+                etag          TEXT,
+                last_modified TEXT,
+                size          INTEGER,
+                fetched_at    REAL,
+                accessed_at   REAL
+            )
+        ''')
+        self.conn.commit()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    # ----- 저장소 -----
+    def _blob_path(self, key):
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest + '.z')
+
+    def _load(self, key):
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT encoding, etag, last_modified, fetched_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            with open(self._blob_path(key), 'rb') as f:
+                content = zlib.decompress(f.read())
+        except (OSError, zlib.error):
+            self._delete(key)
+            return None
+        encoding, etag, last_modified, fetched_at = row
+        return {'content': content, 'encoding': encoding, 'etag': etag,
+                'last_modified': last_modified, 'fetched_at': fetched_at}
+
+    def _store(self, key, url, content, encoding, etag, last_modified):
+        path = self._blob_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        blob = zlib.compress(content, 6)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(blob)
+        os.replace(tmp_path, path)
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO responses (key, url, encoding, etag, last_modified, size, fetched_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, url, encoding, etag, last_modified, len(blob), now, now)
+            )
+            self.conn.commit()
+        self._evict()
+
+    def _touch(self, key, refreshed=False):
+        now = time.time()
+        with self._lock:
+            if refreshed:
+                self.conn.execute('UPDATE responses SET accessed_at = ?, fetched_at = ? WHERE key = ?', (now, now, key))
+            else:
+                self.conn.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+            self.conn.commit()
+
+    def _delete(self, key):
+        with self._lock:
+            self.conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self.conn.commit()
+        try:
+            os.remove(self._blob_path(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        with self._lock:
+            total = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            victims = []
+            for key, size in self.conn.execute('SELECT key, size FROM responses ORDER BY accessed_at'):
+                if total <= self.max_bytes:
+                    break
+                victims.append(key)
+                total -= size
+        for key in victims:
+            self._delete(key)
+
+    # TTL 보다 오래된 항목 정리 (재검증도 안 할 거라면)
+    def purge_expired(self, max_age=None):
+        cutoff = time.time() - (max_age if max_age is not None else self.ttl)
+        with self._lock:
+            keys = [row[0] for row in self.conn.execute('SELECT key FROM responses WHERE fetched_at < ?', (cutoff,))]
+        for key in keys:
+            self._delete(key)
+        return len(keys)
+
+    # ----- 조회 -----
+    def get(self, session, url, timeout=10):
+        key = self.key_func(url)
+        entry = self._load(key)
+        ttl = self.ttl_func(url, self.ttl) if self.ttl_func is not None else self.ttl
+
+        if entry is not None and (self.replay_only or time.time() - entry['fetched_at'] < ttl):
+            self.hits += 1
+            self._touch(key)
+            return _decode(entry['content'], entry['encoding'])
+        if self.replay_only:
+            self.misses += 1
+            raise CacheMiss(f"캐시에 없는 URL (replay 모드): {url}")
+
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            self.revalidated += 1
+            self._touch(key, refreshed=True)
+            return _decode(entry['content'], entry['encoding'])
+        response.raise_for_status()
+
+        self.misses += 1
+        encoding = _response_encoding(response)
+        self._store(key, url, response.content, encoding,
+                    response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return _decode(response.content, encoding)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+def _response_encoding(response):
+    if not response.encoding or response.encoding.lower() == 'iso-8859-1':
+        return response.apparent_encoding
+    return response.encoding
+
+def _decode(content, encoding):
+    return content.decode(encoding or 'utf-8', errors='replace')
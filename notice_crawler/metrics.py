@@ -0,0 +1,209 @@
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ===== 크롤링 계측 =====
+# 단계별 소요 시간 히스토그램, 카운터(실패/재시도 등), 게이지(큐 길이 등)를 모은다.
+# - JSON 로그(jsonl)에 이벤트를 한 줄씩 남기고
+# - 원하면 로컬 HTTP 포트에 Prometheus 텍스트 형식으로 내보내고
+# - 실행이 끝나면 summary() 로 요약을 출력한다.
+# 모듈 전역 registry 하나를 같이 쓴다 (timer / inc / set_gauge / event).
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0)
+
+class Histogram:
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    # 버킷 안에서는 선형 보간한 근사값
+    def quantile(self, q):
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for i, n in enumerate(self.counts):
+            upper = self.buckets[i] if i < len(self.buckets) else self.max
+            if n and seen + n >= rank:
+                return min(self.max, lower + (upper - lower) * (rank - seen) / n)
+            seen += n
+            lower = upper
+        return self.max
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.histograms = {}
+        self.counters = {}
+        self.gauges = {}
+        self.log_file = None
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self.histograms.clear()
+            self.counters.clear()
+            self.gauges.clear()
+
+    # ----- 기록 -----
+    def observe(self, stage, seconds):
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    # 함수 전체를 한 단계로 잴 때 쓰는 데코레이터
+    def timed(self, stage):
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.timer(stage):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def set_gauge(self, name, value):
+        with self._lock:
+            self.gauges[name] = value
+
+    # ----- JSON 로그 -----
+    def open_log(self, path):
+        self.close_log()
+        self.log_file = open(path, 'a', encoding='utf-8')
+
+    def close_log(self):
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
+
+    def event(self, name, **fields):
+        if self.log_file is None:
+            return
+        record = {'ts': round(time.time(), 3), 'event': name}
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self.log_file.write(line + '\n')
+            self.log_file.flush()
+
+    # ----- 내보내기 -----
+    def counter_total(self, name):
+        with self._lock:
+            return sum(value for (key, _), value in self.counters.items() if key == name)
+
+    def snapshot(self):
+        elapsed = max(time.time() - self.started, 1e-9)
+        with self._lock:
+            stages = {
+                stage: {'count': h.count, 'sum': round(h.sum, 4), 'avg': round(h.sum / h.count, 4) if h.count else 0,
+                        'p50': round(h.quantile(0.5), 4), 'p95': round(h.quantile(0.95), 4), 'max': round(h.max, 4)}
+                for stage, h in self.histograms.items()
+            }
+            counters = {_counter_name(name, labels): value for (name, labels), value in self.counters.items()}
+            gauges = dict(self.gauges)
+        pages = sum(value for key, value in counters.items() if key.startswith('pages_done'))
+        return {'elapsed': round(elapsed, 3), 'pages_per_min': round(pages * 60 / elapsed, 2),
+                'stages': stages, 'counters': counters, 'gauges': gauges}
+
+    def render_prometheus(self, prefix='crawl'):
+        lines = []
+        with self._lock:
+            for stage, h in sorted(self.histograms.items()):
+                name = f"{prefix}_stage_seconds"
+                cumulative = 0
+                for bound, n in zip(h.buckets, h.counts):
+                    cumulative += n
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {h.count}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {h.sum}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {h.count}')
+            for (name, labels), value in sorted(self.counters.items()):
+                label_text = ','.join(f'{k}="{v}"' for k, v in labels)
+                label_text = f"{{{label_text}}}" if label_text else ''
+                lines.append(f"{prefix}_{name}_total{label_text} {value}")
+            for name, value in sorted(self.gauges.items()):
+                lines.append(f"{prefix}_{name} {value}")
+        lines.append(f"{prefix}_uptime_seconds {time.time() - self.started:.3f}")
+        return '\n'.join(lines) + '\n'
+
+    # http://127.0.0.1:port/metrics 로 노출 (데몬 스레드)
+    def serve(self, port, host='127.0.0.1'):
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = registry.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def summary(self):
+        snap = self.snapshot()
+        lines = [f"📊 실행 시간 {snap['elapsed']:.1f}s, 리스트 페이지 {snap['pages_per_min']:.1f}/분"]
+        if snap['stages']:
+            lines.append(f"  {'단계':<22}{'횟수':>7}{'평균':>9}{'p50':>9}{'p95':>9}{'최대':>9}")
+            for stage, s in sorted(snap['stages'].items(), key=lambda item: -item[1]['sum']):
+                lines.append(f"  {stage:<22}{s['count']:>7}{s['avg']:>9.3f}{s['p50']:>9.3f}{s['p95']:>9.3f}{s['max']:>9.3f}")
+        for name, value in sorted(snap['counters'].items()):
+            lines.append(f"  {name}: {value}")
+        for name, value in sorted(snap['gauges'].items()):
+            lines.append(f"  {name}: {value}")
+        return '\n'.join(lines)
+
+def _counter_name(name, labels):
+    if not labels:
+        return name
+    return name + '{' + ','.join(f"{k}={v}" for k, v in labels) + '}'
+
+registry = Registry()
+timer = registry.timer
+timed = registry.timed
+observe = registry.observe
+inc = registry.inc
+set_gauge = registry.set_gauge
+event = registry.event
@@ -0,0 +1,167 @@
+import random
+import sqlite3
+import zlib
+from array import array
+
+from . import metrics
+
+# ===== 비슷한 공지 찾기 (MinHash + LSH) =====
+# 같은 공지를 다시 올리거나 조금 고쳐서 여러 게시판에 올리는 경우가 많다.
+# - 본문(clean_html_keep_table 결과)을 글자 shingle_size-gram 집합으로 보고 MinHash 서명(num_perm 개)을 만든다.
+# - 서명을 bands 개 구간으로 나눠 구간별 버킷에 넣는다 (LSH). 버킷이 하나라도 같은 공지만 후보 -> 전체 쌍 비교 없음
+# - 후보는 서명으로 추정한 자카드 유사도가 threshold 이상일 때만 중복으로 본다.
+# 서명/버킷은 SQLite 에 남겨서 다음 실행에서도 이어서 찾는다. threshold 를 바꾸면 버킷만 다시 만든다.
+DUPLICATE_FIELD = '중복 원본'
+MERSENNE_PRIME = (1 << 61) - 1
+MIN_TEXT_LENGTH = 50    # 이보다 짧은 본문('(본문 없음)' 등)은 비교하지 않는다
+
+# threshold 근처에서 후보가 되는 확률이 가장 가파르게 바뀌도록 bands x rows = num_perm 을 고른다.
+# 후보가 될 확률 1 - (1 - s^rows)^bands 가 s = (1/bands)^(1/rows) 근처에서 급하게 올라간다.
+def choose_bands(threshold, num_perm):
+    best = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+def shingles(text, size=5):
+    text = ' '.join((text or '').split())
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+class Match:
+    def __init__(self, key, title, similarity):
+        self.key = key
+        self.title = title
+        self.similarity = similarity
+
+    def __repr__(self):
+        return f"Match({self.key!r}, {self.title!r}, {self.similarity:.2f})"
+
+class NearDuplicateIndex:
+    def __init__(self, path='kangwon_notices_minhash.sqlite3', threshold=0.8, num_perm=64,
+                 shingle_size=5, seed=1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, MERSENNE_PRIME), rng.randrange(MERSENNE_PRIME)) for _ in range(num_perm)]
+
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS signatures (
+                doc_key   TEXT PRIMARY KEY,
+                title     TEXT,
+                signature BLOB
+            );
+            CREATE TABLE IF NOT EXISTS buckets (
+                band    INTEGER,
+                bucket  INTEGER,
+                doc_key TEXT
+            );
+            CREATE INDEX IF NOT EXISTS buckets_lookup ON buckets (band, bucket);
+            CREATE INDEX IF NOT EXISTS buckets_doc ON buckets (doc_key);
+        ''')
+        self._check_params(seed)
+
+    # 서명 방식이 다르면 예전 서명과 비교할 수 없다. 밴드 수만 다르면 버킷을 다시 만든다.
+    def _check_params(self, seed):
+        stored = dict(self.conn.execute('SELECT name, value FROM meta'))
+        params = {'num_perm': str(self.num_perm), 'shingle_size': str(self.shingle_size), 'seed': str(seed)}
+        if stored and any(stored.get(name) != value for name, value in params.items()):
+            raise ValueError(f"서명 설정이 기존 인덱스와 다릅니다: {stored} (새 경로를 쓰세요)")
+        if stored.get('bands') != str(self.bands):
+            self.conn.execute('DELETE FROM buckets')
+            for key, blob in self.conn.execute('SELECT doc_key, signature FROM signatures').fetchall():
+                self._insert_buckets(key, array('Q', blob))
+        params['bands'] = str(self.bands)
+        self.conn.executemany('INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)', params.items())
+        self.conn.commit()
+
+    # ===== 서명 =====
+    # shingle 은 crc32 로 한 번만 해시하고, 순열 대신 (a*x + b) mod p 로 num_perm 개의 최솟값을 뽑는다.
+    @metrics.timed('minhash')
+    def signature(self, text):
+        hashes = [zlib.crc32(shingle.encode('utf-8')) for shingle in shingles(text, self.shingle_size)]
+        return array('Q', [min([(a * h + b) % MERSENNE_PRIME for h in hashes]) for a, b in self._perms])
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, zlib.crc32(signature[band * rows:(band + 1) * rows].tobytes())
+
+    def _insert_buckets(self, key, signature):
+        self.conn.executemany('INSERT INTO buckets (band, bucket, doc_key) VALUES (?, ?, ?)',
+                              [(band, bucket, key) for band, bucket in self._band_keys(signature)])
+
+    def similarity(self, sig_a, sig_b):
+        return sum(x == y for x, y in zip(sig_a, sig_b)) / self.num_perm
+
+    # ===== 찾기 / 넣기 =====
+    # threshold 이상 비슷한 공지를 유사도 높은 순으로. exclude 는 자기 자신 (같은 공지를 다시 받은 경우)
+    def query(self, text=None, signature=None, exclude=None):
+        if signature is None:
+            if len(text or '') < MIN_TEXT_LENGTH:
+                return []
+            signature = self.signature(text)
+        candidates = set()
+        for band, bucket in self._band_keys(signature):
+            candidates.update(key for (key,) in self.conn.execute(
+                'SELECT doc_key FROM buckets WHERE band = ? AND bucket = ?', (band, bucket)))
+        candidates.discard(exclude)
+
+        matches = []
+        for key in candidates:
+            title, blob = self.conn.execute(
+                'SELECT title, signature FROM signatures WHERE doc_key = ?', (key,)).fetchone()
+            score = self.similarity(signature, array('Q', blob))
+            if score >= self.threshold:
+                matches.append(Match(key, title, score))
+        matches.sort(key=lambda match: -match.similarity)
+        return matches
+
+    def add(self, key, text, title=None, signature=None):
+        if signature is None:
+            signature = self.signature(text)
+        self.remove(key)
+        self.conn.execute('INSERT INTO signatures (doc_key, title, signature) VALUES (?, ?, ?)',
+                          (key, title, signature.tobytes()))
+        self._insert_buckets(key, signature)
+        self.conn.commit()
+
+    def remove(self, key):
+        self.conn.execute('DELETE FROM signatures WHERE doc_key = ?', (key,))
+        self.conn.execute('DELETE FROM buckets WHERE doc_key = ?', (key,))
+
+    # 크롤링 중에 부른다: 가장 비슷한 기존 공지(Match)를 돌려주고, 중복이 아니면 색인에 넣는다.
+    # 중복은 넣지 않는다 -> 원본 하나만 남아서 버킷이 복사본으로 불어나지 않는다.
+    def check(self, key, text, title=None):
+        if len(text or '') < MIN_TEXT_LENGTH:
+            return None
+        signature = self.signature(text)
+        matches = self.query(signature=signature, exclude=key)
+        if matches:
+            metrics.inc('near_duplicates')
+            return matches[0]
+        self.add(key, text, title, signature)
+        return None
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM signatures').fetchone()[0]
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
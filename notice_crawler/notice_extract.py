@@ -0,0 +1,267 @@
+import re
+from datetime import date, datetime
+from functools import lru_cache
+
+from . import metrics
+
+# ===== 필드 추출 엔진 =====
+# 예전에는 필드마다 text.splitlines() 를 다시 하고 키워드마다 모든 줄을 다시 훑었다.
+# 여기서는 정규식/키워드 묶음을 모두 미리 컴파일해 두고, 줄 나누기 한 번 + 줄 순회 한 번으로
+# 날짜/마감일/대상/신청방법을 같이 채운다. (장소/카테고리는 예전과 같이 전체 텍스트 기준)
+EVENT_KEYWORDS = ["일시", "일 시", "운영기간", "행사기간", "진행기간", "교육기간", "프로그램 기간"]
+DEADLINE_KEYWORDS = ["신청기간", "모집기간", "접수기간", "신청기한", "모집기한", "제출기한", "신청 마감", "접수 마감", "모집기간"]
+FALLBACK_SKIP_KEYWORDS = ["신청", "접수", "모집"]
+TARGET_KEYWORDS = ["참가대상", "모집대상", "지원자격", "대상자", "신청자격", "자격요건", "대상"]
+APPLY_KEYWORDS = ["신청방법", "지원방법", "접수방법", "참여신청", "신청 방법", "지원 방법", "교육 신청"]
+LOCATION_BAD_WORDS = ["없음", "미정", "별도", "문의", "추후"]
+CATEGORY_KEYWORDS = {
+    "공모전": ["공모전", "경진대회", "아이디어", "콘테스트", "창업", "해커톤"],
+    "대외활동": ["대외활동", "연수", "해외", "인턴", "봉사", "교류", "참가자 모집"],
+    "비교과": ["비교과", "특강", "워크숍", "세미나", "강연", "소모임", "문해력", "역량"]
+}
+
+def _alternation(keywords):
+    # 긴 키워드부터 (부분 문자열 관계여도 '있는지'만 볼 때는 상관없음)
+    return re.compile('|'.join(re.escape(kw) for kw in sorted(set(keywords), key=len, reverse=True)))
+
+EVENT_KW_RE = _alternation(EVENT_KEYWORDS)
+DEADLINE_KW_RE = _alternation(DEADLINE_KEYWORDS)
+FALLBACK_SKIP_RE = _alternation(FALLBACK_SKIP_KEYWORDS)
+TARGET_KW_RE = _alternation(TARGET_KEYWORDS)
+APPLY_KW_RE = _alternation(APPLY_KEYWORDS)
+CATEGORY_RES = [(category, _alternation(keywords)) for category, keywords in CATEGORY_KEYWORDS.items()]
+# 어떤 줄 필드에도 해당 없는 줄은 통째로 건너뛰기 위한 관문 (숫자 = 단일 날짜 후보)
+LINE_GATE_RE = re.compile(
+    r'\d|' + _alternation(EVENT_KEYWORDS + DEADLINE_KEYWORDS + TARGET_KEYWORDS + APPLY_KEYWORDS).pattern
+)
+
+PAREN_RE = re.compile(r"\(.*?\)")
+TIME_RE = re.compile(r'\d{1,2}:\d{2}')
+BRACKETS_RE = re.compile(r"[\(\[\{][^\)\]\}]*[\)\]\}]")
+UNICODE_BRACKETS_RE = re.compile(r"[〔〕]")
+DATE_RANGE_RE = re.compile(r"(20\d{2}[.년\s]*\d{1,2}[.월\s]*\d{1,2}[일]*)\s*[~∼－ー-]+\s*(\d{1,2}[.월\s]*\d{1,2}[일]*)")
+YEAR_RE = re.compile(r"20\d{2}")
+SINGLE_DATE_RES = [
+    re.compile(r'20\d{2}[./-]\d{1,2}[./-]\d{1,2}'),
+    re.compile(r'20\d{2}년\s?\d{1,2}월\s?\d{1,2}일'),
+    re.compile(r'\d{1,2}월\s?\d{1,2}일'),
+    re.compile(r'\d{1,2}[./]\d{1,2}'),
+]
+DEADLINE_DATE_RE = re.compile(r'(20\d{2}[./년\s]*\d{1,2}[./월\s]*\d{1,2}[일\s]*)|(\d{1,2}[./월\s]*\d{1,2}[일\s]*)')
+PREFIX_RE = re.compile(r"^[가-힣]\.|\d+[.)]|[-•○]\s*")
+LOCATION_DATE_RES = [
+    re.compile(r'\d{4}[./년\s]*\d{1,2}[./월\s]*\d{1,2}[일\s]*'),
+    re.compile(r"\d{2}[./]\d{1,2}[./]\d{1,2}\."),
+]
+LOCATION_LABEL_RE = re.compile(r"장\s*소\s*[:：]?\s*(.*)")
+LOCATION_SPLIT_RE = re.compile(r"[,.등]")
+POSTPOSITION_RE = re.compile(r"(에서|에|은|는|이|가|으로|로)\b")
+LOCATION_RES = [
+    re.compile(r"(미래도서관\s?[가-힣\w\s\(\)]+)"),
+    re.compile(r"(공6|공5|공4|공3|공2|공1|경영|도서관|호관|공과대학|강의실|○○관|농1|농2|농3|BF\d)[\w\s\d호]*"),
+    re.compile(r"(서울대학교)"),
+    re.compile(r"(춘천\s?[가-힣\d]*)"),
+]
+# 예전 strptime 형식 5개("%Y년%m월%d일", "%Y.%m.%d", "%Y-%m-%d", "%m월%d일", "%m.%d")를 정규식 하나로
+# (strptime 처럼 ASCII 숫자만 인정)
+ISO_DATE_RE = re.compile(
+    r"(?:(?P<y1>[0-9]{4})년(?P<m1>[0-9]{1,2})월(?P<d1>[0-9]{1,2})일"
+    r"|(?P<y2>[0-9]{4})\.(?P<m2>[0-9]{1,2})\.(?P<d2>[0-9]{1,2})"
+    r"|(?P<y3>[0-9]{4})-(?P<m3>[0-9]{1,2})-(?P<d3>[0-9]{1,2})"
+    r"|(?P<m4>[0-9]{1,2})월(?P<d4>[0-9]{1,2})일"
+    r"|(?P<m5>[0-9]{1,2})\.(?P<d5>[0-9]{1,2}))"
+)
+POSTED_DATE_RE = re.compile(r"(\d{2,4})[./-]\d{1,2}[./-]\d{1,2}")
+DATE_CACHE_SIZE = 4096
+
+# ===== 날짜 정규화 =====
+# 연도가 없는 날짜("5월 12일", "5.12")는 ref_year 를 붙인다.
+# ref_year 를 안 주면 지금 연도 -> 예전 공지를 다시 처리할 때는 공지 작성일의 연도를 넘겨야 결과가 고정된다.
+def normalize_to_iso(date_str, ref_year=None):
+    return _normalize_to_iso(date_str, ref_year or datetime.now().year)
+
+# 본문에 같은 날짜 문자열이 여러 번 나오므로 (문자열, 기준 연도) 로 LRU 캐시
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _normalize_to_iso(date_str, ref_year):
+    date_str = PAREN_RE.sub("", date_str)
+    date_str = date_str.replace("~", "").replace(" ", "")
+    if TIME_RE.search(date_str):
+        return None
+    match = ISO_DATE_RE.fullmatch(date_str)
+    if not match:
+        return None
+    groups = match.groupdict()
+    for i in range(1, 6):
+        if groups[f'm{i}'] is not None:
+            year = groups.get(f'y{i}')
+            try:
+                dt = date(int(year) if year else ref_year, int(groups[f'm{i}']), int(groups[f'd{i}']))
+            except ValueError:
+                return None
+            return dt.isoformat()
+    return None
+
+# 공지 작성일("2025.04.28", "25.04.28", date 객체)에서 기준 연도 뽑기
+def reference_year(posted_date):
+    if posted_date is None:
+        return None
+    if isinstance(posted_date, date):
+        return posted_date.year
+    match = POSTED_DATE_RE.search(str(posted_date))
+    if not match:
+        return None
+    year = int(match.group(1))
+    return year + 2000 if year < 100 else year
+
+# ===== 줄 단위 필드 =====
+def clean_prefix(line: str) -> str:
+    return PREFIX_RE.sub("", line).strip()
+
+def _event_range(line, ref_year):
+    line = BRACKETS_RE.sub("", line)  # (월), [정보] 등 제거
+    line = UNICODE_BRACKETS_RE.sub("", line)  # 유니코드 괄호 제거
+    match = DATE_RANGE_RE.search(line)
+    if not match:
+        return None
+    start = normalize_to_iso(match.group(1), ref_year)
+    if not start:
+        return None
+    end_raw = match.group(2)
+    if not YEAR_RE.search(end_raw):
+        end_raw = f"{start[:4]}년{end_raw}"
+    end = normalize_to_iso(end_raw, ref_year)
+    if start and end:
+        return [start, end]
+    return None
+
+def _single_dates(line, iso_dates, ref_year):
+    for pattern in SINGLE_DATE_RES:
+        for match in pattern.findall(line):
+            normalized = normalize_to_iso(match, ref_year)
+            if normalized:
+                iso_dates.add(normalized)
+
+def _deadline(line, ref_year):
+    dates = []
+    for full_match in DEADLINE_DATE_RE.findall(line):
+        date_raw = full_match[0] if full_match[0] else full_match[1]
+        normalized = normalize_to_iso(date_raw, ref_year)
+        if normalized:
+            dates.append(normalized)
+    return max(dates) if dates else None
+
+def _keyword_rank(line, gate_re, keywords):
+    # 줄에 들어있는 키워드 중 가장 우선순위가 높은 것의 순번 (없으면 None)
+    if not gate_re.search(line):
+        return None
+    for rank, kw in enumerate(keywords):
+        if kw in line:
+            return rank
+    return None
+
+def extract_line_fields(lines, ref_year=None):
+    ref_year = ref_year or datetime.now().year
+    event_range = None
+    fallback_dates = set()
+    deadline = None
+    target = None         # (rank, line)
+    apply_method = None   # (rank, line)
+
+    for line in lines:
+        if not LINE_GATE_RE.search(line):
+            continue
+
+        if event_range is None:
+            if EVENT_KW_RE.search(line):
+                event_range = _event_range(line, ref_year)
+            if event_range is None and not FALLBACK_SKIP_RE.search(line):
+                _single_dates(line, fallback_dates, ref_year)
+
+        if deadline is None and DEADLINE_KW_RE.search(line):
+            deadline = _deadline(line, ref_year)
+
+        if target is None or target[0] > 0:
+            rank = _keyword_rank(line, TARGET_KW_RE, TARGET_KEYWORDS)
+            if rank is not None and (target is None or rank < target[0]):
+                target = (rank, line)
+
+        if apply_method is None or apply_method[0] > 0:
+            rank = _keyword_rank(line, APPLY_KW_RE, APPLY_KEYWORDS)
+            if rank is not None and (apply_method is None or rank < apply_method[0]):
+                apply_method = (rank, line)
+
+        if (event_range is not None and deadline is not None
+                and target is not None and target[0] == 0
+                and apply_method is not None and apply_method[0] == 0):
+            break
+
+    dates = event_range or (sorted(fallback_dates) if fallback_dates else None)
+    return {
+        "날짜": dates,
+        "신청마감일": deadline,
+        "대상": clean_prefix(target[1].strip()) if target else None,
+        "신청방법": clean_prefix(apply_method[1].strip()) if apply_method else None,
+    }
+
+# ===== 필드별 함수 (예전 이름 유지) =====
+def extract_event_dates(text, ref_year=None):
+    return extract_line_fields(text.splitlines(), ref_year)["날짜"]
+
+def extract_deadline_date(text, ref_year=None):
+    return extract_line_fields(text.splitlines(), ref_year)["신청마감일"]
+
+def extract_target(text):
+    return extract_line_fields(text.splitlines())["대상"]
+
+def extract_apply_method(text):
+    return extract_line_fields(text.splitlines())["신청방법"]
+
+# ===== 장소 / 카테고리 (전체 텍스트 기준) =====
+def extract_locations(text):
+    for pattern in LOCATION_DATE_RES:
+        text = pattern.sub('', text)
+
+    # ✅ "장 소:"처럼 띄어쓰기 있는 형태도 인식
+    match = LOCATION_LABEL_RE.search(text)
+    if match:
+        raw_loc = match.group(1).strip()
+        raw_loc = LOCATION_SPLIT_RE.split(raw_loc)[0].strip()
+        if any(bad in raw_loc for bad in LOCATION_BAD_WORDS):
+            return None
+        return raw_loc
+
+    # 백업: 패턴 기반 장소 추출
+    for pattern in LOCATION_RES:
+        match = pattern.search(text)
+        if match:
+            location = POSTPOSITION_RE.split(match.group().strip())[0].strip()
+            if any(bad in location for bad in LOCATION_BAD_WORDS):
+                return None
+            return location
+    return None
+
+def classify_category(text):
+    for category, pattern in CATEGORY_RES:
+        if pattern.search(text):
+            return category
+    return "기타"
+
+# ===== 통합 정보 추출 함수 =====
+# posted_date(공지 작성일)가 있으면 그 연도를 연도 없는 날짜의 기준으로 쓴다. ref_year 로 직접 줄 수도 있음.
+# attachment_text: 첨부파일(HWP/PDF)에서 뽑은 글자 (attachment_text 참고). 본문 뒤에 붙여서 본문에 있는 값이 먼저 잡힌다.
+@metrics.timed('extract')
+def extract_info(title, content, posted_date=None, ref_year=None, attachment_text=None):
+    full_text = f"{title}\n{content}"
+    if attachment_text:
+        full_text += f"\n{attachment_text}"
+    ref_year = ref_year or reference_year(posted_date)
+    fields = extract_line_fields(full_text.splitlines(), ref_year)
+    return {
+        "제목": title,
+        "날짜": fields["날짜"],
+        "장소": extract_locations(full_text),
+        "신청방법": fields["신청방법"],
+        "대상": fields["대상"],
+        "신청마감일": fields["신청마감일"],
+        "카테고리": classify_category(full_text)
+    }
@@ -0,0 +1,82 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+from .notice_parser import list_url, parse_notice_list, parse_notice_list_page, parse_notice_detail
+from .http_cache import ResponseCache, normalize_url
+from . import metrics
+
+# ===== HTTP 세션 설정 =====
+# 서버 렌더링 페이지라 브라우저 없이 HTML 만 받아서 파싱한다.
+# keep-alive 커넥션을 재사용하도록 세션 하나를 계속 쓴다.
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; practice-crawling/1.0)',
+    'Accept': 'text/html,application/xhtml+xml',
+    'Accept-Language': 'ko-KR,ko;q=0.9',
+}
+REQUEST_TIMEOUT = 10
+
+def create_session(pool_size=10):
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.hooks['response'].append(_count_response)
+    return session
+
+def _count_response(response, *args, **kwargs):
+    metrics.inc('http_responses', status=response.status_code)
+    return response
+
+# ===== 응답 캐시 =====
+# 상세 페이지 URL 에는 목록 위치(article.offset 등)가 같이 붙는데,
+# 새 공지가 올라오면 값이 바뀌므로 캐시 키에서는 뺀다. (목록 페이지는 offset 이 곧 페이지라 유지)
+VIEW_VOLATILE_PARAMS = ('article.offset', 'articleLimit')
+
+def notice_cache_key(url):
+    if 'mode=view' in url:
+        return normalize_url(url, drop_params=VIEW_VOLATILE_PARAMS)
+    return normalize_url(url)
+
+# 목록 페이지는 새 글이 올라오면 바로 바뀐다. TTL 안이라고 디스크에서 그대로 쓰면
+# 증분 크롤링이 새 글을 못 보고 멈추고, 글 수/날짜 탐색도 예전 값으로 돈다 -> 목록은 항상 재검증 (replay 모드만 그대로)
+def notice_cache_ttl(url, ttl):
+    return ttl if 'mode=view' in url else 0
+
+# mode: 'off' (캐시 안 씀) / 'normal' / 'replay' (네트워크 없이 캐시만)
+def create_cache(mode='normal', directory='.http_cache', ttl=24 * 3600, max_bytes=500 * 1024 * 1024):
+    if mode == 'off':
+        return None
+    return ResponseCache(directory, ttl=ttl, max_bytes=max_bytes,
+                         replay_only=(mode == 'replay'), key_func=notice_cache_key, ttl_func=notice_cache_ttl)
+
+@metrics.timed('fetch')
+def fetch_html(session, url, timeout=REQUEST_TIMEOUT, cache=None):
+    if cache is not None:
+        return cache.get(session, url, timeout=timeout)
+    response = session.get(url, timeout=timeout)
+    response.raise_for_status()
+    if not response.encoding or response.encoding.lower() == 'iso-8859-1':
+        response.encoding = response.apparent_encoding
+    return response.text
+
+# ===== 공지 리스트 (HTTP) =====
+def fetch_notice_list(session, offset=0, url=list_url, cache=None, timeout=REQUEST_TIMEOUT):
+    html = fetch_html(session, f"{url}?article.offset={offset}", timeout=timeout, cache=cache)
+    return parse_notice_list(html, page_url=url)
+
+# 첫 페이지를 받을 때 게시판 전체 글 수도 같이 읽는다. -> (공지 목록, 전체 글 수 또는 None)
+def fetch_notice_list_page(session, offset=0, url=list_url, cache=None, articles_per_page=10):
+    html = fetch_html(session, f"{url}?article.offset={offset}", cache=cache)
+    return parse_notice_list_page(html, page_url=url, articles_per_page=articles_per_page)
+
+# ===== 공지 본문 (HTTP) =====
+# 실패하면 None -> 호출 쪽에서 Selenium 으로 다시 시도
+def fetch_notice_detail(session, url, cache=None):
+    try:
+        html = fetch_html(session, url, cache=cache)
+    except requests.RequestException as e:
+        print("[!] HTTP 본문 요청 실패:", e)
+        metrics.inc('failures', stage='fetch_detail')
+        return None
+    return parse_notice_detail(html, page_url=url)
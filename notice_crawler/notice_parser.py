@@ -0,0 +1,148 @@
+import re
+from bs4 import BeautifulSoup
+from datetime import datetime
+from urllib.parse import urljoin
+
+from .html_clean import html_to_text, DEFAULT_PARSER
+from . import metrics
+
+# ===== URL 설정 =====
+base_url = "https://padm.kangwon.ac.kr"
+list_path = "/padm/life/notice-department.do"
+list_url = f"{base_url}{list_path}"
+
+DOC_EXTS = ['.hwp', '.pdf']
+IMG_EXTS = ['.png', '.jpg', '.jpeg']
+
+ARTICLE_OFFSET_RE = re.compile(r'article\.offset=(\d+)')
+
+# ===== HTML 태그 제거 및 표 처리 =====
+# 실제 처리는 html_clean 의 한 번 훑기 엔진이 한다. parser 는 'lxml' 또는 'html.parser'
+@metrics.timed('clean')
+def clean_html_keep_table(raw_html, parser=None):
+    return html_to_text(raw_html, parser=parser)
+
+# BeautifulSoup 표 태그를 직접 다룰 때 쓰는 헬퍼 (칸마다 get_text 는 한 번만)
+def extract_table_text(table):
+    rows = table.find_all('tr')
+    table_text = ''
+    for row in rows:
+        cols = row.find_all(['td', 'th'])
+        valid_cols = [text for text in (col.get_text(strip=True) for col in cols) if text]
+        if valid_cols:
+            row_text = ' | '.join(valid_cols)
+            table_text += row_text + '\n'
+    return table_text
+
+# ===== 파일 링크 분류 =====
+def classify_file_link(file_name, full_link, doc_links, img_links):
+    name = file_name.lower()
+    if any(name.endswith(ext) for ext in DOC_EXTS):
+        doc_links.append(full_link)
+    elif any(name.endswith(ext) for ext in IMG_EXTS):
+        img_links.append(full_link)
+
+# ===== 작성일 문자열 -> date =====
+# 목록은 '25.04.28', 본문은 '2025.04.28' 형식. 읽지 못하면 None
+POSTED_DATE_FORMATS = ['%Y.%m.%d', '%y.%m.%d', '%Y-%m-%d']
+
+def parse_posted_date(text):
+    text = (text or '').strip().rstrip('.')
+    for fmt in POSTED_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+def _visible_text(tag):
+    # Selenium의 .text 처럼 공백을 하나로 정리
+    return ' '.join(tag.get_text(' ', strip=True).split())
+
+# ===== 공지 리스트 HTML 파싱 =====
+# page_url: 목록 페이지 주소. 상세 URL 은 여기에 href 의 쿼리를 붙여 만든다.
+@metrics.timed('parse_list')
+def parse_notice_list(html, page_url=list_url):
+    return _parse_list_rows(BeautifulSoup(html, DEFAULT_PARSER), page_url)
+
+# 목록 + 게시판 전체 글 수 (첫 페이지에서 읽는다. 못 읽으면 None)
+@metrics.timed('parse_list')
+def parse_notice_list_page(html, page_url=list_url, articles_per_page=10):
+    soup = BeautifulSoup(html, DEFAULT_PARSER)
+    return _parse_list_rows(soup, page_url), _parse_total_articles(soup, articles_per_page)
+
+def _parse_list_rows(soup, page_url):
+    notices = []
+    for row in soup.select('td.b-td-left.b-td-title'):
+        title_box = row.select_one('div.b-title-box')
+        if title_box is None:
+            continue
+        if 'b-notice' in (title_box.get('class') or []):
+            continue
+
+        link_tag = title_box.select_one('a')
+        href = link_tag.get('href') if link_tag else None
+        if not href or '?' not in href:
+            print("[!] 리스트 항목 파싱 실패:", row.get_text(strip=True)[:40])
+            continue
+
+        title = _visible_text(link_tag)
+        detail_url = page_url.split('?')[0] + href[href.find('?'):]
+        # 목록 행에도 작성일이 있어서 본문을 열지 않고 날짜를 알 수 있다. (없으면 None)
+        date_tag = row.select_one('div.b-m-con span.b-date')
+        posted = date_tag.get_text(strip=True) if date_tag else None
+        notices.append({'title': title, 'url': detail_url, 'date': posted})
+
+    return notices
+
+# ===== 게시판 전체 글 수 =====
+# 1) 첫 페이지 첫 일반 글의 번호 칸(b-num-box)이 곧 전체 글 수 (고정 공지는 '공지' 라 건너뜀)
+# 2) 번호 칸이 없으면 페이지 링크 중 가장 큰 article.offset + 한 페이지 글 수 (마지막 페이지까지 덮는 상한)
+def _parse_total_articles(soup, articles_per_page=10):
+    for cell in soup.select('td.b-num-box'):
+        text = cell.get_text(strip=True)
+        if text.isdigit():
+            return int(text)
+
+    offsets = [int(match.group(1)) for link in soup.select('div.b-paging01 a[href]')
+               for match in [ARTICLE_OFFSET_RE.search(link['href'])] if match]
+    if offsets:
+        return max(offsets) + articles_per_page
+    return None
+
+# ===== 공지 본문 HTML 파싱 =====
+# 작성일/본문 영역을 찾지 못하면 None 을 돌려줘서 호출 쪽이 Selenium 으로 넘어가게 한다.
+@metrics.timed('parse_detail')
+def parse_notice_detail(html, page_url=list_url):
+    soup = BeautifulSoup(html, DEFAULT_PARSER)
+
+    date_element = soup.select_one('div.b-etc-box li.b-date-box span:nth-child(2)')
+    if date_element is None:
+        return None
+    date_text = date_element.get_text(strip=True)
+
+    content_text = ""
+    found_content_box = False
+    for selector in ['div.b-content-box div.fr-view', 'div.b-content-box']:
+        element = soup.select_one(selector)
+        if element is None:
+            continue
+        found_content_box = True
+        content_text = clean_html_keep_table(element.decode_contents())
+        if content_text.strip():
+            break
+
+    if not found_content_box:
+        return None
+    if not content_text.strip():
+        content_text = "(본문 없음)"
+
+    doc_links = []
+    img_links = []
+    for file in soup.select('div.b-file-box a.file-down-btn'):
+        file_href = file.get('href')
+        file_name = _visible_text(file)
+        if file_href and file_name:
+            classify_file_link(file_name, urljoin(page_url, file_href), doc_links, img_links)
+
+    return date_text, content_text, doc_links, img_links
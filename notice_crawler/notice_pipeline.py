@@ -0,0 +1,136 @@
+import asyncio
+
+from .notice_parser import list_url
+from .notice_http import fetch_notice_list, fetch_notice_detail
+from .pacing import HostPacer
+from . import metrics
+
+# 요청 함수가 스스로 슬롯을 잡을 때 (Crawler 는 재시도 한 번마다 pacer 슬롯을 잡는다)
+class NoLimit:
+    async def acquire(self, url):
+        pass
+
+    def release(self, url, error=None):
+        pass
+
+NO_LIMIT = NoLimit()
+
+# ===== 비동기 크롤링 파이프라인 =====
+# 리스트 페이지 생산자 -> (크기 제한 큐) -> 본문 작업자 N개
+# - max_pages_in_flight: 동시에 처리 중인 리스트 페이지 수 (백프레셔)
+# - queue_size: 대기 중인 본문 URL 최대 개수. 큐가 차면 생산자가 멈춘다.
+# - on_notice(offset, idx, notice, result) 가 True 를 돌려주면 새 페이지를 더 가져오지 않는다.
+# - select_notices(offset, notices) 로 본문을 가져올 공지만 고를 수 있다.
+#   None 을 돌려주면 그 페이지에서 멈추고 새 페이지를 더 가져오지 않는다. (증분 크롤링)
+# - on_page_done(offset) 은 그 페이지의 공지가 모두 처리되면 불린다. (체크포인트)
+# - on_detail_failed(offset, idx, notice, error) 는 본문을 끝내 못 받은 공지마다 불린다. (실패 목록)
+# - on_list_failed(offset, error) 는 리스트 페이지를 끝내 못 받으면 불린다. 그 페이지는 처리한 것으로 친다.
+#   (체크포인트가 그 자리에서 멈추지 않도록. 다시 받는 것은 실패 목록 쪽에서)
+# - limiter: 기본은 초당 requests_per_second 상한의 pacing.HostPacer (요청 간격은 두지 않고 상한만, 연결 오류가 나면 동시 요청을 줄인다).
+#   설정을 바꾼 HostPacer 를 넘기면 그 조절을 따른다.
+#   fetch_list/fetch_detail 이 재시도하면서 알아서 슬롯을 잡으면 NO_LIMIT (재시도 대기 중에 슬롯을 쥐고 있지 않도록)
+# - limit_url(offset): 리스트 요청을 어느 주소로 속도 제한할지. 여러 게시판을 섞어 돌릴 때 쓴다. (기본은 url)
+# 요청 자체는 requests 세션을 스레드에서 돌린다 (커넥션 풀 공유).
+# 속도 제한 대기 시간, 리스트/본문 처리 시간, 큐 길이, 실패 수는 metrics 에 남는다.
+async def crawl_pipeline(offsets, session, on_notice,
+                         detail_workers=8, max_pages_in_flight=2, queue_size=50,
+                         requests_per_second=2.0, url=list_url,
+                         fetch_list=None, fetch_detail=None, limiter=None,
+                         select_notices=None, on_page_done=None, limit_url=None,
+                         on_detail_failed=None, on_list_failed=None):
+    if fetch_list is None:
+        fetch_list = lambda offset: fetch_notice_list(session, offset=offset, url=url)
+    if fetch_detail is None:
+        fetch_detail = lambda detail_url: fetch_notice_detail(session, detail_url)
+    if limiter is None:
+        limiter = HostPacer(max_rate=requests_per_second, start_delay=0, min_delay=0)
+    if limit_url is None:
+        limit_url = lambda offset: url
+
+    queue = asyncio.Queue(maxsize=queue_size)
+    offset_iter = iter(offsets)
+    stop_event = asyncio.Event()
+    pending = {}   # offset -> 아직 처리 안 된 공지 수
+
+    async def limited(key_url, fn, arg):
+        await limiter.acquire(key_url)
+        error = None
+        try:
+            return await asyncio.to_thread(fn, arg)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            limiter.release(key_url, error)
+
+    def finish_one(offset):
+        pending[offset] -= 1
+        if pending[offset] == 0:
+            del pending[offset]
+            metrics.inc('pages_done')
+            if on_page_done is not None:
+                on_page_done(offset)
+
+    async def produce_pages():
+        for offset in offset_iter:
+            if stop_event.is_set():
+                break
+            try:
+                with metrics.timer('list_page'):
+                    notices = await limited(limit_url(offset), fetch_list, offset)
+            except Exception as e:
+                print(f"[!] 리스트 페이지 실패 (offset {offset}):", e)
+                metrics.inc('failures', stage='list')
+                metrics.event('list_failed', offset=offset, error=str(e))
+                if on_list_failed is not None:
+                    on_list_failed(offset, e)
+                pending[offset] = 1
+                finish_one(offset)
+                continue
+            positions = {id(notice): idx for idx, notice in enumerate(notices, start=1)}
+            if select_notices is not None:
+                notices = select_notices(offset, notices)
+                if notices is None:
+                    stop_event.set()
+                    break
+            pending[offset] = len(notices) + 1
+            for notice in notices:
+                await queue.put((offset, positions[id(notice)], notice))
+                metrics.set_gauge('detail_queue_depth', queue.qsize())
+            finish_one(offset)
+
+    async def consume_details():
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                offset, idx, notice = item
+                metrics.set_gauge('detail_queue_depth', queue.qsize())
+                try:
+                    with metrics.timer('detail_page'):
+                        result = await limited(notice['url'], fetch_detail, notice['url'])
+                except Exception as e:
+                    print(f"[!] 본문 크롤링 실패: {notice['url']} ({e})")
+                    metrics.inc('failures', stage='detail')
+                    metrics.event('detail_failed', url=notice['url'], error=str(e))
+                    if on_detail_failed is not None:
+                        on_detail_failed(offset, idx, notice, e)
+                else:
+                    metrics.inc('notices_done')
+                    if on_notice(offset, idx, notice, result):
+                        stop_event.set()
+                finish_one(offset)
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(consume_details()) for _ in range(detail_workers)]
+    producers = [asyncio.create_task(produce_pages()) for _ in range(max_pages_in_flight)]
+    try:
+        await asyncio.gather(*producers)
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for task in producers + workers:
+            task.cancel()
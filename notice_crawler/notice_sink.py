@@ -0,0 +1,146 @@
+import csv
+import gzip
+import json
+import os
+import sys
+
+NOTICE_FIELDS = ['제목', '작성일', '본문', '문서파일 링크', '이미지파일 링크']
+
+# ===== 스트리밍 저장 =====
+# 공지를 받는 즉시 한 줄씩 쓰고 flush 해서, 중간에 죽어도 그때까지 받은 공지는 남는다.
+# - fmt: 'csv' (utf-8-sig, 한글 헤더 유지) 또는 'jsonl'
+# - compress=True 면 gzip 으로 저장 (.gz 확장자를 붙인다)
+# - append=True 면 이어쓰기 (재시작 시). 기존 파일이 있으면 헤더/BOM 은 다시 쓰지 않는다.
+#   기존 CSV 의 헤더가 fieldnames 와 다르면 (예: '중복 원본' 칸 유무) 칸이 어긋나므로 ValueError.
+# - fmt 'parquet' / 'arrow' (columnar 참고): 컬럼 파일은 한 줄씩 덧붙일 수 없어서
+#   옆의 <경로>.staging.jsonl 에 똑같이 한 줄씩 쓰고, close() 때 달별 row group 으로 바꿔 저장한 뒤 지운다.
+#   이어쓰기면 기존 컬럼 파일 내용을 staging 에 먼저 옮겨 둔다. (죽어서 staging 이 남아 있으면 거기에 이어 쓴다)
+class NoticeSink:
+    def __init__(self, path, fmt='csv', compress=False, append=False, fieldnames=NOTICE_FIELDS):
+        if fmt not in ('csv', 'jsonl', 'parquet', 'arrow'):
+            raise ValueError(f"지원하지 않는 출력 형식: {fmt}")
+        self.columnar = fmt in ('parquet', 'arrow')
+        if compress and not path.endswith('.gz') and not self.columnar:
+            path += '.gz'
+        self.path = path
+        self.fmt = fmt
+        self.compress = compress
+        self.fieldnames = fieldnames
+        self.count = 0
+
+        if self.columnar:
+            from .columnar import iter_columnar_records, require_pyarrow
+            require_pyarrow()   # 크롤링이 다 끝난 뒤 close() 에서 실패하지 않도록 미리 확인
+            self.staging_path = path + '.staging.jsonl'
+            seed = append and not os.path.exists(self.staging_path) and os.path.exists(path)
+            self.file = open(self.staging_path, 'at' if append else 'wt', encoding='utf-8')
+            if seed:
+                for record in iter_columnar_records(path):
+                    self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+                self.file.flush()
+            return
+
+        resuming = append and os.path.exists(path) and os.path.getsize(path) > 0
+        if resuming and fmt == 'csv':
+            existing = read_csv_header(path)
+            if existing != list(fieldnames):
+                raise ValueError(f"{path} 의 칸 {existing} 이 이번 저장 칸 {list(fieldnames)} 과 달라 이어쓸 수 없습니다. "
+                                 "같은 옵션(--duplicates 등)으로 실행하거나 파일을 옮기세요.")
+        mode = 'at' if append else 'wt'
+        # 이어쓸 때 BOM 이 중간에 또 들어가지 않도록 utf-8 로 연다.
+        encoding = 'utf-8' if resuming or fmt == 'jsonl' else 'utf-8-sig'
+        if compress:
+            self.file = gzip.open(path, mode, encoding=encoding, newline='')
+        else:
+            self.file = open(path, mode, encoding=encoding, newline='')
+
+        if fmt == 'csv':
+            self.writer = csv.DictWriter(self.file, fieldnames=fieldnames)
+            if not resuming:
+                self.writer.writeheader()
+                self.file.flush()
+
+    def write(self, record):
+        if self.fmt == 'csv':
+            self.writer.writerow(record)
+        else:
+            self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.file.flush()
+        self.count += 1
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.file.close()
+        if self.columnar:
+            from .columnar import write_columnar
+            write_columnar(read_records(self.staging_path), self.path, fmt=self.fmt, compress=self.compress)
+            os.remove(self.staging_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_csv_header(path):
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8-sig', newline='') as f:
+        return next(csv.reader(f), [])
+
+# ===== 저장된 크롤링 결과 읽기 =====
+# NoticeSink 가 쓴 CSV / JSONL (.gz 포함) / Parquet / Arrow 를 한 건씩 dict 로 돌려준다.
+def read_records(path):
+    if path.endswith('.parquet') or path.endswith('.arrow'):
+        from .columnar import iter_columnar_records
+        yield from iter_columnar_records(path)
+        return
+    is_jsonl = path.endswith('.jsonl') or path.endswith('.jsonl.gz')
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8-sig', newline='') as f:
+        if is_jsonl:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            # 본문이 긴 공지가 있어서 CSV 칸 크기 제한을 풀어둔다.
+            csv.field_size_limit(min(sys.maxsize, 2**31 - 1))
+            yield from csv.DictReader(f)
+
+# ===== 재시작용 체크포인트 =====
+# 리스트 페이지(offset)가 끝날 때마다 표시하고, 앞에서부터 빠짐없이 끝난 마지막 다음 offset 을 저장한다.
+# 작업자가 동시에 돌기 때문에 뒤쪽 페이지가 먼저 끝날 수 있어서 연속 구간만 인정한다.
+# 재시작하면 next_offset 부터 다시 가져온다. (이미 써진 뒤쪽 페이지 공지는 한 번 더 써질 수 있음)
+class Checkpoint:
+    def __init__(self, path, step=10, start=0):
+        self.path = path
+        self.step = step
+        self.next_offset = start
+        self.done = set()
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.next_offset = json.load(f).get('next_offset', start)
+
+    @property
+    def resumed(self):
+        return self.next_offset > 0
+
+    def mark_done(self, offset):
+        self.done.add(offset)
+        advanced = False
+        while self.next_offset in self.done:
+            self.done.discard(self.next_offset)
+            self.next_offset += self.step
+            advanced = True
+        if advanced:
+            self.save()
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'next_offset': self.next_offset}, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
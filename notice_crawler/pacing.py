@@ -0,0 +1,212 @@
+import asyncio
+import random
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from . import metrics
+
+# 서버가 "천천히 보내라" 는 뜻으로 보내는 상태 코드 (5xx 전체도 같이 취급)
+THROTTLE_STATUS = {429, 503}
+
+# ===== 적응형 요청 속도 조절 =====
+# 고정 sleep 대신 서버 상태를 보고 요청 간격(delay)과 동시 요청 수(concurrency)를 조절한다.
+# - 응답 시간(EWMA)이 target_latency 안이고 오류가 없으면 healthy_streak 번마다 간격을 줄이고 동시 요청을 하나 늘린다.
+# - 느려지면 동시 요청을 하나 줄인다.
+# - 429/5xx/연결 오류면 간격을 두 배로 (max_delay 까지), 동시 요청은 절반으로. Retry-After 가 있으면 따른다.
+# - 매 요청 간격에는 jitter 비율만큼 무작위 흔들림을 섞어서 작업자들이 한꺼번에 몰리지 않게 한다.
+# 스레드(Selenium, 다운로드)와 asyncio(파이프라인) 양쪽에서 같이 쓸 수 있다.
+# bucket 을 주면 (RateBucket) 그 버킷에서 토큰도 하나 받아야 요청을 보낸다. (여러 pacer 가 나눠 쓰는 전체 상한)
+class AdaptivePacer:
+    def __init__(self, start_delay=0.5, min_delay=0.1, max_delay=60.0,
+                 min_concurrency=1, max_concurrency=4, start_concurrency=2,
+                 target_latency=1.5, healthy_streak=10, jitter=0.3, bucket=None):
+        self.delay = start_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.concurrency = max(min_concurrency, min(start_concurrency, max_concurrency))
+        self.target_latency = target_latency
+        self.healthy_streak = healthy_streak
+        self.jitter = jitter
+        self.bucket = bucket
+
+        self.latency = None     # 응답 시간 EWMA (초)
+        self.in_flight = 0
+        self.next_at = 0.0      # 다음 요청을 보내도 되는 시각 (monotonic)
+        self.streak = 0
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    # ----- 관측 -----
+    def record(self, latency=None, status=None, error=False, retry_after=None):
+        with self._lock:
+            self.requests += 1
+            if latency is not None:
+                self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+
+            if error or (status is not None and (status in THROTTLE_STATUS or status >= 500)):
+                if status in THROTTLE_STATUS:
+                    self.throttled += 1
+                else:
+                    self.errors += 1
+                metrics.inc('backoffs', reason='throttled' if status in THROTTLE_STATUS else 'error')
+                self._back_off(retry_after)
+            elif self.latency is not None and self.latency > self.target_latency:
+                self.streak = 0
+                self.concurrency = max(self.min_concurrency, self.concurrency - 1)
+            else:
+                self.streak += 1
+                if self.streak >= self.healthy_streak:
+                    self.streak = 0
+                    self.delay = max(self.min_delay, self.delay * 0.8)
+                    self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+
+    def _back_off(self, retry_after):
+        self.streak = 0
+        self.delay = min(self.max_delay, max(self.min_delay, self.delay * 2))
+        self.concurrency = max(self.min_concurrency, self.concurrency // 2)
+        pause = max(retry_after or 0, self.delay * random.uniform(1, 1 + self.jitter))
+        self.next_at = max(self.next_at, time.monotonic() + pause)
+
+    # requests 세션 응답 훅: session.hooks['response'].append(pacer.observe)
+    def observe(self, response, *args, **kwargs):
+        self.record(latency=response.elapsed.total_seconds(), status=response.status_code,
+                    retry_after=retry_after(response))
+        return response
+
+    # ----- 요청 슬롯 -----
+    # 지금 보내도 되면 슬롯을 잡고 0, 아니면 기다릴 시간(초)을 돌려준다.
+    def _try_start(self):
+        with self._lock:
+            now = time.monotonic()
+            if self.in_flight >= self.concurrency:
+                return 0.05
+            if now < self.next_at:
+                return self.next_at - now
+            # 전체 상한: 토큰이 없으면 슬롯을 잡지 않고 기다린다
+            if self.bucket is not None:
+                wait = self.bucket.try_take()
+                if wait:
+                    return wait
+            self.in_flight += 1
+            spacing = self.delay * random.uniform(1 - self.jitter / 2, 1 + self.jitter / 2)
+            self.next_at = now + spacing
+            return 0
+
+    @metrics.timed('rate_limit_wait')
+    def acquire(self):
+        while True:
+            wait = self._try_start()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        with metrics.timer('rate_limit_wait'):
+            while True:
+                wait = self._try_start()
+                if not wait:
+                    return
+                await asyncio.sleep(wait)
+
+    # error 는 요청 중 난 예외. 응답이 붙은 예외(HTTPError)는 이미 훅에서 기록했으므로 빼고,
+    # 연결 끊김/타임아웃처럼 응답이 없는 경우만 오류로 센다. (요청을 보내지도 않은 회로 차단기 거절도 뺀다)
+    def release(self, error=None):
+        with self._lock:
+            self.in_flight -= 1
+            metrics.set_gauge('requests_in_flight', self.in_flight)
+        if error is not None and getattr(error, 'response', None) is None and getattr(error, 'sent', True):
+            self.record(error=True)
+
+    # 스레드에서 쓰는 형태. measure=True 면 블록 실행 시간을 응답 시간으로 기록한다 (Selenium 처럼 훅이 없을 때)
+    @contextmanager
+    def request(self, measure=False):
+        self.acquire()
+        start = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.release(error)
+            if measure and error is None:
+                self.record(latency=time.perf_counter() - start)
+
+    def summary(self):
+        latency = f"{self.latency:.2f}s" if self.latency is not None else '-'
+        return (f"요청 {self.requests}, 오류 {self.errors}, 429/503 {self.throttled}, "
+                f"응답시간 {latency}, 간격 {self.delay:.2f}s, 동시 {self.concurrency}")
+
+def retry_after(response):
+    value = response.headers.get('Retry-After')
+    if value and value.strip().isdigit():
+        return float(value)
+    return None
+
+# ===== 전체 요청 속도 상한 (토큰 버킷) =====
+# 호스트별 pacer 위에 하나 두고 모든 게시판/호스트가 나눠 쓴다.
+# 게시판마다 몫을 나누지 않는다. 누가 먼저 가져갈지는 스케줄러 순서(라운드 로빈)에 맡긴다.
+# 스레드와 asyncio 양쪽에서 부르므로 기다리지 않고 기다릴 시간만 돌려준다. (AdaptivePacer._try_start 참고)
+class RateBucket:
+    def __init__(self, rate, burst=None):
+        self.rate = rate                        # 초당 토큰 수
+        self.capacity = burst or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.taken = 0
+        self._lock = threading.Lock()
+
+    # 토큰이 있으면 하나 쓰고 0, 없으면 기다릴 시간(초)
+    def try_take(self):
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                return (1 - self.tokens) / self.rate
+            self.tokens -= 1
+            self.taken += 1
+            return 0
+
+# ===== 호스트별 적응형 조절 =====
+# crawl_pipeline 의 limiter 로 넘길 수 있다 (acquire/release).
+# max_rate 를 주면 모든 호스트를 합친 초당 요청 수도 그 아래로 막는다. (RateBucket 하나를 같이 씀)
+class HostPacer:
+    def __init__(self, max_rate=None, max_burst=None, **pacer_options):
+        self.pacer_options = pacer_options
+        self.bucket = RateBucket(max_rate, max_burst) if max_rate else None
+        self.pacers = {}
+        self._lock = threading.Lock()
+
+    def for_url(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            pacer = self.pacers.get(host)
+            if pacer is None:
+                pacer = self.pacers[host] = AdaptivePacer(bucket=self.bucket, **self.pacer_options)
+        return pacer
+
+    async def acquire(self, url):
+        await self.for_url(url).acquire_async()
+
+    def release(self, url, error=None):
+        self.for_url(url).release(error)
+
+    def request(self, url, measure=False):
+        return self.for_url(url).request(measure=measure)
+
+    def observe(self, response, *args, **kwargs):
+        return self.for_url(response.url).observe(response)
+
+    def summary(self):
+        lines = [f"{host}: {pacer.summary()}" for host, pacer in self.pacers.items()]
+        if self.bucket is not None:
+            lines.append(f"전체 상한 {self.bucket.rate:g}/s: 요청 {self.bucket.taken}")
+        return '\n'.join(lines)
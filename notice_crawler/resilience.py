@@ -0,0 +1,193 @@
+import random
+import threading
+import time
+from contextlib import nullcontext
+from urllib.parse import urlsplit
+
+import requests
+
+from .http_cache import CacheMiss
+from .pacing import retry_after
+from . import metrics
+
+# ===== 실패 종류 =====
+# 재시도하면 나아질 수 있는 실패 (시간 초과, 연결 끊김, 429/5xx, 페이지가 다 안 뜸) 와
+# 다시 해도 같은 실패 (404, replay 캐시에 없음 등) 를 나눈다. 앞쪽만 재시도하고 회로 차단기에 센다.
+class FetchError(Exception):
+    retryable = True
+
+class PageTimeout(FetchError):
+    pass
+
+class PermanentFetchError(FetchError):
+    retryable = False
+
+# 사이트가 너무 오래 응답하지 않아 기다리다 포기함 (요청은 보내지 않았다 -> pacing 이 오류로 세지 않는다)
+class CircuitOpenError(FetchError):
+    retryable = False
+    sent = False
+
+def is_retryable(error):
+    if isinstance(error, FetchError):
+        return error.retryable
+    if isinstance(error, CacheMiss):
+        return False
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return status is None or status == 429 or status >= 500
+    if isinstance(error, requests.RequestException):
+        return True
+    # selenium 예외 (TimeoutException, WebDriverException 등). selenium 을 여기서 불러오지 않으려고 모듈 이름으로 본다.
+    return type(error).__module__.startswith('selenium')
+
+# ===== 회로 차단기 (호스트별) =====
+# 연속 failure_threshold 번 실패하면 열림 -> 그 호스트로는 요청을 보내지 않고 작업자들이 기다린다 (크롤링 일시정지).
+# reset_timeout 이 지나면 반열림: 요청 하나만 시험으로 보낸다.
+#   성공 -> 닫힘, 실패 -> 다시 열림 (기다리는 시간은 두 배, max_reset_timeout 까지)
+#   404/replay 캐시 없음처럼 재시도하지 않는 오류는 어느 쪽으로도 세지 않는다 (시험 요청이었다면 다음 요청이 다시 시험)
+# max_pause 보다 오래 기다린 요청은 CircuitOpenError 로 포기한다 (실패 목록으로 간다).
+# 처음 열린 뒤 max_pause 가 지나도록 닫히지 않으면 그 뒤 요청은 기다리지 않고 바로 포기한다. (사이트가 아예 내려간 경우)
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold=5, reset_timeout=30.0, max_reset_timeout=600.0, max_pause=600.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.max_pause = max_pause
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self.down_since = None
+        self.times_opened = 0
+        self._probing = False
+        self._cond = threading.Condition()
+
+    # 요청을 보내도 될 때까지 기다린다.
+    def wait(self):
+        with self._cond:
+            start = time.monotonic()
+            while True:
+                if self.state == 'closed':
+                    return
+                now = time.monotonic()
+                if self.state == 'open' and now - self.opened_at >= self.reset_timeout:
+                    self.state = 'half_open'
+                    print(f"🔌 {self.name}: 시험 요청을 보냅니다")
+                if self.state == 'half_open' and not self._probing:
+                    self._probing = True
+                    return
+                if now - start >= self.max_pause or now - self.down_since >= self.max_pause:
+                    metrics.inc('circuit_rejected', host=self.name)
+                    raise CircuitOpenError(f"{self.name} 이(가) {self.max_pause:.0f}s 넘게 응답하지 않음")
+                wake_at = self.opened_at + self.reset_timeout if self.state == 'open' else now + 1.0
+                self._cond.wait(max(0.05, min(wake_at, start + self.max_pause) - now))
+
+    def record_success(self):
+        with self._cond:
+            if self.state != 'closed':
+                print(f"✅ {self.name}: 다시 응답함 -> 크롤링 재개")
+            self.state = 'closed'
+            self.failures = 0
+            self._probing = False
+            self.down_since = None
+            self.reset_timeout = self.base_reset_timeout
+            self._cond.notify_all()
+
+    # 재시도하지 않는 오류로 끝난 요청. 시험 요청이었다면 다른 요청이 시험할 수 있게 놓아준다.
+    def release_probe(self):
+        with self._cond:
+            if self._probing:
+                self._probing = False
+                self._cond.notify_all()
+
+    def record_failure(self):
+        with self._cond:
+            self.failures += 1
+            if self.state == 'half_open':
+                self.reset_timeout = min(self.max_reset_timeout, self.reset_timeout * 2)
+                self._open()
+            elif self.state == 'closed' and self.failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self):
+        self.state = 'open'
+        self.opened_at = time.monotonic()
+        if self.down_since is None:
+            self.down_since = self.opened_at
+        self._probing = False
+        self.times_opened += 1
+        metrics.inc('circuit_opened', host=self.name)
+        print(f"🛑 {self.name}: 연속 {self.failures}번 실패 -> {self.reset_timeout:.0f}s 동안 요청을 멈춥니다")
+        self._cond.notify_all()
+
+# ===== 재시도 정책 =====
+# call(url, fetch) 은 fetch(url, timeout) 을 부른다.
+# - deadline: 페이지 하나에 쓰는 시간 상한 (재시도, 백오프 포함). 요청마다 남은 시간만큼만 timeout 을 준다.
+# - attempts: 최대 시도 횟수. 재시도 사이에는 base_delay * 2^n (max_delay 까지, jitter) 만큼 쉰다. Retry-After 가 있으면 따른다.
+# - 호스트별 회로 차단기가 열려 있으면 deadline 과 상관없이 닫힐 때까지 기다린다.
+# - slot 을 주면 요청 슬롯은 시도하는 동안만 잡는다. 재시도도 매번 pacer 간격을 지킨다.
+class RetryPolicy:
+    def __init__(self, attempts=3, deadline=30.0, timeout=10.0, base_delay=1.0, max_delay=15.0,
+                 failure_threshold=5, reset_timeout=30.0, max_pause=600.0):
+        self.attempts = attempts
+        self.deadline = deadline
+        self.timeout = timeout
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker_options = {'failure_threshold': failure_threshold, 'reset_timeout': reset_timeout,
+                                'max_pause': max_pause}
+        self.breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker_for(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            breaker = self.breakers.get(host)
+            if breaker is None:
+                breaker = self.breakers[host] = CircuitBreaker(host, **self.breaker_options)
+        return breaker
+
+    # slot(url): 시도 한 번마다 잡을 요청 슬롯 (pacer.request 같은 context manager). 백오프/차단기 대기 중에는 놓는다.
+    def call(self, url, fetch, stage='detail', slot=None):
+        breaker = self.breaker_for(url)
+        attempt = 0
+        deadline = None
+        while True:
+            attempt += 1
+            breaker.wait()
+            try:
+                with slot(url) if slot is not None else nullcontext():
+                    # 슬롯을 기다린 시간은 deadline 에 넣지 않는다
+                    if deadline is None:
+                        deadline = time.monotonic() + self.deadline
+                    remaining = deadline - time.monotonic()
+                    result = fetch(url, max(1.0, min(self.timeout, remaining)))
+            except Exception as e:
+                if not is_retryable(e):
+                    breaker.release_probe()
+                    raise
+                breaker.record_failure()
+                delay = self._backoff(attempt, e)
+                # 슬롯을 잡다가 실패했다면 deadline 이 아직 없다 -> 시도 횟수만 본다
+                out_of_time = deadline is not None and time.monotonic() + delay >= deadline
+                if attempt >= self.attempts or out_of_time:
+                    metrics.inc('retries_exhausted', stage=stage)
+                    raise
+                metrics.inc('retries', stage=stage)
+                print(f"🔁 {attempt}번째 실패, {delay:.1f}s 뒤 다시 시도: {url} ({e})")
+                time.sleep(delay)
+                continue
+            breaker.record_success()
+            return result
+
+    def _backoff(self, attempt, error):
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+        response = getattr(error, 'response', None)
+        if response is not None:
+            delay = max(delay, retry_after(response) or 0)
+        return delay
+
+    def summary(self):
+        opened = {host: breaker.times_opened for host, breaker in self.breakers.items() if breaker.times_opened}
+        return ', '.join(f"{host}: 차단 {count}번" for host, count in opened.items()) or '차단 없음'
@@ -0,0 +1,100 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from .dead_letters import list_page_url
+from . import metrics
+
+# ===== 여러 게시판 스케줄러 =====
+# 게시판 여러 개를 파이프라인 하나로 돌린다.
+# - 세션(커넥션 풀), 호스트별 요청 속도(pacer), 본문 작업자 수는 모든 게시판이 나눠 쓴다.
+# - 초당 요청 수 전체 상한(max_requests_per_second)도 버킷 하나를 같이 쓴다. 게시판별 몫은 따로 없고
+#   라운드 로빈 순서대로 가져간다.
+# - 리스트 페이지는 게시판마다 한 페이지씩 돌아가며 낸다 (라운드 로빈).
+#   큰 게시판이 끝날 때까지 작은 게시판이 기다리지 않는다.
+# - 게시판 하나가 멈춰도 (증분 크롤링에서 모두 본 공지 등) 나머지 게시판은 계속 돈다.
+# 파이프라인에는 offset 대신 (게시판, offset) 을 넘긴다.
+class BoardScheduler:
+    def __init__(self, crawler, boards):
+        self.crawler = crawler
+        self.boards = list(boards)
+        self.totals = {}
+        self.finished = set()
+        self._first_pages = {}   # 글 수를 읽으려고 받아 둔 첫 페이지 -> 파이프라인에서 다시 요청하지 않는다
+
+    # 각 게시판 첫 페이지에서 전체 글 수를 읽는다. (동시에, 요청 속도는 pacer 가 조절)
+    def resolve_totals(self):
+        pending = [board for board in self.boards if board not in self.totals]
+        with ThreadPoolExecutor(max_workers=max(1, self.crawler.config.detail_workers)) as executor:
+            for board, total in zip(pending, executor.map(self._probe, pending)):
+                self.totals[board] = total
+                print(f"📋 {board.name}: 글 {total}개 ({board.list_url})")
+        return self.totals
+
+    def _probe(self, board):
+        if board.total_articles is not None:
+            return board.total_articles
+        try:
+            notices, total = self.crawler.probe_board(board.list_url)
+        except Exception as e:
+            print(f"[!] {board.name}: 목록 첫 페이지 요청 실패: {e}")
+            notices, total = None, None
+        if notices:
+            self._first_pages[board] = notices
+        if total is None:
+            total = self.crawler.config.fallback_total_articles
+            print(f"[!] {board.name}: 게시판 글 수를 읽지 못해 {total}개로 가정")
+        return total
+
+    def finish(self, board):
+        if board not in self.finished:
+            self.finished.add(board)
+            metrics.inc('boards_finished')
+
+    # (게시판, offset) 을 게시판마다 하나씩 돌아가며 낸다. 끝난 게시판은 건너뛴다.
+    def jobs(self):
+        step = self.crawler.config.articles_per_page
+        cursors = {board: iter(range(0, self.totals[board], step)) for board in self.boards}
+        while cursors:
+            for board in list(cursors):
+                offset = None if board in self.finished else next(cursors[board], None)
+                if offset is None:
+                    del cursors[board]
+                    continue
+                yield board, offset
+
+    def fetch_list(self, job):
+        board, offset = job
+        if offset == 0 and board in self._first_pages:
+            return self._first_pages.pop(board)
+        return self.crawler.fetch_list(offset, url=board.list_url)
+
+    # on_notice(board, offset, idx, notice, result) 가 True 면 그 게시판만 멈춘다.
+    # select_notices(board, offset, notices) 가 None 이면 그 게시판만 멈춘다.
+    async def run(self, on_notice, select_notices=None):
+        if len(self.totals) < len(self.boards):
+            self.resolve_totals()
+
+        def select(job, notices):
+            board, offset = job
+            if board in self.finished:
+                return []
+            if select_notices is None:
+                return notices
+            chosen = select_notices(board, offset, notices)
+            if chosen is None:
+                self.finish(board)
+                return []
+            return chosen
+
+        def handle(job, idx, notice, result):
+            board, offset = job
+            if on_notice(board, offset, idx, notice, result):
+                self.finish(board)
+            return False
+
+        await self.crawler.run(
+            self.jobs(), handle,
+            select_notices=select,
+            fetch_list=self.fetch_list,
+            limit_url=lambda job: job[0].list_url,
+            list_page_url=lambda job: list_page_url(job[0].list_url, job[1]),
+        )
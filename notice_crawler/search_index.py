@@ -0,0 +1,282 @@
+import re
+import sqlite3
+import time
+import unicodedata
+import zlib
+from collections import defaultdict
+
+from .notice_parser import parse_posted_date
+from .notice_extract import extract_info
+from .seen_index import article_no_from_url
+from . import metrics
+
+# ===== 공지 검색 인덱스 (역색인, SQLite) =====
+# 크롤링하면서 공지를 하나씩 넣는다. CSV 전체를 읽어서 훑지 않고 바로 찾을 수 있다.
+# - 본문/제목: 한글은 형태소 분석 없이 글자 1-gram + 2-gram 으로 색인 (조사가 붙어도 찾힘)
+#   글자 조각이 다 있어도 붙어 있지 않을 수 있으니 후보는 저장해 둔 본문(zlib)으로 한 번 더 확인
+# - 포스팅 리스트: 문서 번호 차이를 varint 로 이어 붙인 BLOB (새 문서는 번호가 커서 뒤에 붙이기만 하면 된다)
+# - 구조화 필드: 카테고리, 행사 기간(시작/끝), 신청 마감일, 작성일 -> 칼럼 + SQLite 인덱스로 범위 검색
+# 바뀐 공지는 예전 문서를 지우고 새 번호로 다시 넣는다. (번호는 다시 쓰지 않음 - AUTOINCREMENT)
+# 지운 번호는 포스팅에 남아 있다가 optimize() 때 빠진다. 제목/작성일/본문이 그대로면 다시 넣지 않는다.
+# 문서 키는 제목 + 작성일 하나로 쓴다. 크롤링 중(add_notice)이나 저장된 CSV(add_record)나 같은 공지는 같은 키.
+TOKEN_RE = re.compile(r'[0-9a-zㄱ-ㆎ가-힣]+')
+FLUSH_EVERY = 200   # 이만큼 문서가 쌓이면 포스팅을 DB 에 붙인다
+
+def normalize_text(text):
+    return ' '.join(unicodedata.normalize('NFKC', text or '').lower().split())
+
+# 덩어리마다 글자 1-gram + 2-gram
+def index_terms(text):
+    terms = set()
+    for token in TOKEN_RE.findall(normalize_text(text)):
+        terms.update(token)
+        terms.update(token[i:i + 2] for i in range(len(token) - 1))
+    return terms
+
+# 검색어는 덩어리마다 2-gram 만 (한 글자 덩어리는 1-gram) -> 포스팅 수를 줄인다.
+def query_terms(query):
+    terms = set()
+    tokens = TOKEN_RE.findall(normalize_text(query))
+    for token in tokens:
+        if len(token) == 1:
+            terms.add(token)
+        else:
+            terms.update(token[i:i + 2] for i in range(len(token) - 1))
+    return terms, tokens
+
+# ===== 포스팅 인코딩 (varint, 차이값) =====
+def encode_ids(doc_ids, last=0):
+    out = bytearray()
+    for doc_id in doc_ids:
+        delta = doc_id - last
+        last = doc_id
+        while delta >= 0x80:
+            out.append(delta & 0x7f | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return bytes(out)
+
+def decode_ids(data):
+    doc_ids = []
+    last = value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7f) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            last += value
+            doc_ids.append(last)
+            value = shift = 0
+    return doc_ids
+
+def doc_key(title, posted_date):
+    return f"{title}\0{posted_date}"
+
+def _iso(posted):
+    posted = parse_posted_date(posted) if posted else None
+    return posted.isoformat() if posted else None
+
+class SearchIndex:
+    def __init__(self, path='kangwon_notices_search.sqlite3', flush_every=FLUSH_EVERY):
+        self.path = path
+        self.flush_every = flush_every
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS docs (
+                doc_id      INTEGER PRIMARY KEY AUTOINCREMENT,
+                doc_key     TEXT UNIQUE,
+                title       TEXT,
+                url         TEXT,
+                posted_date TEXT,
+                category    TEXT,
+                event_start TEXT,
+                event_end   TEXT,
+                deadline    TEXT,
+                body        BLOB
+            );
+            CREATE INDEX IF NOT EXISTS docs_posted ON docs (posted_date);
+            CREATE INDEX IF NOT EXISTS docs_category ON docs (category, posted_date);
+            CREATE INDEX IF NOT EXISTS docs_deadline ON docs (deadline);
+            CREATE INDEX IF NOT EXISTS docs_event ON docs (event_start, event_end);
+            CREATE TABLE IF NOT EXISTS postings (
+                term      TEXT PRIMARY KEY,
+                doc_count INTEGER,
+                last_id   INTEGER,
+                data      BLOB
+            ) WITHOUT ROWID;
+        ''')
+        self.conn.commit()
+        self._pending = defaultdict(list)   # term -> 아직 DB 에 안 붙인 문서 번호
+        self._pending_docs = 0
+        self.added = 0
+
+    # ===== 넣기 =====
+    # key: 같은 공지를 다시 넣으면 예전 것을 지우고 새로 넣는다. (doc_key 참고)
+    # info: extract_info 결과가 이미 있으면 넘긴다. 없으면 여기서 추출
+    def add(self, key, title, content, posted_date=None, url=None, info=None):
+        with metrics.timer('search_index_add'):
+            text = normalize_text(f"{title}\n{content}")
+            row = self.conn.execute('SELECT doc_id, title, posted_date, body FROM docs WHERE doc_key = ?',
+                                    (key,)).fetchone()
+            if row is not None and row[1:3] == (title, _iso(posted_date)) \
+                    and zlib.decompress(row[3]).decode('utf-8') == text:
+                # 바뀐 것이 없다 -> 포스팅에 죽은 번호를 만들지 않는다
+                if url is not None:
+                    self.conn.execute('UPDATE docs SET url = ? WHERE doc_id = ? AND url IS NOT ?', (url, row[0], url))
+                metrics.inc('search_index_unchanged')
+                return row[0]
+
+            if info is None:
+                info = extract_info(title, content, posted_date=posted_date)
+            dates = info.get('날짜') or []
+            if isinstance(dates, str):
+                dates = [part.strip() for part in dates.split('~')]
+
+            self.conn.execute('DELETE FROM docs WHERE doc_key = ?', (key,))
+            cursor = self.conn.execute(
+                'INSERT INTO docs (doc_key, title, url, posted_date, category, event_start, event_end, deadline, body) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, title, url, _iso(posted_date), info.get('카테고리'),
+                 dates[0] if dates else None, dates[-1] if dates else None,
+                 info.get('신청마감일') or None, zlib.compress(text.encode('utf-8')))
+            )
+            doc_id = cursor.lastrowid
+            for term in index_terms(text):
+                self._pending[term].append(doc_id)
+            self._pending_docs += 1
+            self.added += 1
+            if self._pending_docs >= self.flush_every:
+                self.flush()
+        return doc_id
+
+    # 크롤링 결과 (notice, (작성일, 본문, 문서 링크, 이미지 링크)) 를 그대로 넣는다.
+    # 예전에는 articleNo 를 키로 넣었다 -> 그 문서는 지운다 (CSV 로 다시 색인하면 같은 공지가 두 번 들어갔다)
+    def add_notice(self, notice, date, content, info=None):
+        self.conn.execute('DELETE FROM docs WHERE doc_key = ?', (article_no_from_url(notice['url']),))
+        return self.add(doc_key(notice['title'], date), notice['title'], content,
+                        posted_date=date, url=notice['url'], info=info)
+
+    # NoticeSink 로 저장한 CSV/JSONL 레코드 (URL 이 없다)
+    def add_record(self, record):
+        title = record.get('제목', '')
+        posted = record.get('작성일')
+        return self.add(doc_key(title, posted), title, record.get('본문', ''), posted_date=posted)
+
+    def flush(self):
+        if not self._pending:
+            self.conn.commit()
+            return
+        rows = []
+        for term, doc_ids in self._pending.items():
+            row = self.conn.execute('SELECT doc_count, last_id, data FROM postings WHERE term = ?', (term,)).fetchone()
+            count, last_id, data = row if row else (0, 0, b'')
+            rows.append((term, count + len(doc_ids), doc_ids[-1], data + encode_ids(doc_ids, last_id)))
+        self.conn.executemany('INSERT OR REPLACE INTO postings (term, doc_count, last_id, data) VALUES (?, ?, ?, ?)', rows)
+        self.conn.commit()
+        self._pending.clear()
+        self._pending_docs = 0
+
+    # 지운(바뀐) 공지 번호를 포스팅에서 빼고 DB 파일을 줄인다.
+    def optimize(self):
+        self.flush()
+        alive = {doc_id for (doc_id,) in self.conn.execute('SELECT doc_id FROM docs')}
+        rows = []
+        for term, data in self.conn.execute('SELECT term, data FROM postings').fetchall():
+            doc_ids = [doc_id for doc_id in decode_ids(data) if doc_id in alive]
+            rows.append((term, len(doc_ids), doc_ids[-1] if doc_ids else 0, encode_ids(doc_ids)))
+        self.conn.executemany('INSERT OR REPLACE INTO postings (term, doc_count, last_id, data) VALUES (?, ?, ?, ?)', rows)
+        self.conn.execute('DELETE FROM postings WHERE doc_count = 0')
+        self.conn.commit()
+        self.conn.execute('VACUUM')
+
+    # ===== 찾기 =====
+    # query: 띄어쓰기로 나눈 말이 모두 들어간 공지 (AND). 비우면 필드 조건만
+    # category: '공모전' 등 classify_category 결과
+    # deadline_from/to: 신청 마감일 범위, event_from/to: 행사 기간이 이 구간과 겹치는 공지
+    # posted_from/to: 작성일 범위. 날짜는 'YYYY-MM-DD' 또는 date
+    # 최근 작성일 순으로 limit 개를 돌려준다.
+    def search(self, query='', category=None, deadline_from=None, deadline_to=None,
+               event_from=None, event_to=None, posted_from=None, posted_to=None, limit=20):
+        self.flush()
+        start = time.perf_counter()
+        where, params = [], []
+        for column, op, value in [('category', '=', category),
+                                  ('deadline', '>=', deadline_from), ('deadline', '<=', deadline_to),
+                                  ('event_end', '>=', event_from), ('event_start', '<=', event_to),
+                                  ('posted_date', '>=', posted_from), ('posted_date', '<=', posted_to)]:
+            if value is not None:
+                where.append(f'{column} {op} ?')
+                params.append(str(value))
+
+        terms, tokens = query_terms(query)
+        candidates = self._candidates(terms) if terms else None
+        if candidates is not None and not candidates:
+            return []
+
+        # 2글자 이하 덩어리는 포스팅만으로 정확하다. 더 긴 덩어리만 본문으로 확인
+        verify = [token for token in tokens if len(token) > 2]
+        sql = 'SELECT doc_id, title, url, posted_date, category, event_start, event_end, deadline FROM docs'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY posted_date DESC, doc_id DESC'   # 작성일 없는 공지는 맨 뒤 (NULL 이 가장 작다)
+
+        results = []
+        for row in self._rows(sql, params, candidates):
+            doc_id, title, url, posted, category_, event_start, event_end, deadline = row
+            if verify and not self._contains(doc_id, verify):
+                continue
+            results.append({'doc_id': doc_id, '제목': title, 'url': url, '작성일': posted, '카테고리': category_,
+                            '행사시작': event_start, '행사끝': event_end, '신청마감일': deadline})
+            if len(results) >= limit:
+                break
+        metrics.observe('search_query', time.perf_counter() - start)
+        return results
+
+    def _contains(self, doc_id, tokens):
+        (body,) = self.conn.execute('SELECT body FROM docs WHERE doc_id = ?', (doc_id,)).fetchone()
+        text = zlib.decompress(body).decode('utf-8')
+        return all(token in text for token in tokens)
+
+    # 포스팅이 짧은 글자 조각부터 교집합
+    def _candidates(self, terms):
+        rows = []
+        for term in terms:
+            row = self.conn.execute('SELECT doc_count, data FROM postings WHERE term = ?', (term,)).fetchone()
+            if row is None:
+                return set()
+            rows.append(row)
+        rows.sort()
+        candidates = set(decode_ids(rows[0][1]))
+        for _, data in rows[1:]:
+            candidates.intersection_update(decode_ids(data))
+            if not candidates:
+                break
+        return candidates
+
+    # 후보가 적으면 번호로 바로 읽고, 많으면 필드 조건 순서대로 읽으면서 거른다.
+    def _rows(self, sql, params, candidates):
+        if candidates is None:
+            yield from self.conn.execute(sql, params)
+            return
+        if len(candidates) <= 900:   # SQLite 변수 개수 제한 안쪽
+            marks = ', '.join('?' * len(candidates))
+            clause = f' AND doc_id IN ({marks})' if ' WHERE ' in sql else f' WHERE doc_id IN ({marks})'
+            sql = sql.replace(' ORDER BY', clause + ' ORDER BY')
+            yield from self.conn.execute(sql, list(params) + sorted(candidates))
+            return
+        for row in self.conn.execute(sql, params):
+            if row[0] in candidates:
+                yield row
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM docs').fetchone()[0]
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,73 @@
+import hashlib
+import sqlite3
+from datetime import datetime
+from urllib.parse import urlsplit, parse_qs
+
+# ===== 이미 수집한 공지 인덱스 (SQLite) =====
+# 상세 URL 의 articleNo 를 키로 작성일/본문 해시/제목을 저장해 두고
+# 다음 실행에서는 새 공지나 바뀐 공지만 다시 가져온다.
+def article_no_from_url(url):
+    values = parse_qs(urlsplit(url).query).get('articleNo')
+    return values[0] if values else url
+
+def content_hash(date, content, doc_links, img_links):
+    digest = hashlib.sha256()
+    for part in [date, content, '\n'.join(doc_links), '\n'.join(img_links)]:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+class SeenIndex:
+    def __init__(self, path='kangwon_notices_index.sqlite3'):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS articles (
+                article_no   TEXT PRIMARY KEY,
+                title        TEXT,
+                posted_date  TEXT,
+                content_hash TEXT,
+                updated_at   TEXT
+            )
+        ''')
+        self.conn.commit()
+
+    def get(self, article_no):
+        return self.conn.execute(
+            'SELECT title, posted_date, content_hash FROM articles WHERE article_no = ?',
+            (article_no,)
+        ).fetchone()
+
+    # 리스트 페이지에서 본문을 다시 가져와야 하는 공지만 골라낸다.
+    # 처음 보는 공지이거나 목록 제목이 바뀐 공지가 대상.
+    def needs_fetch(self, notice):
+        row = self.get(article_no_from_url(notice['url']))
+        return row is None or row[0] != notice['title']
+
+    # 본문까지 받은 공지의 상태만 본다. 'new' / 'changed' / 'unchanged' 중 하나를 돌려준다.
+    def check(self, notice, date, content, doc_links, img_links):
+        row = self.get(article_no_from_url(notice['url']))
+        if row is None:
+            return 'new'
+        if row[2] != content_hash(date, content, doc_links, img_links) or row[0] != notice['title']:
+            return 'changed'
+        return 'unchanged'
+
+    # 저장. 결과 파일에 쓴 뒤에 부른다. (쓰기 전에 죽으면 다음 실행에서 다시 받도록)
+    def record(self, notice, date, content, doc_links, img_links):
+        status = self.check(notice, date, content, doc_links, img_links)
+        if status == 'unchanged':
+            return status
+        self.conn.execute(
+            'INSERT OR REPLACE INTO articles (article_no, title, posted_date, content_hash, updated_at) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (article_no_from_url(notice['url']), notice['title'], date,
+             content_hash(date, content, doc_links, img_links), datetime.now().isoformat(timespec='seconds'))
+        )
+        self.conn.commit()
+        return status
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+
+    def close(self):
+        self.conn.close()
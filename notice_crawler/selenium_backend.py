@@ -0,0 +1,138 @@
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from .notice_parser import base_url, list_url, clean_html_keep_table, classify_file_link
+from .driver_pool import wait_until_ready
+from .resilience import PageTimeout
+from . import metrics
+
+# ===== Selenium 백엔드 =====
+# HTTP 파싱이 실패한 페이지에서만 쓴다. 이 모듈을 불러올 때 selenium 도 같이 불러오므로
+# core 에서는 실제로 폴백이 필요할 때 import 한다.
+
+# ===== 공지 리스트 (Selenium) =====
+# 목록 표(board-table)가 뜨면 읽는다. 마지막 페이지 뒤는 표만 있고 일반 글 행이 없다 -> 빈 목록.
+# 표가 시간 안에 안 뜨면 PageTimeout. (빈 목록으로 돌려주면 게시판 끝으로 잘못 알고 멈춘다)
+LIST_READY_SELECTOR = 'table.board-table tbody'
+
+def scrape_notice_list(driver, offset, url=list_url):
+    with metrics.timer('selenium_get'):
+        driver.get(f"{url}?article.offset={offset}")
+    with metrics.timer('selenium_wait_list'):
+        if not wait_until_ready(driver, LIST_READY_SELECTOR):
+            metrics.inc('selenium_wait_timeouts', wait='list')
+            raise PageTimeout(f"목록이 뜨지 않음: offset {offset}")
+
+    notices = []
+    rows = driver.find_elements(By.CSS_SELECTOR, 'td.b-td-left.b-td-title')
+
+    for row in rows:
+        try:
+            title_box = row.find_element(By.CSS_SELECTOR, 'div.b-title-box')
+
+            if 'b-notice' in title_box.get_attribute('class'):
+                continue
+
+            link_tag = title_box.find_element(By.CSS_SELECTOR, 'a')
+            title = link_tag.text.strip()
+            href = link_tag.get_attribute('href')
+            detail_url = url + href[href.find('?'):]
+            date_tags = row.find_elements(By.CSS_SELECTOR, 'div.b-m-con span.b-date')
+            posted = date_tags[0].get_attribute('textContent').strip() if date_tags else None
+
+            notices.append({'title': title, 'url': detail_url, 'date': posted})
+        except Exception as e:
+            print("[!] 리스트 항목 파싱 실패:", e)
+            continue
+
+    return notices
+
+# ===== 목록 페이지 넘기기 (제너레이터) =====
+# 'article.offset' 주소로 페이지를 바로 열어서 공지를 사이트 순서대로 하나씩 내준다. (버튼 클릭/page_source 검사 없음)
+# - 고정 공지(b-notice)는 scrape_notice_list 에서 이미 빠진다 -> 페이지마다 다시 받지 않는다.
+# - 크롤링 중에 새 글이 올라와 뒤 페이지로 밀린 공지가 또 나오면 한 번만 내준다.
+# - 드라이버는 페이지 하나를 읽는 동안만 빌린다. 소비자가 같은 풀로 본문을 받는 동안 다음 목록을 읽을 수 있다.
+# - 목록이 안 뜬 페이지(PageTimeout)는 attempts 번까지 다시 열고, 그래도 안 되면 예외를 그대로 올린다.
+# max_pages 가 None 이면 빈 페이지(목록 표는 떴는데 일반 글이 없는 페이지)가 나올 때까지.
+# pacer: pacing.HostPacer (Crawler.pacer)
+def iter_notice_list(pool, start_offset=0, max_pages=None, url=list_url, articles_per_page=10, pacer=None,
+                     attempts=3):
+    seen = set()
+    offset = start_offset
+    page = 0
+    while max_pages is None or page < max_pages:
+        notices = _scrape_list_page(pool, offset, url, pacer, attempts)
+        if not notices:
+            return
+        for notice in notices:
+            if notice['url'] not in seen:
+                seen.add(notice['url'])
+                yield notice
+        offset += articles_per_page
+        page += 1
+
+def _scrape_list_page(pool, offset, url, pacer, attempts):
+    for attempt in range(1, attempts + 1):
+        try:
+            with pool.driver() as driver:
+                if pacer is None:
+                    return scrape_notice_list(driver, offset, url=url)
+                with pacer.request(url, measure=True):
+                    return scrape_notice_list(driver, offset, url=url)
+        except PageTimeout as e:
+            if attempt == attempts:
+                raise
+            metrics.inc('retries', stage='list')
+            print(f"[!] {e} -> 다시 시도 ({attempt}/{attempts})")
+
+# ===== 공지 본문 (Selenium) =====
+# HTTP 백엔드의 parse_notice_detail 과 같은 (작성일, 본문, 문서 링크, 이미지 링크) 를 돌려준다.
+# 페이지 로딩 + 본문 대기를 합쳐 timeout 초 안에 끝낸다. (예전에는 작성일 5s + 본문 selector 마다 10s 를 기다렸다)
+# 시간 안에 본문이 안 뜨면 PageTimeout -> 재시도/실패 목록으로 간다. '(본문 없음)' 을 데이터로 쓰지 않는다.
+def scrape_notice_detail(driver, url, timeout=10):
+    started = time.monotonic()
+    driver.set_page_load_timeout(timeout)
+    try:
+        with metrics.timer('selenium_get'):
+            driver.get(url)
+        with metrics.timer('selenium_wait_content'):
+            WebDriverWait(driver, max(0.5, timeout - (time.monotonic() - started))).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'div.b-content-box'))
+            )
+    except TimeoutException:
+        metrics.inc('selenium_wait_timeouts', wait='content')
+        raise PageTimeout(f"{timeout}s 안에 본문이 뜨지 않음: {url}")
+
+    # 본문이 떴으면 작성일도 같이 렌더링되어 있다. 여기서부터는 기다리지 않는다.
+    date_elements = driver.find_elements(By.CSS_SELECTOR, 'div.b-etc-box li.b-date-box span:nth-child(2)')
+    date_text = date_elements[0].text.strip() if date_elements else ""
+    if not date_text:
+        date_text = "(작성일 없음)"
+
+    content_text = ""
+    for selector in ['div.b-content-box div.fr-view', 'div.b-content-box']:
+        elements = driver.find_elements(By.CSS_SELECTOR, selector)
+        if not elements:
+            continue
+        content_text = clean_html_keep_table(elements[0].get_attribute('innerHTML'))
+        if content_text.strip():
+            break
+
+    if not content_text.strip():
+        content_text = "(본문 없음)"
+
+    # 첨부파일 링크를 읽다 실패하면 (페이지가 바뀌는 중 등) 링크가 빠진 채 저장하지 않고 다시 시도하게 둔다.
+    doc_links = []
+    img_links = []
+    for file in driver.find_elements(By.CSS_SELECTOR, 'div.b-file-box a.file-down-btn'):
+        file_href = file.get_attribute('href')
+        file_name = file.text.strip()
+        if file_href and file_name:
+            full_link = base_url + file_href if file_href.startswith('?') else file_href
+            classify_file_link(file_name, full_link, doc_links, img_links)
+
+    return date_text, content_text, doc_links, img_links
@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from stub_server import DEFAULT_SITE, start_stub_server
+
+# ===== 기록된 페이지를 돌려주는 로컬 서버 (benchmarks/stub_server) =====
+# -> (목록 URL, 사이트 디렉터리)
+@pytest.fixture(scope='session')
+def stub_site():
+    server, list_url = start_stub_server()
+    yield list_url, DEFAULT_SITE
+    server.shutdown()
@@ -0,0 +1,42 @@
+import os
+
+from notice_crawler.attachment_store import AttachmentStore, filename_from_disposition
+
+def attachment_url(list_url, article_no, attach_no):
+    return f"{list_url}?mode=download&articleNo={article_no}&attachNo={attach_no}"
+
+# ===== 첨부파일 저장소 =====
+# 스텁 서버는 attachNo 만 보고 내용을 만든다 -> 다른 공지의 같은 attachNo 는 같은 파일
+def test_same_content_is_stored_once(stub_site, tmp_path):
+    list_url, _ = stub_site
+    urls = [attachment_url(list_url, 800000, 1), attachment_url(list_url, 799997, 1),
+            attachment_url(list_url, 800000, 2)]
+    with AttachmentStore(str(tmp_path / 'attachments'), workers=1) as store:
+        paths = store.download_all(urls)
+        assert paths[urls[0]] == paths[urls[1]] != paths[urls[2]]
+        assert (store.downloaded, store.duplicates) == (2, 1)
+        with open(paths[urls[0]], 'rb') as f:
+            assert f.read() == b'ATTACH1'
+
+        assert store.download(urls[0]) == paths[urls[0]]     # 이미 받은 URL 은 다시 요청하지 않는다
+        assert store.skipped == 1
+
+def test_missing_object_is_downloaded_again(stub_site, tmp_path):
+    list_url, _ = stub_site
+    url = attachment_url(list_url, 800000, 1)
+    with AttachmentStore(str(tmp_path / 'attachments'), workers=1) as store:
+        os.remove(store.download(url))
+        assert store.lookup(url) is None
+        assert os.path.exists(store.download(url))
+        assert store.downloaded == 2
+
+def test_failed_download_returns_none(stub_site, tmp_path):
+    list_url, _ = stub_site
+    with AttachmentStore(str(tmp_path / 'attachments'), workers=1) as store:
+        assert store.download(list_url.replace('/padm/', '/missing/')) is None
+        assert store.failed == 1
+
+def test_filename_from_disposition():
+    assert filename_from_disposition("attachment; filename*=UTF-8''%EA%B3%B5%EC%A7%80.hwp") == '공지.hwp'
+    assert filename_from_disposition('attachment; filename="notice.pdf"') == 'notice.pdf'
+    assert filename_from_disposition(None) == ''
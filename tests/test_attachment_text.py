@@ -0,0 +1,62 @@
+import struct
+import zipfile
+
+from notice_crawler.attachment_text import (HWPTAG_PARA_TEXT, AttachmentTextExtractor, detect_format,
+                                            extract_text, hwp_section_text)
+
+# ===== HWP 5.0 본문 레코드 =====
+def hwp_record(tag, payload):
+    return struct.pack('<I', tag | (len(payload) << 20)) + payload
+
+def para_text(*parts):
+    data = b''
+    for part in parts:
+        data += part.encode('utf-16le') if isinstance(part, str) else struct.pack('<H', part)
+    return hwp_record(HWPTAG_PARA_TEXT, data)
+
+def test_hwp_section_text_reads_para_text_only():
+    # 탭/표 같은 인라인·확장 제어 문자는 8칸, 문단 끝(13)은 한 칸
+    tab, table = [9] + [0] * 6 + [9], [11] + [0] * 6 + [11]
+    section = (hwp_record(66, b'\x00' * 22)        # 문단 머리 (건너뜀)
+               + para_text('장학금', *tab, '신청', 13)
+               + para_text(*table, '마감 4월 30일', 13))
+    assert hwp_section_text(section) == '장학금\t신청\n마감 4월 30일\n'
+
+# ===== HWPX =====
+def write_hwpx(path, sections):
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('mimetype', 'application/hwp+zip')
+        for i, xml in enumerate(sections):
+            archive.writestr(f"Contents/section{i}.xml", xml)
+
+SECTION = ('<hs:sec xmlns:hs="s" xmlns:hp="p"><hp:p><hp:run><hp:t>국가장학금</hp:t><hp:t> 신청 &amp; 안내</hp:t>'
+           '</hp:run></hp:p><hp:p><hp:run><hp:t>기간: 4월</hp:t></hp:run></hp:p></hs:sec>')
+
+def test_hwpx_text_in_section_order(tmp_path):
+    path = str(tmp_path / 'notice.hwpx')
+    write_hwpx(path, [SECTION, '<hs:sec><hp:p><hp:t>둘째 구역</hp:t></hp:p></hs:sec>'])
+
+    assert detect_format(path) == 'hwpx'
+    assert extract_text(path) == '국가장학금 신청 & 안내\n기간: 4월\n둘째 구역'
+
+def test_unknown_format_has_no_text(tmp_path):
+    path = tmp_path / 'photo.jpg'
+    path.write_bytes(b'\xff\xd8\xff\xe0' + b'\0' * 16)
+    assert detect_format(str(path)) is None
+    assert extract_text(str(path)) is None
+
+# ===== 추출 캐시 =====
+def test_extractor_caches_by_content_hash(tmp_path):
+    first, copy = str(tmp_path / 'a.hwpx'), str(tmp_path / 'b.hwpx')
+    write_hwpx(first, [SECTION])
+    write_hwpx(copy, [SECTION])
+
+    cache_path = str(tmp_path / 'text.sqlite3')
+    with AttachmentTextExtractor(cache_path, workers=1) as extractor:
+        texts = extractor.texts([first, copy])
+        assert texts[first] == texts[copy]
+        assert extractor.extracted == 1           # 내용이 같으면 한 번만 추출
+
+    with AttachmentTextExtractor(cache_path, workers=1) as extractor:
+        assert extractor.text_for([first]).startswith('국가장학금')
+        assert (extractor.hits, extractor.extracted) == (1, 0)
@@ -0,0 +1,38 @@
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from notice_crawler.columnar import iter_columnar_records, notice_months, read_columnar, write_columnar
+
+def record(title, posted, doc_links=''):
+    return {'제목': title, '작성일': posted, '카테고리': '장학', '본문': f"{title} 본문",
+            '문서파일 링크': doc_links, '이미지파일 링크': ''}
+
+RECORDS = [
+    record('4월 공지', '2025.04.28', 'http://stub/a.hwp, http://stub/b.pdf'),
+    record('3월 공지', '2025.03.02'),
+    record('4월 첫 공지', '2025.04.01'),
+    record('날짜 없는 공지', ''),
+]
+
+# ===== Parquet / Arrow 저장 =====
+@pytest.mark.parametrize('suffix', ['parquet', 'arrow'])
+def test_round_trip(tmp_path, suffix):
+    path = str(tmp_path / f"notices.{suffix}")
+    assert write_columnar(RECORDS, path) == 4
+
+    by_title = {r['제목']: r for r in iter_columnar_records(path)}
+    assert sorted(by_title) == sorted(r['제목'] for r in RECORDS)
+    for original in RECORDS:
+        assert by_title[original['제목']] == original
+
+@pytest.mark.parametrize('suffix', ['parquet', 'arrow'])
+def test_month_pruning_reads_only_that_month(tmp_path, suffix):
+    path = str(tmp_path / f"notices.{suffix}")
+    write_columnar(RECORDS, path)
+
+    assert notice_months(path) == {'2025-03': 1, '2025-04': 2, 'unknown': 1}
+    april = read_columnar(path, months='2025-04', columns=['title'])
+    assert april.column_names == ['title']
+    assert april.column('title').to_pylist() == ['4월 첫 공지', '4월 공지']   # 달 안에서는 작성일 순
+    assert [r['제목'] for r in iter_columnar_records(path, months=['2025-03'])] == ['3월 공지']
@@ -0,0 +1,37 @@
+from notice_crawler import crawl_latest as latest
+from notice_crawler.core import Crawler, CrawlerConfig
+
+class FakeDriver:
+    def find_elements(self, by, selector):
+        return []
+
+class FakePool:
+    def map(self, fn, items):
+        for item in items:
+            yield fn(FakeDriver(), item)
+
+    def close(self):
+        pass
+
+def test_crawl_latest_extracts_each_listed_notice(monkeypatch, capsys):
+    notices = [{'title': '창업 공모전 개최', 'url': 'http://stub/list?mode=view&articleNo=2'},
+               {'title': '본문 실패', 'url': 'http://stub/list?mode=view&articleNo=1'}]
+
+    def iter_notice_list(pool, max_pages=None, url=None, articles_per_page=10, pacer=None):
+        assert max_pages == 2 and pacer is not None
+        yield from notices
+
+    def scrape_notice_detail(driver, url, timeout=10):
+        if url.endswith('=1'):
+            raise TimeoutError(url)
+        return '2025.04.28', '접수기간: 5월 1일 ~ 5월 15일', [], []
+
+    monkeypatch.setattr(latest, 'iter_notice_list', iter_notice_list)
+    monkeypatch.setattr(latest, 'scrape_notice_detail', scrape_notice_detail)
+    crawler = Crawler(CrawlerConfig(list_url='http://stub/list', metrics_log_path=None))
+    crawler._resources['driver_pool'] = FakePool()
+
+    assert latest.crawl_latest(crawler, max_pages=2) == 1
+    out = capsys.readouterr().out
+    assert '🔹 [1] 창업 공모전 개최' in out
+    assert '[!] [2] 크롤링 실패' in out
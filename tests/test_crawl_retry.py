@@ -0,0 +1,41 @@
+import threading
+
+from notice_crawler import crawl_retry
+from notice_crawler.crawl_retry import retry_dead_letters
+from notice_crawler.dead_letters import DeadLetterQueue
+
+from test_crawler import make_crawler
+
+# ===== Ctrl-C =====
+# 줄 서 있는 공지를 다 받을 때까지 기다리지 않고, 받지 못한 공지는 실패 목록에 남는다
+def test_interrupt_cancels_queued_retries(stub_site, tmp_path, monkeypatch):
+    list_url, _ = stub_site
+    monkeypatch.chdir(tmp_path)
+    dead_letter_path = str(tmp_path / 'failed.sqlite3')
+    dead_letters = DeadLetterQueue(dead_letter_path)
+    for no in range(799990, 800000):
+        dead_letters.add({'title': f"공지 {no}", 'url': f"{list_url}?mode=view&articleNo={no}"},
+                         ConnectionError("boom"))
+    dead_letters.close()
+
+    crawler = make_crawler(list_url, tmp_path, detail_workers=1, dead_letter_path=dead_letter_path,
+                           index_path=str(tmp_path / 'index.sqlite3'))
+    started = []
+    release = threading.Event()
+
+    def slow_fetch_detail(url):
+        started.append(url)
+        release.wait(5)
+        raise ConnectionError("still down")
+    crawler.fetch_detail = slow_fetch_detail
+
+    def interrupt(futures, return_when):
+        release.set()
+        raise KeyboardInterrupt
+    monkeypatch.setattr(crawl_retry, 'wait', interrupt)
+
+    assert retry_dead_letters(crawler) == 0
+    assert len(started) == 1
+    dead_letters = DeadLetterQueue(dead_letter_path)
+    assert len(dead_letters) == 10
+    dead_letters.close()
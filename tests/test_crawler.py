@@ -0,0 +1,64 @@
+import sqlite3
+
+import pytest
+
+from notice_crawler.core import Crawler, CrawlerConfig
+from notice_crawler.crawl_full import crawl_full
+from notice_crawler.http_cache import CacheMiss
+from notice_crawler.seen_index import article_no_from_url
+
+def make_crawler(list_url, tmp_path, **overrides):
+    crawler = Crawler(CrawlerConfig(list_url=list_url, cache_dir=str(tmp_path / 'cache'),
+                                    metrics_log_path=None, **overrides))
+
+    def no_selenium(offset=0, url=None):
+        raise AssertionError("Selenium 으로 가면 안 된다")
+    crawler.fetch_list_selenium = no_selenium
+    return crawler
+
+# ===== 목록 =====
+def test_empty_list_page_is_end_of_board(stub_site, tmp_path):
+    list_url, _ = stub_site
+    crawler = make_crawler(list_url, tmp_path)
+    assert crawler.fetch_list(60) == []
+    assert len(crawler.fetch_list(0)) == 10
+    crawler.close()
+
+def test_replay_never_falls_back_to_selenium(stub_site, tmp_path):
+    list_url, _ = stub_site
+    crawler = make_crawler(list_url, tmp_path)
+    crawler.fetch_list(60)
+    crawler.close()
+
+    replay = make_crawler(list_url, tmp_path, cache_mode='replay')
+    assert replay.fetch_list(60) == []            # 캐시에 있는 빈 목록
+    with pytest.raises(CacheMiss):
+        replay.fetch_list(10)                     # 캐시에 없으면 네트워크/Selenium 없이 실패
+    replay.close()
+
+# ===== 증분 크롤링 =====
+def incremental_crawler(list_url, tmp_path):
+    return make_crawler(list_url, tmp_path, incremental=True, index_path=str(tmp_path / 'index.sqlite3'),
+                        start_interval=0, min_interval=0, max_requests_per_second=None)
+
+def test_incremental_stops_at_first_seen_page(stub_site, tmp_path, monkeypatch):
+    list_url, _ = stub_site
+    monkeypatch.chdir(tmp_path)
+    assert crawl_full(incremental_crawler(list_url, tmp_path)) == 60
+    assert crawl_full(incremental_crawler(list_url, tmp_path)) == 0
+
+    # 두 번째 페이지의 공지 하나를 인덱스에서 지우면 그 공지만 다시 받고, 다음 페이지에서 멈춘다
+    with sqlite3.connect(str(tmp_path / 'index.sqlite3')) as conn:
+        conn.execute("DELETE FROM articles WHERE article_no = '799985'")
+
+    crawler = incremental_crawler(list_url, tmp_path)
+    fetched = []
+    fetch_detail = crawler.fetch_detail
+
+    def counting_fetch_detail(url):
+        fetched.append(url)
+        return fetch_detail(url)
+    crawler.fetch_detail = counting_fetch_detail
+
+    assert crawl_full(crawler) == 1
+    assert [article_no_from_url(url) for url in fetched] == ['799985']
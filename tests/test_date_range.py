@@ -0,0 +1,39 @@
+from datetime import date
+
+import pytest
+
+from notice_crawler.date_range import ListDateUnavailable, ListPageCache, find_offset_range
+
+# 스텁 사이트: 60개, 작성일은 2025-04-28 부터 이틀에 하루씩 (한 페이지 = 5일)
+@pytest.fixture
+def pages(stub_site, tmp_path):
+    from test_crawler import make_crawler
+    list_url, _ = stub_site
+    crawler = make_crawler(list_url, tmp_path, start_interval=0, min_interval=0, max_requests_per_second=None)
+    yield ListPageCache(crawler.search_list)
+    crawler.close()
+
+def test_range_inside_one_page(pages):
+    assert find_offset_range(pages, date(2025, 4, 20), date(2025, 4, 22), 60) == range(10, 20, 10)
+
+def test_range_across_pages(pages):
+    assert list(find_offset_range(pages, '2025.04.05', '2025.04.24', 60)) == [0, 10, 20, 30, 40]
+    assert pages.requests < 6                     # 여섯 페이지를 다 받지 않고 찾는다
+
+def test_range_outside_board(pages):
+    assert len(find_offset_range(pages, date(2025, 5, 1), date(2025, 5, 3), 60)) == 0
+    assert len(find_offset_range(pages, date(2025, 1, 1), date(2025, 1, 3), 60)) == 0
+
+def test_swapped_bounds(pages):
+    assert find_offset_range(pages, date(2025, 4, 22), date(2025, 4, 20), 60) == range(10, 20, 10)
+
+def test_unreadable_dates_raise():
+    pages = ListPageCache(lambda offset: [{'title': '공지', 'date': ''}])
+    with pytest.raises(ListDateUnavailable):
+        find_offset_range(pages, date(2025, 4, 1), date(2025, 4, 2), 60)
+
+def test_failed_fetch_raises():
+    def fetch_list(offset):
+        raise OSError("연결 끊김")
+    with pytest.raises(ListDateUnavailable):
+        find_offset_range(ListPageCache(fetch_list), date(2025, 4, 1), date(2025, 4, 2), 60)
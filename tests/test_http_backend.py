@@ -0,0 +1,51 @@
+import os
+
+from notice_crawler.notice_http import create_session, fetch_notice_list, fetch_notice_detail
+from notice_crawler.notice_parser import clean_html_keep_table
+
+BODIES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'corpus', 'bodies')
+
+def read_body(name):
+    with open(os.path.join(BODIES, name), encoding='utf-8') as f:
+        return clean_html_keep_table(f.read())
+
+# ===== 목록 =====
+def test_fetch_notice_list_skips_pinned_notice(stub_site):
+    list_url, _ = stub_site
+    notices = fetch_notice_list(create_session(), 0, url=list_url)
+
+    assert len(notices) == 10
+    assert [notice['url'].split('articleNo=')[1].split('&')[0] for notice in notices] == \
+        [str(no) for no in range(800000, 799990, -1)]
+    assert notices[0]['title'].startswith('2025학년도 1학기 비교과 프로그램 특강 참가자 모집')
+    assert notices[0]['date'] == '25.04.28'
+    assert notices[0]['url'].startswith(list_url + '?mode=view&articleNo=800000')
+
+def test_fetch_notice_list_past_last_page_is_empty(stub_site):
+    list_url, _ = stub_site
+    assert fetch_notice_list(create_session(), 60, url=list_url) == []
+
+# ===== 본문 =====
+def test_fetch_notice_detail_with_attachments(stub_site):
+    list_url, _ = stub_site
+    url = f"{list_url}?mode=view&articleNo=800000&article.offset=0&articleLimit=10"
+    date, content, doc_links, img_links = fetch_notice_detail(create_session(), url)
+
+    assert date == '2025.04.28'
+    assert content == read_body('001_program_notice.html')
+    assert doc_links == [f"{list_url}?mode=download&articleNo=800000&attachNo=1",
+                         f"{list_url}?mode=download&articleNo=800000&attachNo=2"]
+    assert img_links == [f"{list_url}?mode=download&articleNo=800000&attachNo=3"]
+
+def test_fetch_notice_detail_without_attachments(stub_site):
+    list_url, _ = stub_site
+    url = f"{list_url}?mode=view&articleNo=799999&article.offset=0&articleLimit=10"
+    date, content, doc_links, img_links = fetch_notice_detail(create_session(), url)
+
+    assert date == '2025.04.28'
+    assert content == read_body('002_overseas_table.html')
+    assert doc_links == [] and img_links == []
+
+def test_fetch_notice_detail_missing_page_returns_none(stub_site):
+    list_url, _ = stub_site
+    assert fetch_notice_detail(create_session(), f"{list_url}?mode=view&articleNo=1") is None
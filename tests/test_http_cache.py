@@ -0,0 +1,75 @@
+import pytest
+
+from notice_crawler.http_cache import CacheMiss, ResponseCache
+
+class FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = 'utf-8'
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise AssertionError(f"HTTP {self.status_code}")
+
+# 받은 요청 헤더를 남기고, ETag 가 맞으면 304 를 돌려주는 세션
+class FakeSession:
+    def __init__(self, body=b'<html>v1</html>', etag='"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        if headers and headers.get('If-None-Match') == self.etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.body, {'ETag': self.etag})
+
+URL = 'http://stub/list?mode=view&articleNo=1'
+
+def test_fresh_entry_is_served_without_request(tmp_path):
+    session = FakeSession()
+    cache = ResponseCache(str(tmp_path), ttl=3600)
+    assert cache.get(session, URL) == '<html>v1</html>'
+    assert cache.get(session, URL) == '<html>v1</html>'
+
+    assert len(session.requests) == 1
+    assert (cache.misses, cache.hits) == (1, 1)
+    cache.close()
+
+def test_expired_entry_is_revalidated(tmp_path):
+    session = FakeSession()
+    cache = ResponseCache(str(tmp_path), ttl=0)
+    cache.get(session, URL)
+    assert cache.get(session, URL) == '<html>v1</html>'       # 304 -> 저장된 본문
+
+    assert session.requests[1] == {'If-None-Match': '"v1"'}
+    assert cache.revalidated == 1
+
+    session.body, session.etag = b'<html>v2</html>', '"v2"'
+    assert cache.get(session, URL) == '<html>v2</html>'       # 바뀌면 새 본문으로 교체
+    assert cache.get(session, URL) == '<html>v2</html>'
+    assert cache.revalidated == 2
+    cache.close()
+
+def test_ttl_func_overrides_ttl_per_url(tmp_path):
+    session = FakeSession()
+    cache = ResponseCache(str(tmp_path), ttl=3600, ttl_func=lambda url, ttl: 0 if 'mode=view' in url else ttl)
+    cache.get(session, URL)
+    cache.get(session, URL)
+    assert len(session.requests) == 2
+    cache.close()
+
+def test_replay_never_touches_network(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=0)
+    cache.get(FakeSession(), URL)
+    cache.close()
+
+    replay = ResponseCache(str(tmp_path), ttl=0, replay_only=True)
+    session = FakeSession()
+    assert replay.get(session, URL) == '<html>v1</html>'      # 만료되었어도 그대로
+    with pytest.raises(CacheMiss):
+        replay.get(session, URL + '0')
+    assert session.requests == []
+    replay.close()
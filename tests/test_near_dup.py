@@ -0,0 +1,36 @@
+from notice_crawler.near_dup import NearDuplicateIndex
+
+BODY = ("2025학년도 1학기 국가장학금 2차 신청 안내입니다. 신청 기간은 4월 1일부터 4월 30일까지이며 "
+        "한국장학재단 누리집에서 신청할 수 있습니다. 재학생은 반드시 기간 안에 서류를 제출하시기 바랍니다.")
+OTHER = ("공과대학 학술대회 참가자를 모집합니다. 발표를 원하는 대학원생은 초록을 5월 10일까지 "
+         "학과 사무실로 보내 주시고, 자세한 일정은 첨부한 안내문을 참고하시기 바랍니다. 많은 참여 바랍니다.")
+
+# ===== MinHash 중복 찾기 =====
+def test_reposted_notice_matches_original(tmp_path):
+    with NearDuplicateIndex(str(tmp_path / 'minhash.sqlite3'), threshold=0.8) as index:
+        assert index.check('1', BODY, '국가장학금 신청 안내') is None
+        assert index.check('2', OTHER, '학술대회 참가자 모집') is None
+
+        match = index.check('3', BODY.replace('바랍니다.', '바랍니다!'), '[재공지] 국가장학금 신청 안내')
+        assert match.key == '1'
+        assert match.similarity >= 0.8
+        assert len(index) == 2                    # 중복은 색인에 넣지 않는다
+
+def test_same_notice_again_is_not_its_own_duplicate(tmp_path):
+    with NearDuplicateIndex(str(tmp_path / 'minhash.sqlite3')) as index:
+        index.check('1', BODY)
+        assert index.check('1', BODY) is None
+        assert len(index) == 1
+
+def test_short_bodies_are_ignored(tmp_path):
+    with NearDuplicateIndex(str(tmp_path / 'minhash.sqlite3')) as index:
+        assert index.check('1', '(본문 없음)') is None
+        assert index.check('2', '(본문 없음)') is None
+        assert len(index) == 0
+
+def test_signatures_survive_reopen_with_other_threshold(tmp_path):
+    path = str(tmp_path / 'minhash.sqlite3')
+    with NearDuplicateIndex(path, threshold=0.8) as index:
+        index.check('1', BODY)
+    with NearDuplicateIndex(path, threshold=0.5) as index:   # 밴드만 다시 만든다
+        assert [match.key for match in index.query(BODY)] == ['1']
@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+from notice_crawler.notice_pipeline import crawl_pipeline
+
+def notice(offset, i):
+    return {'title': f"공지 {offset}-{i}", 'url': f"http://stub/list?mode=view&articleNo={offset * 10 + i}"}
+
+def fetch_list(offset):
+    if offset == 10:
+        raise ConnectionError("boom")
+    return [notice(offset, i) for i in range(2)]
+
+def test_failed_list_page_is_reported_and_marked_done():
+    saved, done, failed = [], [], []
+    asyncio.run(crawl_pipeline(
+        range(0, 30, 10), None,
+        on_notice=lambda offset, idx, n, result: saved.append(n['url']),
+        requests_per_second=1000, url='http://stub/list',
+        fetch_list=fetch_list, fetch_detail=lambda url: ('2025.04.28', '본문', [], []),
+        on_page_done=done.append,
+        on_list_failed=lambda offset, error: failed.append((offset, str(error))),
+    ))
+
+    assert failed == [(10, 'boom')]
+    assert sorted(done) == [0, 10, 20]
+    assert len(saved) == 4
+
+# 기본 limiter (HostPacer) 는 requests_per_second 를 넘지 않는다: 요청 9개, 버킷 5개 -> 나머지 4개는 초당 5개
+def test_default_limiter_caps_requests_per_second():
+    start = time.monotonic()
+    asyncio.run(crawl_pipeline(
+        range(0, 30, 10), None,
+        on_notice=lambda offset, idx, n, result: None,
+        requests_per_second=5, url='http://stub/list',
+        fetch_list=lambda offset: [notice(offset, i) for i in range(2)],
+        fetch_detail=lambda url: ('2025.04.28', '본문', [], []),
+    ))
+    assert time.monotonic() - start >= 0.7
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from notice_crawler.near_dup import DUPLICATE_FIELD
+from notice_crawler.notice_sink import NOTICE_FIELDS, Checkpoint, NoticeSink, read_records
+
+def record(title):
+    return {'제목': title, '작성일': '2025.04.28', '본문': '본문', '문서파일 링크': '', '이미지파일 링크': ''}
+
+# ===== NoticeSink =====
+def test_append_keeps_header_and_rows(tmp_path):
+    path = str(tmp_path / 'out.csv')
+    with NoticeSink(path) as sink:
+        sink.write(record('첫 공지'))
+    with NoticeSink(path, append=True) as sink:
+        sink.write(record('둘째 공지'))
+
+    assert [row['제목'] for row in read_records(path)] == ['첫 공지', '둘째 공지']
+
+def test_append_refuses_different_header(tmp_path):
+    path = str(tmp_path / 'out.csv')
+    with NoticeSink(path) as sink:
+        sink.write(record('첫 공지'))
+
+    with pytest.raises(ValueError):
+        NoticeSink(path, append=True, fieldnames=NOTICE_FIELDS + [DUPLICATE_FIELD])
+
+# ===== Checkpoint =====
+def test_checkpoint_advances_only_over_contiguous_pages(tmp_path):
+    path = str(tmp_path / 'checkpoint.json')
+    checkpoint = Checkpoint(path, step=10)
+    checkpoint.mark_done(10)                      # 0 이 아직 안 끝남
+    assert checkpoint.next_offset == 0
+    assert not os.path.exists(path)
+
+    checkpoint.mark_done(0)
+    assert checkpoint.next_offset == 20           # 0, 10 이 이어져서 한 번에 넘어간다
+    checkpoint.mark_done(30)
+    assert checkpoint.next_offset == 20
+
+    resumed = Checkpoint(path, step=10)
+    assert resumed.resumed
+    assert resumed.next_offset == 20              # 30 은 20 이 끝나기 전이라 다시 받는다
+
+def test_checkpoint_clear_starts_over(tmp_path):
+    path = str(tmp_path / 'checkpoint.json')
+    checkpoint = Checkpoint(path, step=10)
+    checkpoint.mark_done(0)
+    checkpoint.clear()
+
+    fresh = Checkpoint(path, step=10)
+    assert not fresh.resumed
+    assert fresh.next_offset == 0
@@ -0,0 +1,31 @@
+import time
+
+from notice_crawler.pacing import HostPacer, RateBucket
+
+def test_rate_bucket_allows_burst_then_waits():
+    bucket = RateBucket(rate=10, burst=2)
+    assert bucket.try_take() == 0
+    assert bucket.try_take() == 0
+    wait = bucket.try_take()
+    assert 0 < wait <= 0.1
+    assert bucket.taken == 2
+
+# 호스트별 pacer 는 따로 있어도 초당 요청 수는 버킷 하나가 막는다.
+def test_host_pacer_shares_one_bucket_across_hosts():
+    pacer = HostPacer(max_rate=20, max_burst=1, start_delay=0.0, min_delay=0.0, jitter=0.0,
+                      max_concurrency=10, start_concurrency=10)
+    urls = ['http://a.example/list', 'http://b.example/list', 'http://c.example/list']
+    assert pacer.for_url(urls[0]).bucket is pacer.for_url(urls[1]).bucket is pacer.bucket
+
+    start = time.monotonic()
+    for i in range(9):
+        with pacer.request(urls[i % 3]):
+            pass
+    # 버킷이 없으면 바로 끝난다. 20/s 면 첫 요청 뒤 8번은 0.05s 씩 기다린다.
+    assert time.monotonic() - start >= 0.35
+    assert pacer.bucket.taken == 9
+
+def test_host_pacer_without_max_rate_has_no_bucket():
+    pacer = HostPacer(start_delay=0.0, min_delay=0.0)
+    assert pacer.bucket is None
+    assert pacer.for_url('http://a.example/').bucket is None
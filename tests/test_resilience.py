@@ -0,0 +1,74 @@
+from contextlib import contextmanager
+
+import pytest
+import requests
+
+from notice_crawler import resilience
+from notice_crawler.resilience import PermanentFetchError, RetryPolicy
+
+# 재시도 사이 백오프 동안에는 요청 슬롯을 쥐고 있지 않고, 시도마다 슬롯을 새로 잡는다.
+def test_call_holds_slot_only_while_attempting(monkeypatch):
+    events = []
+    holding = []
+
+    @contextmanager
+    def slot(url):
+        events.append('acquire')
+        holding.append(url)
+        try:
+            yield
+        finally:
+            holding.pop()
+            events.append('release')
+
+    def sleep(seconds):
+        assert not holding
+        events.append('sleep')
+
+    monkeypatch.setattr(resilience.time, 'sleep', sleep)
+    calls = []
+
+    def fetch(url, timeout):
+        assert holding == [url]
+        calls.append(url)
+        if len(calls) < 3:
+            raise requests.ConnectionError("boom")
+        return 'ok'
+
+    policy = RetryPolicy(attempts=3, deadline=60.0, base_delay=0.01)
+    assert policy.call('http://stub/list?mode=view&articleNo=1', fetch, slot=slot) == 'ok'
+    assert events == ['acquire', 'release', 'sleep', 'acquire', 'release', 'sleep', 'acquire', 'release']
+
+# 슬롯을 잡다가 실패해도 (deadline 을 정하기 전) 재시도한다
+def test_call_retries_when_slot_fails(monkeypatch):
+    monkeypatch.setattr(resilience.time, 'sleep', lambda seconds: None)
+    failures = []
+
+    @contextmanager
+    def slot(url):
+        if not failures:
+            failures.append(url)
+            raise requests.ConnectionError("slot")
+        yield
+
+    policy = RetryPolicy(attempts=3, deadline=60.0, base_delay=0.01)
+    assert policy.call('http://stub/list', lambda url, timeout: 'ok', slot=slot) == 'ok'
+    assert failures == ['http://stub/list']
+
+# 404 같은 재시도 안 하는 오류는 차단기의 연속 실패 수를 초기화하지 않는다
+def test_non_retryable_error_is_not_a_success(monkeypatch):
+    monkeypatch.setattr(resilience.time, 'sleep', lambda seconds: None)
+    policy = RetryPolicy(attempts=1, deadline=60.0, base_delay=0.01)
+    url = 'http://stub/list?mode=view&articleNo=1'
+
+    def unavailable(url, timeout):
+        raise requests.ConnectionError("down")
+
+    def missing(url, timeout):
+        raise PermanentFetchError("없는 공지")
+
+    with pytest.raises(requests.ConnectionError):
+        policy.call(url, unavailable)
+    with pytest.raises(PermanentFetchError):
+        policy.call(url, missing)
+    assert policy.breaker_for(url).failures == 1
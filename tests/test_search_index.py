@@ -0,0 +1,50 @@
+from notice_crawler.search_index import SearchIndex, decode_ids
+
+def notice(no, title):
+    return {'title': title, 'url': f"http://stub/list?mode=view&articleNo={no}"}
+
+def postings_size(index):
+    index.flush()
+    return sum(len(decode_ids(data)) for (data,) in index.conn.execute('SELECT data FROM postings'))
+
+# ===== 같은 공지 다시 넣기 =====
+def test_unchanged_notice_is_not_rewritten(tmp_path):
+    with SearchIndex(str(tmp_path / 'search.sqlite3')) as index:
+        first = index.add_notice(notice(1, '장학금 신청 안내'), '2025.04.28', '교내 장학금을 신청하세요.')
+        size = postings_size(index)
+        again = index.add_notice(notice(1, '장학금 신청 안내'), '2025.04.28', '교내 장학금을 신청하세요.')
+
+        assert again == first
+        assert postings_size(index) == size
+        assert index.added == 1
+
+def test_changed_notice_replaces_old_doc(tmp_path):
+    with SearchIndex(str(tmp_path / 'search.sqlite3')) as index:
+        first = index.add_notice(notice(1, '장학금 신청 안내'), '2025.04.28', '교내 장학금을 신청하세요.')
+        second = index.add_notice(notice(1, '장학금 신청 안내'), '2025.04.28', '마감이 연장되었습니다.')
+
+        assert second != first
+        assert len(index) == 1
+        assert [r['doc_id'] for r in index.search('연장')] == [second]
+        assert index.search('교내') == []
+
+def test_csv_record_uses_same_key_as_crawl(tmp_path):
+    with SearchIndex(str(tmp_path / 'search.sqlite3')) as index:
+        index.add_notice(notice(1, '장학금 신청 안내'), '2025.04.28', '교내 장학금을 신청하세요.')
+        index.add_record({'제목': '장학금 신청 안내', '작성일': '2025.04.28', '본문': '교내 장학금을 신청하세요.'})
+
+        assert len(index) == 1
+        assert index.added == 1
+
+# ===== 검색 결과 순서 / 조건 =====
+def test_search_orders_by_posted_date_and_matches_all_terms(tmp_path):
+    with SearchIndex(str(tmp_path / 'search.sqlite3')) as index:
+        old = index.add_notice(notice(1, '장학금 신청 안내'), '2025.03.02', '국가장학금 2차 신청을 받습니다.')
+        new = index.add_notice(notice(2, '교내 장학금 안내'), '2025.04.28', '교내 장학금 신청 기간입니다.')
+        index.add_notice(notice(3, '학술대회 안내'), '2025.04.10', '학술대회 참가 신청을 받습니다.')
+        undated = index.add_notice(notice(4, '장학금 서류'), '', '장학금 신청 서류 양식입니다.')
+
+        assert [r['doc_id'] for r in index.search('장학금 신청')] == [new, old, undated]
+        assert [r['doc_id'] for r in index.search('국가장학금')] == [old]
+        assert [r['doc_id'] for r in index.search('장학금', posted_from='2025-04-01')] == [new]
+        assert [r['doc_id'] for r in index.search('장학금', limit=1)] == [new]
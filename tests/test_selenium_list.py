@@ -0,0 +1,99 @@
+from contextlib import contextmanager
+
+import pytest
+
+from notice_crawler import selenium_backend
+from notice_crawler.resilience import PageTimeout
+
+# ===== 가짜 드라이버 풀 / 목록 =====
+class FakePool:
+    def __init__(self):
+        self.borrowed = 0
+
+    @contextmanager
+    def driver(self):
+        self.borrowed += 1
+        yield object()
+
+def notice(no):
+    return {'title': f"공지 {no}", 'url': f"http://stub/list?mode=view&articleNo={no}", 'date': '25.04.28'}
+
+# offset -> 목록. 값이 PageTimeout 이면 그 횟수만큼 먼저 시간 초과가 난다.
+def fake_pages(monkeypatch, pages, timeouts=None):
+    timeouts = dict(timeouts or {})
+    requested = []
+
+    def scrape(driver, offset, url=None):
+        requested.append(offset)
+        if timeouts.get(offset):
+            timeouts[offset] -= 1
+            raise PageTimeout(f"목록이 뜨지 않음: offset {offset}")
+        return list(pages.get(offset, []))
+
+    monkeypatch.setattr(selenium_backend, 'scrape_notice_list', scrape)
+    return requested
+
+# ===== iter_notice_list =====
+def test_iter_notice_list_yields_pages_in_order_until_empty_page(monkeypatch):
+    requested = fake_pages(monkeypatch, {
+        0: [notice(30), notice(29)],
+        10: [notice(29), notice(28)],     # 새 글이 올라와 뒤로 밀린 공지는 한 번만
+        20: [notice(27)],
+    })
+    urls = [n['url'] for n in selenium_backend.iter_notice_list(FakePool(), url='http://stub/list')]
+
+    assert urls == [notice(no)['url'] for no in (30, 29, 28, 27)]
+    assert requested == [0, 10, 20, 30]
+
+def test_iter_notice_list_is_lazy(monkeypatch):
+    requested = fake_pages(monkeypatch, {0: [notice(30)], 10: [notice(29)]})
+    notices = selenium_backend.iter_notice_list(FakePool())
+
+    assert requested == []
+    assert next(notices)['url'] == notice(30)['url']
+    assert requested == [0]
+
+def test_iter_notice_list_respects_start_offset_and_max_pages(monkeypatch):
+    requested = fake_pages(monkeypatch, {10: [notice(29)], 20: [notice(28)], 30: [notice(27)]})
+    notices = list(selenium_backend.iter_notice_list(FakePool(), start_offset=10, max_pages=2))
+
+    assert [n['url'] for n in notices] == [notice(29)['url'], notice(28)['url']]
+    assert requested == [10, 20]
+
+def test_iter_notice_list_retries_timed_out_page(monkeypatch):
+    requested = fake_pages(monkeypatch, {0: [notice(30)], 10: [notice(29)]}, timeouts={10: 2})
+    notices = list(selenium_backend.iter_notice_list(FakePool(), attempts=3))
+
+    assert [n['url'] for n in notices] == [notice(30)['url'], notice(29)['url']]
+    assert requested == [0, 10, 10, 10, 20]
+
+def test_iter_notice_list_timeout_is_not_end_of_board(monkeypatch):
+    fake_pages(monkeypatch, {0: [notice(30)], 10: [notice(29)]}, timeouts={10: 5})
+    notices = selenium_backend.iter_notice_list(FakePool(), attempts=2)
+
+    assert next(notices)['url'] == notice(30)['url']
+    with pytest.raises(PageTimeout):
+        next(notices)
+
+# ===== scrape_notice_list =====
+class FakeDriver:
+    def __init__(self):
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def find_elements(self, by, selector):
+        return []
+
+def test_scrape_notice_list_raises_when_list_does_not_load(monkeypatch):
+    monkeypatch.setattr(selenium_backend, 'wait_until_ready', lambda driver, selector: False)
+    with pytest.raises(PageTimeout):
+        selenium_backend.scrape_notice_list(FakeDriver(), 20, url='http://stub/list')
+
+def test_scrape_notice_list_loaded_page_without_rows_is_empty(monkeypatch):
+    monkeypatch.setattr(selenium_backend, 'wait_until_ready', lambda driver, selector: True)
+    driver = FakeDriver()
+
+    assert selenium_backend.scrape_notice_list(driver, 60, url='http://stub/list') == []
+    assert driver.visited == ['http://stub/list?article.offset=60']